@@ -7,6 +7,15 @@ MAX_LENGTH = 0
 USERNAME_INPUTTING = "Username: "
 PASSWORD_INPUTTING = "Password: "
 VALID_PASSWORD = r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[^\w\s]).{8,}$"
+BCRYPT_ROUNDS = 12
+SAVE_FORMAT = "json"
+OFFLINE_TICK_HOURS = 1  # real hours per time_past() tick while logged out (one game hour per hour); 0 disables offline ageing
+OFFLINE_MAX_TICKS = 24  # most offline ticks applied per login, so a long absence costs at most one game day
+SUDOKU_CELLS_REMOVED = {1: 35, 2: 45, 3: 55, 4: 65}  # difficulty -> cells removed (an upper bound, see sudokuEngine)
+SUDOKU_BANK_LOW_WATER = 3  # banked puzzles per difficulty below which a background refill starts
+SUDOKU_BANK_TARGET = 10  # puzzles per difficulty a background refill tops up to
+TICTACTOE_PET_SEARCH = {"Teen": (2, 0.1), "Adult": (4, 0.5), "Elder": (None, 1.0)}  # pet stage -> (max depth, seconds); other stages use heuristics
+PACING_SCALE = 1.0  # multiplier for minigame pauses and animations; 0 = turbo (no delays)
 
 GAME_LIST = ["Math Quiz", "Tic Tac Toe", "Memory Match", 
             "Battle Contest", "Sudoku", "Tetris", "Uno"]
@@ -9,13 +9,16 @@ from constants.animalsArt import (
     )
 
 class Cat(VirtualPet):
+    __slots__ = ()
+
+    emoji = "🐈"
+    fav_food = "Chicken"
+    music_taste = "Pop"
+    dislike_music = "Reggae"
+    songs = ("Born Again by Doja Cat", "Golden by HUNTR/X", "Busy Woman by Sabrina Carpenter")
+
     def __init__(self, name, age):
         super().__init__(name, age, "Cat")
-        self.emoji = "🐈"
-        self.fav_food = "Chicken"
-        self.music_taste = "Pop"
-        self.dislike_music = "Reggae"
-        self.songs = "Born Again by Doja Cat", "Golden by HUNTR/X", "Busy Woman by Sabrina Carpenter"
     
     @staticmethod
     def baby():
@@ -43,13 +46,16 @@ class Cat(VirtualPet):
 
 
 class Rabbit(VirtualPet):
+    __slots__ = ()
+
+    emoji = "🐇"
+    fav_food = "Ice Cream"
+    music_taste = "J-Pop"
+    dislike_music = "Rock"
+    songs = ("Genic - It's Showtime", "Kis-My-Ft2 - Glory Days", "TWS - Hajimemashite")
+
     def __init__(self, name, age):
         super().__init__(name, age, "Rabbit")
-        self.emoji = "🐇"
-        self.fav_food = "Ice Cream"
-        self.music_taste = "J-Pop"
-        self.dislike_music = "Rock"
-        self.songs = "Genic - It's Showtime", "Kis-My-Ft2 - Glory Days", "TWS - Hajimemashite"
     
     @staticmethod
     def baby():
@@ -76,13 +82,16 @@ class Rabbit(VirtualPet):
         yield RABBIT.elder
 
 class Dino(VirtualPet):
+    __slots__ = ()
+
+    emoji = "🦖"
+    fav_food = "French Fries"
+    music_taste = "K-Pop"
+    dislike_music = "Country"
+    songs = ("BTS - Spring Day", "Fifty Fifty - Cupid", "Twice - The Feels")
+
     def __init__(self, name, age):
         super().__init__(name, age, "Dinosaur")
-        self.emoji = "🦖"
-        self.fav_food = "French Fries"
-        self.music_taste = "K-Pop"
-        self.dislike_music = "Country"
-        self.songs = "BTS - Spring Day", "Fifty Fifty - Cupid", "Twice - The Feels"
     
     @staticmethod
     def baby():
@@ -109,13 +118,16 @@ class Dino(VirtualPet):
         
     
 class Dragon(VirtualPet):
+    __slots__ = ()
+
+    emoji = "🐉"
+    fav_food = "Nugget"
+    music_taste = "Blues"
+    dislike_music = "K-Pop"
+    songs = ("The Thrill is Gone By BB King", "Mannish Boy By Muddy Waters", "Love in Vain By Robert Johnson")
+
     def __init__(self, name, age):
         super().__init__(name, age, "Dragon")
-        self.emoji = "🐉"
-        self.fav_food = "Nugget"
-        self.music_taste = "Blues"
-        self.dislike_music = "K-Pop"
-        self.songs = "The Thrill is Gone By BB King", "Mannish Boy By Muddy Waters", "Love in Vain By Robert Johnson"
     
     @staticmethod
     def baby():  
@@ -142,13 +154,16 @@ class Dragon(VirtualPet):
         yield DRAGON.elder
         
 class Pou(VirtualPet):
+    __slots__ = ()
+
+    emoji = "💩"
+    fav_food = "Chicken"
+    music_taste = "Jazz"
+    dislike_music = "Rap"
+    songs = ("Modern Jazz Quartet - Django", "Ahmad Jamal - Poinciana", "George Shearing - Lullaby of Birdland")
+
     def __init__(self, name, age):
         super().__init__(name, age, "Pou")
-        self.emoji = "💩"
-        self.fav_food = "Chicken"
-        self.music_taste = "Jazz"
-        self.dislike_music = "Rap"
-        self.songs = "Modern Jazz Quartet - Django", "Ahmad Jamal - Poinciana", "George Shearing - Lullaby of Birdland"
     
     @staticmethod
     def baby(): 
@@ -169,4 +184,4 @@ class Pou(VirtualPet):
     def elder():  
 
         yield LINE
-        yield POU.elder
\ No newline at end of file
+        yield POU.elder
\ No newline at end of file
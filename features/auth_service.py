@@ -0,0 +1,128 @@
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+from utils.stats import nearest_rank
+from .credential import Credential
+
+"""
+auth_service.py
+
+Singleton AuthService that runs bcrypt hashing/verification on a worker thread pool.
+
+Design notes:
+- bcrypt releases the GIL while it works, so a ThreadPoolExecutor lets several logins
+  hash in parallel instead of serialising every session behind one CPU-bound call.
+- The number of in-flight jobs is bounded. Synchronous callers wait for a free slot;
+  async callers are rejected with AuthServiceBusy so a front end can shed load instead
+  of queueing unboundedly.
+- User.login / User.register stay synchronous thin wrappers over this service, and
+  User.login_async / User.register_async await the same pool from an event loop.
+- Login latencies are kept in a rolling window and exposed as percentiles.
+"""
+
+
+class AuthServiceBusy(RuntimeError):
+    """Raised when the bounded authentication queue is full."""
+
+
+class AuthService:
+    """Singleton worker pool for password hashing and verification."""
+
+    _instance: Optional["AuthService"] = None
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 latency_window: int = 1000):
+        """
+        Create the worker pool.
+
+        Args:
+            max_workers: worker threads (defaults to the CPU count).
+            max_pending: maximum queued + running jobs (defaults to 8 per worker).
+            latency_window: number of recent login timings kept for percentiles.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 8
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="auth")
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._latency_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "AuthService":
+        """Return the global AuthService singleton instance, creating it if necessary."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def shutdown(self) -> None:
+        """Stop the worker pool after running jobs finish."""
+        self._executor.shutdown(wait=True)
+        if AuthService._instance is self:
+            AuthService._instance = None
+
+    # === Job submission ===
+    def submit(self, fn: Callable[..., Any], *args: Any, block: bool = True) -> Future:
+        """
+        Run fn(*args) on the pool, holding one queue slot until it finishes.
+
+        Raises:
+            AuthServiceBusy: if block is False and every slot is taken.
+        """
+        if not self._slots.acquire(blocking=block):
+            raise AuthServiceBusy("Authentication queue is full, please try again.")
+        def run() -> Any:
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+
+        try:
+            return self._executor.submit(run)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def hash_password(self, password: str) -> Credential:
+        """Hash a plaintext password on the pool and wait for the result."""
+        return self.submit(Credential.from_plaintext, password).result()
+
+    def check_password(self, credential: Credential, password: str) -> bool:
+        """Verify a plaintext password on the pool and wait for the result."""
+        return self.submit(credential.verify, password).result()
+
+    async def hash_password_async(self, password: str) -> Credential:
+        """Hash a plaintext password on the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(Credential.from_plaintext, password, block=False))
+
+    async def check_password_async(self, credential: Credential, password: str) -> bool:
+        """Verify a plaintext password on the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(credential.verify, password, block=False))
+
+    # === Latency metrics ===
+    @contextmanager
+    def timed_login(self) -> Iterator[None]:
+        """Record the wall-clock duration of the enclosed login attempt."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._latency_lock:
+                self._latencies.append(time.perf_counter() - start)
+
+    def latency_percentiles(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+        """
+        Return login latency percentiles in milliseconds (nearest-rank).
+
+        The result maps 'p50', 'p90', ... to milliseconds, plus 'count' samples.
+        """
+        with self._latency_lock:
+            samples = sorted(self._latencies)
+        stats: Dict[str, float] = {"count": len(samples)}
+        for pct in percentiles:
+            stats[f"p{pct:g}"] = nearest_rank(samples, pct) * 1000
+        return stats
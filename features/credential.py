@@ -0,0 +1,76 @@
+import re
+import bcrypt
+from typing import Optional
+from constants.configs import BCRYPT_ROUNDS
+
+"""
+credential.py
+
+Password credential type used by the User model.
+
+A Credential wraps a stored bcrypt hash and knows its variant ($2a$, $2b$, $2x$, $2y$)
+and cost factor. Stored hashes are never re-hashed when they are restored from a save;
+instead `needs_rehash()` tells the login flow when a hash should be upgraded to the
+configured cost (`constants.configs.BCRYPT_ROUNDS`) while the plaintext is at hand.
+
+Damaged or empty stored values become an unusable credential that never verifies,
+rather than being hashed as if they were a plaintext password.
+"""
+
+BCRYPT_HASH = re.compile(r"^\$2([abxy])\$(\d{2})\$[./A-Za-z0-9]{53}$")
+
+
+class Credential:
+    """
+    Immutable bcrypt password credential.
+
+    Attributes:
+        hash: the stored bcrypt hash string ("" for an unusable credential).
+        variant: bcrypt variant letter ('a', 'b', 'x' or 'y'), or None if unusable.
+        cost: bcrypt cost factor (log2 rounds), or None if unusable.
+    """
+
+    __slots__ = ("hash", "variant", "cost")
+
+    def __init__(self, hashed: str):
+        match = BCRYPT_HASH.match(hashed or "")
+        self.hash: str = hashed if match else ""
+        self.variant: Optional[str] = match.group(1) if match else None
+        self.cost: Optional[int] = int(match.group(2)) if match else None
+
+    @staticmethod
+    def is_bcrypt_hash(value: str) -> bool:
+        """Return True if value looks like a bcrypt hash of any variant."""
+        return bool(BCRYPT_HASH.match(value or ""))
+
+    @classmethod
+    def from_plaintext(cls, password: str, rounds: Optional[int] = None) -> "Credential":
+        """Hash a plaintext password at the given (or configured) cost."""
+        salt = bcrypt.gensalt(rounds or BCRYPT_ROUNDS)
+        return cls(bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8"))
+
+    @classmethod
+    def from_stored(cls, hashed: str) -> "Credential":
+        """Wrap a stored hash without any hashing work (unusable if it is not bcrypt)."""
+        return cls(hashed)
+
+    @property
+    def usable(self) -> bool:
+        """True when the credential holds a well-formed bcrypt hash."""
+        return self.cost is not None
+
+    def verify(self, password: str) -> bool:
+        """Check a plaintext password against the stored hash."""
+        if not self.usable:
+            return False
+        return bcrypt.checkpw(password.encode("utf-8"), self.hash.encode("utf-8"))
+
+    def needs_rehash(self, rounds: Optional[int] = None) -> bool:
+        """True if the hash is not a $2b$ hash at the given (or configured) cost."""
+        return self.variant != "b" or self.cost != (rounds or BCRYPT_ROUNDS)
+
+    def __str__(self) -> str:
+        return self.hash
+
+    def __repr__(self) -> str:
+        return f"Credential(variant={self.variant!r}, cost={self.cost!r})"
@@ -1,10 +1,217 @@
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional, TextIO
+from constants.configs import PACING_SCALE
+from utils.formatter import clear
+
+"""
+baseClass.py
+
+MinigameStrategy (the template every minigame implements), Pacer, the shared scheduler for
+pauses and animations, and the input sources of the async lifecycle.
+
+Pacing notes:
+- Minigames never call time.sleep for effect. They ask for a pause of n seconds and Pacer
+  scales it by `scale` (constants.configs.PACING_SCALE): 1.0 is normal speed, 0.5 twice as
+  fast, 0 is "turbo" (no delays at all) for tests, benchmarks and speed-runners
+  (`python main.py --turbo`).
+- pause() is the asyncio form: it awaits asyncio.sleep, so other sessions on the same event
+  loop keep running; in turbo mode it still yields once. Game steps await it through
+  MinigameStrategy.pause(). wait() is the blocking form for code outside an event loop, and
+  returns immediately in turbo mode.
+- animate() spaces out the frames of an animation (a loading bar, a reveal) the same way.
+- requested / waited add up the seconds asked for and actually spent, so a run can report
+  how much time pacing cost. They are updated under a lock, since wait() may run on any thread.
+- turbo switches delays off and back on without losing a custom scale: turning it off
+  restores the scale that was set before it was turned on.
+
+Async lifecycle notes:
+- play_async(player, pet, input_source, output) runs a game's steps in order, reading answers
+  from an InputSource: any `async (prompt) -> str` callable. ConsoleInput reads stdin on a
+  worker thread, QueueInput is fed lines by a front end (one queue per session), ScriptedInput
+  replays a list (tests, bots). play() is the console flow: play_async on a fresh event loop.
+- The steps that wait for the player (get_input, build_question, build_game and the helpers
+  they call) are `async def`: they `await self.ask()` for input and `await self.pause()`
+  for effect, so a session waiting for its player holds no thread and many sessions can share
+  one event loop. The other steps (setup, display_menu, evaluate, reward) stay synchronous.
+- Input and output belong to the session, not the process: games write with self.say() (print
+  to the session's `output`, stdout by default) and clear with self.clear_screen(). Nothing
+  global such as builtins.input or sys.stdout is replaced.
+- The default play_async runs setup, display_menu, build_question, build_game, evaluate and
+  reward. Games whose flow differs (extra get_input, early exits) override it.
+"""
+
+InputSource = Callable[[str], Awaitable[str]]
+
+
+class ConsoleInput:
+    """Async source reading the terminal on a worker thread."""
+
+    async def __call__(self, prompt: str) -> str:
+        return await asyncio.to_thread(input, prompt)
+
+
+class QueueInput:
+    """Async source fed one line at a time, e.g. by a network front end."""
+
+    def __init__(self):
+        self._lines: asyncio.Queue = asyncio.Queue()
+        self.prompts: deque = deque(maxlen=100)
+
+    def feed(self, line: str) -> None:
+        self._lines.put_nowait(line)
+
+    async def __call__(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return await self._lines.get()
+
+
+class ScriptedInput:
+    """Async source replaying fixed answers; raises EOFError when they run out."""
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self.prompts = []
+
+    async def __call__(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        try:
+            return next(self._lines)
+        except StopIteration:
+            raise EOFError(prompt) from None
+
+
+class Pacer:
+    """Singleton pacing scheduler: scaled, optionally disabled delays."""
+
+    _instance: Optional["Pacer"] = None
+
+    def __init__(self, scale: float = PACING_SCALE):
+        self.scale = scale
+        self.requested = 0.0
+        self.waited = 0.0
+        self._scale_before_turbo = scale
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "Pacer":
+        """Return the global Pacer singleton instance, creating it if necessary."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def turbo(self) -> bool:
+        return self.scale == 0
+
+    @turbo.setter
+    def turbo(self, enabled: bool) -> None:
+        if enabled and not self.turbo:
+            self._scale_before_turbo = self.scale
+            self.scale = 0.0
+        elif not enabled and self.turbo:
+            self.scale = self._scale_before_turbo or PACING_SCALE
+
+    @contextmanager
+    def turbo_mode(self) -> Iterator["Pacer"]:
+        """Temporarily drop every delay to zero."""
+        previous = self.turbo
+        self.turbo = True
+        try:
+            yield self
+        finally:
+            self.turbo = previous
+
+    def delay(self, seconds: float) -> float:
+        """Scaled length of a pause of the given nominal seconds."""
+        delay = max(0.0, seconds * self.scale)
+        with self._lock:
+            self.requested += seconds
+            self.waited += delay
+        return delay
+
+    async def pause(self, seconds: float) -> None:
+        """Await a scaled pause without blocking the event loop."""
+        await asyncio.sleep(self.delay(seconds))
+
+    def wait(self, seconds: float) -> None:
+        """Block for a scaled pause (synchronous callers)."""
+        delay = self.delay(seconds)
+        if delay:
+            time.sleep(delay)
+
+    async def animate(self, frames: Iterable[Any], interval: float) -> AsyncIterator[Any]:
+        """Yield frames one by one with a scaled pause after each."""
+        for frame in frames:
+            yield frame
+            await self.pause(interval)
+
+
 class MinigameStrategy(ABC):
     """Abstract base class for minigame implementations."""
 
     name: str
 
+    @property
+    def pacer(self) -> Pacer:
+        """The shared pacing scheduler."""
+        return Pacer.get_instance()
+
+    input_source: Optional[InputSource] = None
+    output: Optional[TextIO] = None
+
+    async def pause(self, seconds: float) -> None:
+        """Pause for effect, scaled (or skipped in turbo mode) by the shared Pacer."""
+        await self.pacer.pause(seconds)
+
+    # === Session input and output ===
+    async def ask(self, prompt: str = "") -> str:
+        """Read one answer from the session's input source (the console outside a session)."""
+        source = self.input_source or ConsoleInput()
+        return await source(prompt)
+
+    def say(self, *values: Any, **kwargs: Any) -> None:
+        """print() to the session's output (stdout outside a session)."""
+        print(*values, file=self.output, **kwargs)
+
+    def clear_screen(self) -> None:
+        """Clear the console, or only the session's own screen when it has an output."""
+        if self.output is None:
+            clear()
+        else:
+            self.say("\033[2J\033[H", end="")
+
+    @contextmanager
+    def session(self, input_source: Optional[InputSource] = None,
+                output: Optional[TextIO] = None) -> Iterator["MinigameStrategy"]:
+        """Bind input_source (default: the console) and output (default: stdout) to this game."""
+        previous = self.input_source, self.output
+        self.input_source = input_source or ConsoleInput()
+        self.output = output
+        try:
+            yield self
+        finally:
+            self.input_source, self.output = previous
+
+    # === Lifecycle ===
+    def play(self, player: Any, pet: Any) -> Dict[str, int]:
+        """High-level convenience that runs the full minigame on the console and returns rewards."""
+        return asyncio.run(self.play_async(player, pet))
+
+    async def play_async(self, player: Any, pet: Any, input_source: Optional[InputSource] = None,
+                         output: Optional[TextIO] = None) -> Dict[str, int]:
+        """Run the lifecycle with answers from input_source, writing to output."""
+        with self.session(input_source, output):
+            self.setup(player, pet)
+            self.display_menu()
+            await self.build_question()
+            summary = await self.build_game()
+            return self.reward(self.evaluate(summary))
+
     @abstractmethod
     def setup(self, player: Any, pet: Any) -> None:
         """Prepare internal state before the game begins."""
@@ -16,17 +223,17 @@ class MinigameStrategy(ABC):
         pass
 
     @abstractmethod
-    def get_input(self) -> Any:
+    async def get_input(self) -> Any:
         """Collect any initial input from the player (difficulty, options, etc.)."""
         pass
 
     @abstractmethod
-    def build_question(self) -> Any:
+    async def build_question(self) -> Any:
         """Build the questions or game board prior to playing."""
         pass
 
     @abstractmethod
-    def build_game(self) -> Any:
+    async def build_game(self) -> Any:
         """Run the interactive portion where the user provides answers/moves."""
         pass
 
@@ -40,7 +247,3 @@ class MinigameStrategy(ABC):
         """Convert evaluation results into currency/pet happiness rewards."""
         pass
 
-    @abstractmethod
-    def play(self, player: Any, pet: Any) -> Dict[str, int]:
-        """High-level convenience that runs the full minigame flow and returns rewards."""
-        pass
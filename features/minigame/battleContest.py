@@ -1,5 +1,4 @@
 from .baseClass import MinigameStrategy
-import time
 from random import randint, choice
 from utils.colorize import red, green
 from constants.configs import LINE
@@ -24,12 +23,11 @@ class BattleContest(MinigameStrategy):
         self.current_round = 1
         self.player_health = self.player_pet.health * 1000
         self.player_won = 0
-        other_players_with_pets = list(filter(lambda user: user != self.player and user.pets, User.users.values()))
-        if other_players_with_pets:
-            self.opponent = choice(other_players_with_pets)
+        self.opponent = User.users.find_random(lambda user: user != self.player and user.pets)
+        if self.opponent:
             self.opponent_pet = choice(self.opponent.pets)
         else:
-            print(red("\nOther players currently doesn't have any pets yet!\n"))
+            self.say(red("\nOther players currently doesn't have any pets yet!\n"))
             return False
         self.opponent_health = self.opponent_pet.health * 1000
         self.opponent_won = 0
@@ -45,63 +43,63 @@ class BattleContest(MinigameStrategy):
 
     def display_menu(self):
         """Display battle status and available actions for the current round."""
-        print("\n" + LINE)
-        print(f"PET BATTLE TOURNAMENT -> ROUND - {self.current_round}".center(len(LINE)))
-        print(LINE)
-        print("\n" + LINE)
-        print(f"Your Pet: {self.player_pet.name} {self.player_pet.emoji}")
-        print(f"Health: {self.player_health}")
-        print(f"Strength: {self.player_pet_stats['strength']}")
-        print(f"Agility: {self.player_pet_stats['agility']}")
-        print('-' * len(LINE))
+        self.say("\n" + LINE)
+        self.say(f"PET BATTLE TOURNAMENT -> ROUND - {self.current_round}".center(len(LINE)))
+        self.say(LINE)
+        self.say("\n" + LINE)
+        self.say(f"Your Pet: {self.player_pet.name} {self.player_pet.emoji}")
+        self.say(f"Health: {self.player_health}")
+        self.say(f"Strength: {self.player_pet_stats['strength']}")
+        self.say(f"Agility: {self.player_pet_stats['agility']}")
+        self.say('-' * len(LINE))
 
         if self.opponent_pet:
-            print(f"Opponent: {self.opponent_pet.name} {self.opponent_pet.emoji}")
-            print(f"Health: {self.opponent_health}")
-            print(f"Strength: {self.player_pet_stats['strength']}")
-            print(f"Agility: {self.player_pet_stats['agility']}")
-
-        print(LINE)
-        print("\nBattle Options:")
-        print(LINE)
-        print("1. Attack 🗡️")
-        print("2. Defend 🛡️")
-        print("3. Special Move ✨")
-        print("4. Heal ❤️‍🩹")
-        print(LINE)
-
-    def get_input(self):
+            self.say(f"Opponent: {self.opponent_pet.name} {self.opponent_pet.emoji}")
+            self.say(f"Health: {self.opponent_health}")
+            self.say(f"Strength: {self.player_pet_stats['strength']}")
+            self.say(f"Agility: {self.player_pet_stats['agility']}")
+
+        self.say(LINE)
+        self.say("\nBattle Options:")
+        self.say(LINE)
+        self.say("1. Attack 🗡️")
+        self.say("2. Defend 🛡️")
+        self.say("3. Special Move ✨")
+        self.say("4. Heal ❤️‍🩹")
+        self.say(LINE)
+
+    async def get_input(self):
         """Prompt and validate a numeric choice for the battle action."""
         while True:
             try:
-                choice = int(input("Choose your action (1-4): "))
+                choice = int(await self.ask("Choose your action (1-4): "))
                 if 1 <= choice <= 4:
                     return choice
                 else:
-                    print(red("Please enter a number between 1-4!"))
+                    self.say(red("Please enter a number between 1-4!"))
             except ValueError:
-                print(red("Please enter a valid number!"))
+                self.say(red("Please enter a valid number!"))
 
-    def build_question(self) -> Any:
+    async def build_question(self) -> Any:
         """Prepare the battle sequence and announce start."""
-        print("\n" + LINE)
-        print("Battle Starting!")
-        print(LINE)
-        print(f"{self.player_pet.name} {self.player_pet.emoji} VS {self.opponent_pet.name} {self.opponent_pet.emoji}")
-        print("Prepare for battle!")
-        time.sleep(2)
-
-    def build_game(self) -> Any:
+        self.say("\n" + LINE)
+        self.say("Battle Starting!")
+        self.say(LINE)
+        self.say(f"{self.player_pet.name} {self.player_pet.emoji} VS {self.opponent_pet.name} {self.opponent_pet.emoji}")
+        self.say("Prepare for battle!")
+        await self.pause(2)
+
+    async def build_game(self) -> Any:
         """Main battle loop: alternate player/opponent actions until one health reaches 0."""
         while self.opponent_health > 0 and self.player_health > 0:
             self.display_menu()
-            player_choice = self.get_input()
+            player_choice = await self.get_input()
 
             self._execute_player_action(player_choice)
             self._execute_opponent_action()
 
             self.current_round += 1
-            time.sleep(1)
+            await self.pause(1)
 
         self._determine_battle_outcome()
 
@@ -142,77 +140,77 @@ class BattleContest(MinigameStrategy):
         """Player attacks the opponent."""
         damage = (randint(5, 10) + self.player_pet_stats["strength"] // 3) * 300
         self.opponent_health -= damage
-        print(f"\n{self.player_pet.name} attacks for {damage} damage ⚔️!")
+        self.say(f"\n{self.player_pet.name} attacks for {damage} damage ⚔️!")
 
     def _player_defend(self) -> None:
         """Player defends, temporarily reducing incoming damage (display only)."""
         defense_bonus = randint(2, 5) * 3000
-        print(f"\n{self.player_pet.name} defends 🛡️!")
-        print(f"Damage reduction: {defense_bonus}")
+        self.say(f"\n{self.player_pet.name} defends 🛡️!")
+        self.say(f"Damage reduction: {defense_bonus}")
 
     def _player_special_move(self) -> None:
         """Player uses special move (only on even rounds)."""
         if self.current_round % 2 == 0:
             special_damage = (randint(10, 15) + self.player_pet_stats["strength"] // 2) * 600
             self.opponent_health -= special_damage
-            print(f"\n{self.player_pet.name} uses special move for {special_damage} damage ✨!")
+            self.say(f"\n{self.player_pet.name} uses special move for {special_damage} damage ✨!")
         else:
-            print(red("\nSpecial moves are locked in odd rounds!"))
+            self.say(red("\nSpecial moves are locked in odd rounds!"))
 
     def _player_heal(self) -> None:
         """Player heals if heal limit not exceeded."""
         if self.player_heal_count < self.player_heal_limit:
             heal_amount = randint(8, 12) * 500
             self.player_health += heal_amount
-            print(f"\n{self.player_pet.name} heals for {heal_amount} health ❤️‍🩹!")
+            self.say(f"\n{self.player_pet.name} heals for {heal_amount} health ❤️‍🩹!")
             self.player_heal_count += 1
         else:
-            print(red("\nYou already healed 3 times!"))
+            self.say(red("\nYou already healed 3 times!"))
 
     def _opponent_attack(self) -> None:
         """Opponent attacks the player."""
         damage = (randint(4, 8) + self.opponent_pet_stats["strength"] // 3) * 300
         self.player_health -= damage
-        print(f"{self.opponent_pet.name} attacks for {damage} damage ⚔️!")
+        self.say(f"{self.opponent_pet.name} attacks for {damage} damage ⚔️!")
 
     def _opponent_defend(self) -> None:
         """Opponent defends (display only)."""
         defense_bonus = randint(1, 4) * 3000
-        print(f"{self.opponent_pet.name} defends 🛡️!")
-        print(f"Damage reduction: {defense_bonus}")
+        self.say(f"{self.opponent_pet.name} defends 🛡️!")
+        self.say(f"Damage reduction: {defense_bonus}")
 
     def _opponent_special_move(self) -> None:
         """Opponent special move (only on odd rounds)."""
         if self.current_round % 2 != 0:
             special_damage = (randint(8, 12) + self.opponent_pet_stats["strength"] // 2) * 600
             self.player_health -= special_damage
-            print(f"{self.opponent_pet.name} uses special move for {special_damage} damage ✨!")
+            self.say(f"{self.opponent_pet.name} uses special move for {special_damage} damage ✨!")
         else:
-            print(red("\nOpponent's special moves are restricted on even rounds!"))
+            self.say(red("\nOpponent's special moves are restricted on even rounds!"))
 
     def _opponent_heal(self) -> None:
         """Opponent heals if heal limit not exceeded."""
         if self.opponent_heal_count < self.opponent_heal_limit:
             heal_amount = randint(6, 10) * 500
             self.opponent_health += heal_amount
-            print(f"{self.opponent_pet.name} heals for {heal_amount} health ❤️‍🩹!")
+            self.say(f"{self.opponent_pet.name} heals for {heal_amount} health ❤️‍🩹!")
             self.opponent_heal_count += 1
         else:
-            print(red("\nOpponent's healing ability are restricted to 5 times only!"))
+            self.say(red("\nOpponent's healing ability are restricted to 5 times only!"))
 
     def _determine_battle_outcome(self) -> None:
         """Determine and display the battle outcome and update counters."""
         if self.opponent_health <= 0:
-            print(f"{self.opponent_pet.name} was defeated 🎉!")
+            self.say(f"{self.opponent_pet.name} was defeated 🎉!")
             self.player_won += 1
             self.current_round += 1
 
         if self.player_health <= 0:
-            print(f"{self.player_pet.name} was defeated 🎉!")
+            self.say(f"{self.player_pet.name} was defeated 🎉!")
             self.opponent_won += 1
 
         if self.player_health <= 0 and self.opponent_health <= 0:
-            print("It's a draw! 🤺")
+            self.say("It's a draw! 🤺")
 
     def evaluate(self, answer):
         """Construct a richer evaluation dict from raw battle results."""
@@ -243,27 +241,28 @@ class BattleContest(MinigameStrategy):
         if victory:
             coins = 20 + (performance_score // 10)
             pet_happiness = 15 + ((player_health_remaining - 1000) // 5)
-            print(green(f"🎉 VICTORY! {self.player_pet.name} won the battle!"))
+            self.say(green(f"🎉 VICTORY! {self.player_pet.name} won the battle!"))
         else:
             coins = 5 + (performance_score // 20)
             pet_happiness = 5 + ((player_health_remaining - 1000) // 10)
-            print(red(f"💔 Defeat... {self.player_pet.name} was defeated."))
-        print("\n" + LINE)
-        print("BATTLE RESULTS")
-        print(LINE)
-        print(f"Performance Score: {performance_score}/100")
-        print(f"Health Remaining: {player_health_remaining}")
-        print(f"Coins Earned: {'{:,}'.format(coins * 1000)}")
-        print(f"Pet Happiness: (+{pet_happiness})")
-        print(LINE)
+            self.say(red(f"💔 Defeat... {self.player_pet.name} was defeated."))
+        self.say("\n" + LINE)
+        self.say("BATTLE RESULTS")
+        self.say(LINE)
+        self.say(f"Performance Score: {performance_score}/100")
+        self.say(f"Health Remaining: {player_health_remaining}")
+        self.say(f"Coins Earned: {'{:,}'.format(coins * 1000)}")
+        self.say(f"Pet Happiness: (+{pet_happiness})")
+        self.say(LINE)
 
         return {"currency": coins, "pet_happiness": pet_happiness}
 
-    def play(self, player, pet):
+    async def play_async(self, player, pet, input_source=None, output=None):
         """Run the battle contest flow and return rewards (if setup succeeds)."""
-        res = self.setup(player, pet)
-        if res:
-            self.build_question()
-            battle_result = self.build_game()
-            evaluation = self.evaluate(battle_result)
-            return self.reward(evaluation)
+        with self.session(input_source, output):
+            res = self.setup(player, pet)
+            if res:
+                await self.build_question()
+                battle_result = await self.build_game()
+                evaluation = self.evaluate(battle_result)
+                return self.reward(evaluation)
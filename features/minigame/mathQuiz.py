@@ -23,34 +23,34 @@ class MathQuiz(MinigameStrategy):
 
     def display_menu(self):
         """Explain rules and difficulty options to the player."""
-        print("\n" + LINE)
-        print("➕ Math Quiz ➗")
-        print(LINE)
-        print("🔍 This game is created to test your logical thinking skill! 🔍")
-        print("🧠 Answer the given arithmetic questions as fast and accurately as you can... 🤓")
-        print("You will get your coin rewards and boost your pet's happiness! 😸")
-        print(LINE)
-        print("Before we start, please choose your difficulty: ")
-        print(LINE)
-        print("1. Easy")
-        print("2. Medium")
-        print("3. Hard")
-        print("4. Master")
-        print(LINE)
-        print("NOTE: Any user's input other than 1-4 will be considered 1 (Default: Difficulty Easy)")
-        print(LINE)
+        self.say("\n" + LINE)
+        self.say("➕ Math Quiz ➗")
+        self.say(LINE)
+        self.say("🔍 This game is created to test your logical thinking skill! 🔍")
+        self.say("🧠 Answer the given arithmetic questions as fast and accurately as you can... 🤓")
+        self.say("You will get your coin rewards and boost your pet's happiness! 😸")
+        self.say(LINE)
+        self.say("Before we start, please choose your difficulty: ")
+        self.say(LINE)
+        self.say("1. Easy")
+        self.say("2. Medium")
+        self.say("3. Hard")
+        self.say("4. Master")
+        self.say(LINE)
+        self.say("NOTE: Any user's input other than 1-4 will be considered 1 (Default: Difficulty Easy)")
+        self.say(LINE)
 
-    def get_input(self):
+    async def get_input(self):
         """Collect difficulty choice (1-4)."""
         try:
-            diff = int(input("Choose your difficulty (1-4): ").strip())
+            diff = int((await self.ask("Choose your difficulty (1-4): ")).strip())
         except ValueError:
             diff = 1
         if diff not in range(1, 5):
             diff = 1
         self.difficulty = diff
 
-    def build_question(self):
+    async def build_question(self):
         """Generate the arithmetic questions based on chosen difficulty."""
         if self.difficulty == 1:
             total_question = 5
@@ -80,15 +80,15 @@ class MathQuiz(MinigameStrategy):
                 b = randint(1, max(1, max_value // 10))
             self.questions.append((a, op, b))
 
-    def build_game(self):
+    async def build_game(self):
         """Prompt the user with all questions and collect integer answers (None for invalid)."""
-        print(yellow(f"\nYou will be asked {len(self.questions)} questions. Type your answer (must be an int): "))
-        print(LINE)
+        self.say(yellow(f"\nYou will be asked {len(self.questions)} questions. Type your answer (must be an int): "))
+        self.say(LINE)
         self.start_time = time.time()
         user_answers = []
         for i, (a, op, b) in enumerate(self.questions, start=1):
             try:
-                ans = int(input(f"Q{i}: {a} {op} {b} = ").strip())
+                ans = int((await self.ask(f"Q{i}: {a} {op} {b} = ")).strip())
             except ValueError:
                 ans = None
             user_answers.append(ans)
@@ -131,17 +131,18 @@ class MathQuiz(MinigameStrategy):
         # fixed quoting for nested keys
         elapsed = result.get("elapsed", 0)
         accuracy = result.get("accuracy", 0.0)
-        print(f"\nResult: {correct}/{total} correct in {elapsed:.2f}s (accuracy {round(accuracy * 100)}%)")
-        print(f"You earned Rp. {'{:,}'.format(coins * 1000)} and your pet gains {pet_happiness} happiness.")
+        self.say(f"\nResult: {correct}/{total} correct in {elapsed:.2f}s (accuracy {round(accuracy * 100)}%)")
+        self.say(f"You earned Rp. {'{:,}'.format(coins * 1000)} and your pet gains {pet_happiness} happiness.")
         return {"currency": coins, "pet_happiness": pet_happiness}
 
-    def play(self, player: Any, pet: Any) -> Dict[str, int]:
+    async def play_async(self, player: Any, pet: Any, input_source=None, output=None) -> Dict[str, int]:
         """Run the full MathQuiz lifecycle and return rewards dict."""
-        self.setup(player, pet)
-        self.display_menu()
-        self.get_input()
-        self.build_question()
-        answer = self.build_game()
-        result = self.evaluate(answer)
-        reward = self.reward(result)
-        return reward
\ No newline at end of file
+        with self.session(input_source, output):
+            self.setup(player, pet)
+            self.display_menu()
+            await self.get_input()
+            await self.build_question()
+            answer = await self.build_game()
+            result = self.evaluate(answer)
+            reward = self.reward(result)
+            return reward
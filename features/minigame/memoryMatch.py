@@ -1,8 +1,7 @@
 from .baseClass import MinigameStrategy
-import time
+from .wordSource import WordSource, COMMON, RARE
 from random import choice, randint, random
 from constants.configs import LINE
-from utils.formatter import clear
 from utils.colorize import green
 from colorama import init
 
@@ -13,10 +12,24 @@ class MemoryMatch(MinigameStrategy):
 
     name = "Memory Match"
 
+    # difficulty -> (min length, max length, character classes) of the words it draws
+    WORD_BANDS = {
+        2: (3, 6, (COMMON,)),
+        3: (4, 8, (COMMON, RARE)),
+    }
+
     def load_words(self):
-        with open("datas/words.txt") as word_file:
-            words = list(word_file.read().split())
-        return words
+        """Return the shared memory-mapped word list (indexed once, then O(1) per pick)."""
+        return WordSource.shared("datas/words.txt")
+
+    def word_pool(self):
+        """Words for the current difficulty band, falling back to the whole list if it is empty."""
+        band = self.WORD_BANDS.get(self.difficulty)
+        if band is not None:
+            pool = self.words.band(*band)
+            if len(pool):
+                return pool
+        return self.words
 
     def setup(self, player, pet):
         self.player = player
@@ -32,30 +45,30 @@ class MemoryMatch(MinigameStrategy):
 
     def display_menu(self):
         """Explain Memory Match rules and difficulty levels."""
-        print("\n" + LINE)
-        print("🧩 Memory Match 🧩")
-        print(LINE)
-        print("Memorize a short sequence, then reproduce it.")
-        print("Faster and more accurate answers give better rewards.")
-        print(LINE)
-        print("Choose difficulty:")
-        print(LINE)
-        print("1. Easy   (sequence length 5-6, digits)")
-        print("2. Medium (sequence length 3-4, words)")
-        print("3. Hard   (sequence length 6-8, mixed digits/words)")
-        print(LINE)
-
-    def get_input(self):
+        self.say("\n" + LINE)
+        self.say("🧩 Memory Match 🧩")
+        self.say(LINE)
+        self.say("Memorize a short sequence, then reproduce it.")
+        self.say("Faster and more accurate answers give better rewards.")
+        self.say(LINE)
+        self.say("Choose difficulty:")
+        self.say(LINE)
+        self.say("1. Easy   (sequence length 5-6, digits)")
+        self.say("2. Medium (sequence length 3-4, words)")
+        self.say("3. Hard   (sequence length 6-8, mixed digits/words)")
+        self.say(LINE)
+
+    async def get_input(self):
         """Collect difficulty choice."""
         try:
-            diff = int(input("Choose difficulty (1-3): ").strip())
+            diff = int((await self.ask("Choose difficulty (1-3): ")).strip())
         except ValueError:
             diff = 1
         if diff not in range(1, 4):
             diff = 1
         self.difficulty = diff
 
-    def build_question(self):
+    async def build_question(self):
         """Build the sequence to memorize based on difficulty and charset."""
         diff = self.difficulty
         if diff == 1:
@@ -68,30 +81,31 @@ class MemoryMatch(MinigameStrategy):
             self.length = choice([6, 7, 8])
             self.charset = "mixed"
 
+        words = self.word_pool()
         if self.charset == "digits":
             self.sequence = [str(randint(0, 9)) for _ in range(self.length)]
         elif self.charset == "words":
             for _ in range(self.length):
-                self.sequence.append(choice(self.words))
+                self.sequence.append(choice(words))
         else:
             self.sequence = []
             for _ in range(self.length):
                 if random() < 0.6:
                     self.sequence.append(str(randint(0, 9)))
                 else:
-                    self.sequence.append(choice(self.words))
+                    self.sequence.append(choice(words))
 
-    def build_game(self):
+    async def build_game(self):
         """Show the sequence briefly and then prompt the player to reproduce it."""
-        print("\n" + LINE)
-        print("Game started!")
-        print(LINE)
-        print("Memorize this sequence:")
-        print(" ".join(self.sequence))
-        time.sleep(1.0 + 0.5 * self.length)
-        clear()
-        print("Now type the sequence separated by spaces (e.g. \"1 2 3\" or \"cat dog 5\" or \"cat dog fruit\").")
-        ans = input("Your answer: ").strip()
+        self.say("\n" + LINE)
+        self.say("Game started!")
+        self.say(LINE)
+        self.say("Memorize this sequence:")
+        self.say(" ".join(self.sequence))
+        await self.pause(1.0 + 0.5 * self.length)
+        self.clear_screen()
+        self.say("Now type the sequence separated by spaces (e.g. \"1 2 3\" or \"cat dog 5\" or \"cat dog fruit\").")
+        ans = (await self.ask("Your answer: ")).strip()
         ans_list = ans.split()
         return ans_list
 
@@ -127,23 +141,24 @@ class MemoryMatch(MinigameStrategy):
 
         pet_happiness = correct // int(self.difficulty) if self.difficulty else correct
 
-        print("\n" + LINE)
-        print("RESULT".center(len(LINE)))
-        print(LINE)
-        print(f"Sequence was: {' '.join(result['sequence'])}")
-        print(f"Your response: {' '.join(result['response']) if result['response'] else '(none)'}")
-        print(f"\nCorrect: {correct}/{total}")
+        self.say("\n" + LINE)
+        self.say("RESULT".center(len(LINE)))
+        self.say(LINE)
+        self.say(f"Sequence was: {' '.join(result['sequence'])}")
+        self.say(f"Your response: {' '.join(result['response']) if result['response'] else '(none)'}")
+        self.say(f"\nCorrect: {correct}/{total}")
         if exact:
-            print(green("Perfect! Bonus awarded! 🎉"))
-        print(f"You earned Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})\n")
+            self.say(green("Perfect! Bonus awarded! 🎉"))
+        self.say(f"You earned Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})\n")
         return {"currency": coins, "pet_happiness": pet_happiness}
 
-    def play(self, player, pet):
+    async def play_async(self, player, pet, input_source=None, output=None):
         """Run the MemoryMatch flow and return rewards."""
-        self.setup(player, pet)
-        self.display_menu()
-        self.get_input()
-        self.build_question()
-        answer = self.build_game()
-        result = self.evaluate(answer)
-        return self.reward(result)
+        with self.session(input_source, output):
+            self.setup(player, pet)
+            self.display_menu()
+            await self.get_input()
+            await self.build_question()
+            answer = await self.build_game()
+            result = self.evaluate(answer)
+            return self.reward(result)
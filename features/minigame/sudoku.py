@@ -1,7 +1,8 @@
-from random import shuffle, choice
+from random import choice
 from .baseClass import MinigameStrategy
+from .sudokuEngine import SudokuEngine, generate_puzzle
 import time
-from constants.configs import LINE, GRID_LINE
+from constants.configs import LINE, GRID_LINE, SUDOKU_CELLS_REMOVED
 from utils.colorize import red, green, blue, yellow
 from colorama import init
 
@@ -23,72 +24,70 @@ class Sudoku(MinigameStrategy):
         self.coins = 50
         self.start_time = None
         self.end_time = None
+        # Session state, set by generate_sudoku: canonical solution and incremental board
+        self.solution = None
+        self._board = None
+        self._empty = []
+        self._empty_index = {}
+        self._wrong = set()
     
-    @staticmethod
-    def display_menu():
+    def display_menu(self):
         """Show rules and rewards for the Sudoku minigame."""
-        print("\n" + LINE)
-        print("🔢 Sudoku 🔢")
-        print(LINE)
-        print("Let's play classic Sudoku with your pet!")
-        print("You must complete following sudoku in order to win the game!")
-        print(LINE)
-        print("Rules on Sudoku: ")
-        print("1. Use number in range 1-9 (Do not exceed this range!)")
-        print("2. Do not repeat any numbers (no repeating in rows, columns and grid 3 x 3)")
-        print("3. You only have 3 tries to solve the sudoku")
-        print(LINE)
-        print("Win ---> more currency")
-        print("Loss ---> better luck next time")
-        print(LINE)
+        self.say("\n" + LINE)
+        self.say("🔢 Sudoku 🔢")
+        self.say(LINE)
+        self.say("Let's play classic Sudoku with your pet!")
+        self.say("You must complete following sudoku in order to win the game!")
+        self.say(LINE)
+        self.say("Rules on Sudoku: ")
+        self.say("1. Use number in range 1-9 (Do not exceed this range!)")
+        self.say("2. Do not repeat any numbers (no repeating in rows, columns and grid 3 x 3)")
+        self.say("3. You only have 3 tries to solve the sudoku")
+        self.say(LINE)
+        self.say("Win ---> more currency")
+        self.say("Loss ---> better luck next time")
+        self.say(LINE)
     
-    def build_question(self):
+    async def build_question(self):
         """Collect difficulty choice and prepare an incomplete Sudoku."""
 
-        print(yellow("Level of Difficulty: "))
-        print(LINE)
-        print("1. Easy")
-        print("2. Medium")
-        print("3. Hard")
-        print("4. Expert")
-        print(LINE)
+        self.say(yellow("Level of Difficulty: "))
+        self.say(LINE)
+        self.say("1. Easy")
+        self.say("2. Medium")
+        self.say("3. Hard")
+        self.say("4. Expert")
+        self.say(LINE)
         try:
-            diff = int(input("Choose your difficulty (1/2/3/4): ").strip())
+            diff = int((await self.ask("Choose your difficulty (1/2/3/4): ")).strip())
         except ValueError:
             diff = 1
         if diff not in range(1, 5):
             diff = 1
         self.difficulty = diff
-        if self.difficulty == 1:
-            self.cell_removed = 35
-        elif self.difficulty == 2:
-            self.cell_removed = 45
-        elif self.difficulty == 3:
-            self.cell_removed = 55
-        else:
-            self.cell_removed = 65
+        self.cell_removed = SUDOKU_CELLS_REMOVED[diff]
     
     def print_grid(self):
         """Display the Sudoku grid with coordinates"""
 
-        print("\n    1 2 3   4 5 6   7 8 9")
-        print(f"  {GRID_LINE}")
+        self.say("\n    1 2 3   4 5 6   7 8 9")
+        self.say(f"  {GRID_LINE}")
         for i, row in enumerate(self.grid):
             if i > 0 and i % 3 == 0:
-                print(f"  {GRID_LINE}")
-            print(f"{i + 1} |", end='')
+                self.say(f"  {GRID_LINE}")
+            self.say(f"{i + 1} |", end='')
             for j, num in enumerate(row):
                 if j > 0 and j % 3 == 0:
-                    print(" |", end='')
+                    self.say(" |", end='')
                 if self.pre_filled[i][j]:
-                    print(f" {num}", end='')
+                    self.say(f" {num}", end='')
                 elif self.grid[i][j] != 0:
-                    print(f" {num}", end='')
+                    self.say(f" {num}", end='')
                 else:
-                    print("  ", end="")
-            print(" |")
-        print(f"  {GRID_LINE}")
-        print()
+                    self.say("  ", end="")
+            self.say(" |")
+        self.say(f"  {GRID_LINE}")
+        self.say()
     
     @staticmethod
     def is_valid(board, row, col, num):
@@ -113,78 +112,83 @@ class Sudoku(MinigameStrategy):
         # If there is no duplicates in any
         return True
 
-    def _find_empty(self, board):
-        """Return the row and column of the first empty cell (0), or (None, None) if the board is full."""
-        for row in range(9):
-            for col in range(9):
-                if board[row][col] == 0:
-                    return row, col
-        return None, None
-
-
-    def _shuffled_numbers(self):
-        """Return numbers 1–9 in random order for randomized backtracking."""
-        numbers = list(range(1, 10))
-        shuffle(numbers)
-        return numbers
-
-
-    def _try_number(self, board, row, col, num):
-        """Try placing a number in a cell and recursively solve the board.
-        
-        Returns True if the placement leads to a valid solution, otherwise False.
-        """
-        if not self.is_valid(board, row, col, num):
-            return False
-
-        board[row][col] = num
-        if self.solve_sudoku(board):
-            return True
-
-        board[row][col] = 0
-        return False
-
     def solve_sudoku(self, board):
-        """Solve the Sudoku puzzle using backtracking."""
-        row, col = self._find_empty(board)
-        if row is None:
-            return True
-
-        for num in self._shuffled_numbers():
-            if self._try_number(board, row, col, num):
-                return True
-
-        board[row][col] = 0
-        return False
-
+        """Solve the Sudoku puzzle in place with the bitmask engine; returns False if unsolvable."""
+        try:
+            engine = SudokuEngine(board)
+        except ValueError:
+            return False
+        if not engine.solve():
+            return False
+        for i in range(9):
+            board[i][:] = engine.solution[i * 9:i * 9 + 9]
+        return True
 
     def generate_sudoku(self):
-        """Generate a Sudoku puzzle with given difficulty"""
+        """Take a uniquely solvable puzzle from the puzzle bank, generating one if it is empty"""
+        from .sudokuBank import PuzzleBank
 
-        temp_grid = [row[:] for row in self.grid]
-        # Complete Solution of Sudoku
-        self.solve_sudoku(temp_grid)
+        puzzle = PuzzleBank.get_instance().pop(self.cell_removed)
+        engine = SudokuEngine(puzzle) if puzzle is not None else None
+        if engine is not None and engine.solve():
+            self.solution = engine.solution
+        else:
+            puzzle, self.solution = generate_puzzle(self.cell_removed)
+        for row in range(9):
+            self.grid[row][:] = puzzle[row * 9:row * 9 + 9]
+            self.pre_filled[row][:] = [value != 0 for value in self.grid[row]]
+
+        self._board = SudokuEngine(puzzle)
+        self._empty = [pos for pos, value in enumerate(puzzle) if value == 0]
+        self._empty_index = {pos: i for i, pos in enumerate(self._empty)}
+        self._wrong = set()
+
+    # === Incremental session state (O(1) per move) ===
+    def _set_cell(self, row, col, num):
+        """Write num (0 = clear) into the grid, keeping masks, empty cells and mistakes in sync."""
+        pos = row * 9 + col
+        if self._board.remove(pos):
+            self._wrong.discard(pos)
+        else:
+            self._take_empty(pos)
 
-        for i in range(9):
-            for j in range(9):
-                self.grid[i][j] = temp_grid[i][j]
+        self.grid[row][col] = num
+        if num:
+            self._board.place(pos, num)
+            if num != self.solution[pos]:
+                self._wrong.add(pos)
+        else:
+            self._empty_index[pos] = len(self._empty)
+            self._empty.append(pos)
+
+    def _take_empty(self, pos):
+        """Remove pos from the empty-cell list by swapping it with the last entry."""
+        i = self._empty_index.pop(pos)
+        last = self._empty.pop()
+        if last != pos:
+            self._empty[i] = last
+            self._empty_index[last] = i
+
+    def can_place(self, row, col, num):
+        """True if num does not clash with its row, column or box (the cell itself is ignored)."""
+        if self.grid[row][col] == num:
+            return True
+        used = self._board.rows[row] | self._board.cols[col] | self._board.boxes[(row // 3) * 3 + col // 3]
+        return not (used >> (num - 1)) & 1
 
-        positions = [(r, c) for r in range(9) for c in range(9)]
-        shuffle(positions)
+    def diverges(self, row, col):
+        """True if the cell holds a value that differs from the puzzle's solution."""
+        return row * 9 + col in self._wrong
 
-        for i in range(self.cell_removed):
-            row, col = positions[i]
-            self.grid[row][col] = 0
+    def progress(self):
+        """Return (correct, wrong, empty) cell counts for the current grid."""
+        empty, wrong = len(self._empty), len(self._wrong)
+        return 81 - empty - wrong, wrong, empty
 
-        for row in range(9):
-            for col in range(9):
-                if self.grid[row][col] != 0:
-                    self.pre_filled[row][col] = True
-    
-    def get_input(self):
+    async def get_input(self):
         """Get and validate user input for Sudoku moves."""
         while True:
-            choice = input("Enter Move: ").strip().lower()
+            choice = (await self.ask("Enter Move: ")).strip().lower()
 
             command = self._parse_exit_or_hint(choice)
             if command:
@@ -198,7 +202,7 @@ class Sudoku(MinigameStrategy):
             if command:
                 return command
 
-            print(red("Invalid input. Please try again.\n"))
+            self.say(red("Invalid input. Please try again.\n"))
 
     def _parse_exit_or_hint(self, choice):
         """Check if input is an exit or hint command."""
@@ -206,6 +210,8 @@ class Sudoku(MinigameStrategy):
             return 'exit', None
         if choice == 'hint':
             return 'hint', None
+        if choice == 'check':
+            return 'check', None
         return None
 
     def _parse_clear(self, choice):
@@ -215,17 +221,17 @@ class Sudoku(MinigameStrategy):
 
         parts = choice.split()
         if len(parts) != 2:
-            print(red("Invalid clear command. Use format: 'clear 11'.\n"))
+            self.say(red("Invalid clear command. Use format: 'clear 11'.\n"))
             return None
 
         position = parts[1]
         if len(position) != 2 or not position.isdigit():
-            print(red("Invalid clear command. Use format: 'clear 11'.\n"))
+            self.say(red("Invalid clear command. Use format: 'clear 11'.\n"))
             return None
 
         row, col = int(position[0]) - 1, int(position[1]) - 1
         if self.pre_filled[row][col]:
-            print(red('Cannot clear a pre-filled cell!\n'))
+            self.say(red('Cannot clear a pre-filled cell!\n'))
             return None
 
         return 'clear', (row, col)
@@ -234,43 +240,52 @@ class Sudoku(MinigameStrategy):
         """Parse a move input and validate it."""
         parts = choice.replace(',', '').split()
         if len(parts) != 2:
-            print(red('Invalid input. Use format: 11 5 (col)(row) (value)\n'))
+            self.say(red('Invalid input. Use format: 11 5 (col)(row) (value)\n'))
             return None
 
         position, number_str = parts
         if len(position) != 2 or not position.isdigit():
-            print(red("Invalid position. Use format like 11, 23, etc.\n"))
+            self.say(red("Invalid position. Use format like 11, 23, etc.\n"))
             return None
 
         try:
             number = int(number_str)
             if number < 1 or number > 9:
-                print(red('Number must be between 1 and 9.\n'))
+                self.say(red('Number must be between 1 and 9.\n'))
                 return None
         except ValueError:
-            print(red('Invalid number. Please enter a number between 1 and 9.\n'))
+            self.say(red('Invalid number. Please enter a number between 1 and 9.\n'))
             return None
 
         row, col = int(position[0]) - 1, int(position[1]) - 1
         return 'move', (row, col, number)
     
     def get_hint(self):
-        empty_cells = [(r, c) for r in range(9) for c in range(9) if self.grid[r][c] == 0]
-        if empty_cells:
-            row, col = choice(empty_cells)
-            temp_grid = [row[:] for row in self.grid]
-            self.solve_sudoku(temp_grid)
+        """Point out a wrong cell if there is one, otherwise reveal a random empty cell."""
+        if self._wrong:
+            pos = next(iter(self._wrong))
+            row, col = divmod(pos, 9)
+            self.coins -= 15
+            return f"{self.grid[row][col]} at col-{row + 1} row-{col + 1} is wrong, it should be {self.solution[pos]}."
+        if self._empty:
+            pos = choice(self._empty)
+            row, col = divmod(pos, 9)
             self.coins -= 15
-            return f"Try placing {temp_grid[row][col]} at col-{row + 1} row-{col + 1}."
+            return f"Try placing {self.solution[pos]} at col-{row + 1} row-{col + 1}."
         return "No hints available - puzzle is complete!"
     
     def _handle_hint_action(self):
         hint = self.get_hint()
-        print(blue(f"\n 💡 Hint: {hint}\n"))
+        self.say(blue(f"\n 💡 Hint: {hint}\n"))
+        return True
+
+    def _handle_check_action(self):
+        correct, wrong, empty = self.progress()
+        self.say(blue(f"\nCorrect: {correct}  Wrong: {wrong}  Empty: {empty}\n"))
         return True
 
     def _handle_exit_action(self):
-        print(yellow("\nYou exited."))
+        self.say(yellow("\nYou exited."))
         return False
 
     def _handle_clear_action(self, data):
@@ -278,11 +293,11 @@ class Sudoku(MinigameStrategy):
         row, col = data
 
         if self.grid[row][col] != 0:
-            self.grid[row][col] = 0
-            print(green(f"\nCleared col-{col + 1} row-{row + 1}."))
+            self._set_cell(row, col, 0)
+            self.say(green(f"\nCleared col-{col + 1} row-{row + 1}."))
             self.print_grid()
         else:
-            print(red("Cell is already empty!\n"))
+            self.say(red("Cell is already empty!\n"))
 
         return True
     
@@ -290,73 +305,67 @@ class Sudoku(MinigameStrategy):
         """Handle placing a number. Returns True if game won, False if lost, None to continue."""
         row, col, num = data
         if self.pre_filled[row][col]:
-            print(red(f"Cell {col + 1}{row + 1} is pre-filled with {self.grid[row][col]}. Try a different cell.\n"))
+            self.say(red(f"Cell {col + 1}{row + 1} is pre-filled with {self.grid[row][col]}. Try a different cell.\n"))
             return True, False
 
-        temp_value = self.grid[row][col]
-        self.grid[row][col] = 0
-
-        if self.is_valid(self.grid, row, col, num):
+        if self.can_place(row, col, num):
             return self._handle_valid_move(row, col, num)
-
-        elif not self.is_valid(self.grid, row, col, num):
-            return self._handle_invalid_move(row, col, num, temp_value)
+        return self._handle_invalid_move(row, col, num)
 
     def _handle_valid_move(self, row, col, num):
         """Handle a valid move placement."""
-        self.grid[row][col] = num
-        print(green(f"\nPlaced {num} at col-{col + 1} row-{row+1}."))
+        self._set_cell(row, col, num)
+        self.say(green(f"\nPlaced {num} at col-{col + 1} row-{row+1}."))
         self.print_grid()
 
-        if all(self.grid[row][col] != 0 for row in range(9) for col in range(9)):
+        if not self._empty:
             self.end_time = time.time()
             return False, True
         
         return True, False
 
-    def _handle_invalid_move(self, row, col, num, temp_value):
+    def _handle_invalid_move(self, row, col, num):
         """Handle an invalid move (reduces tries)."""
-        self.grid[row][col] = temp_value
         if self.tries > 1:
-            print(red(f"Invalid move! {num} can't go in col-{col + 1} row-{row + 1} (conflicts with existing numbers).\n"))
+            self.say(red(f"Invalid move! {num} can't go in col-{col + 1} row-{row + 1} (conflicts with existing numbers).\n"))
             self.tries -= 1
             return True, False
         else:
-            print(red("You have exceeded 3 tries! Game Over! ❌\n"))
+            self.say(red("You have exceeded 3 tries! Game Over! ❌\n"))
             self.end_time = time.time()
             return False, False
     
-    def build_game(self):
+    async def build_game(self):
         """Main game loop."""
 
         difficulty_map = {1: "easy", 2: "medium", 3: "hard", 4: "expert"}
         difficulty = difficulty_map[self.difficulty]
-        print(f"\nStarting '{difficulty.capitalize()}' level puzzle...")
+        self.say(f"\nStarting '{difficulty.capitalize()}' level puzzle...")
         self.generate_sudoku()
-        solution = [row[:] for row in self.grid]
-        self.solve_sudoku(solution)
 
-        print("\nInstructions:")
-        print("- Enter moves as 'column-row number' (e.g., '11 5')")
-        print("- Type 'hint' for a suggestion")
-        print("- Type 'clear 11' to clear a cell")
-        print("- Type 'q', 'quit', or 'exit' to quit")
+        self.say("\nInstructions:")
+        self.say("- Enter moves as 'column-row number' (e.g., '11 5')")
+        self.say("- Type 'hint' for a suggestion")
+        self.say("- Type 'check' to count correct and wrong cells")
+        self.say("- Type 'clear 11' to clear a cell")
+        self.say("- Type 'q', 'quit', or 'exit' to quit")
 
         self.print_grid()
         self.start_time = time.time()
 
         while True:
-            print(yellow(f"Tries remaining: ({self.tries}/3)"))
-            action, data = self.get_input()
+            self.say(yellow(f"Tries remaining: ({self.tries}/3)"))
+            action, data = await self.get_input()
             handler = {
                 'exit': self._handle_exit_action,
                 'hint': self._handle_hint_action,
+                'check': self._handle_check_action,
                 'clear': self._handle_clear_action,
                 'move': self._handle_move_action,
             }.get(action)
         
             if handler is None:
-                print(red("Invalid action!"))
+                self.say(red("Invalid action!"))
                 continue
             
             if action == 'move':
@@ -385,24 +394,15 @@ class Sudoku(MinigameStrategy):
         elapsed = result.get("elapsed")
         if outcome == "Win":
             pet_happiness = 15
-            print("\nYou solved the sudoku! 🎉")
+            self.say("\nYou solved the sudoku! 🎉")
         else:
             self.coins -= 50
             pet_happiness = 0
-            print("\nYou failed to solve the sudoku.. 😾")
+            self.say("\nYou failed to solve the sudoku.. 😾")
         
-        print(f"Elapsed time: {elapsed:.2f}s")
-        print(f"Reward: Rp. {'{:,}'.format(self.coins * 1000)}. Pet happiness (+{pet_happiness})")
-        print(green(f"You received Rp. {'{:,}'.format(self.coins * 1000)} 🎉"))
+        self.say(f"Elapsed time: {elapsed:.2f}s")
+        self.say(f"Reward: Rp. {'{:,}'.format(self.coins * 1000)}. Pet happiness (+{pet_happiness})")
+        self.say(green(f"You received Rp. {'{:,}'.format(self.coins * 1000)} 🎉"))
         return {"currency": self.coins, "pet_happiness": pet_happiness}
 
-    def play(self, player, pet):
-        """Run an entire Sudoku game and return rewards."""
-        self.setup(player, pet)
-        self.display_menu()
-        self.build_question()
-        summary = self.build_game()
-        result = self.evaluate(summary)
-        reward = self.reward(result)
-        return reward
  
\ No newline at end of file
@@ -0,0 +1,192 @@
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+from constants.configs import SUDOKU_CELLS_REMOVED, SUDOKU_BANK_LOW_WATER, SUDOKU_BANK_TARGET
+from .sudokuEngine import SIZE, generate_puzzle
+
+"""
+sudokuBank.py
+
+Singleton PuzzleBank: a pool of pre-generated, uniqueness-checked Sudoku puzzles per
+difficulty, so Sudoku.generate_sudoku can pop one instantly instead of generating on the spot.
+
+Design notes:
+- One file per difficulty, `saves/sudoku_bank/removed_<cells removed>.bin`, made of fixed
+  81-byte records (one byte per cell, 0 = empty). Only puzzles are stored: their solution is
+  unique and the engine solves one in a couple of milliseconds.
+- pop() takes the last record and truncates the file, so popping is O(1) and appending new
+  puzzles never rewrites old ones. A torn trailing record (crash mid-append) is dropped.
+- When a pool falls below SUDOKU_BANK_LOW_WATER after a pop, a daemon thread refills it up to
+  SUDOKU_BANK_TARGET. An empty pool just means the caller generates synchronously.
+- The bank is process-local: one lock guards all files. Bulk filling from the command line
+  (`python -m features.minigame.sudokuBank`) generates in parallel worker processes and
+  appends from the parent, so it should not run alongside a game writing the same directory.
+"""
+
+RECORD_SIZE = SIZE
+
+
+def encode_puzzle(puzzle: Sequence[int]) -> bytes:
+    """Pack a flat 81-cell puzzle into one record."""
+    if len(puzzle) != RECORD_SIZE:
+        raise ValueError("a Sudoku puzzle has 81 cells")
+    return bytes(puzzle)
+
+
+def decode_puzzle(record: bytes) -> List[int]:
+    """Unpack one record into a flat list of 81 ints."""
+    if len(record) != RECORD_SIZE or max(record) > 9:
+        raise ValueError("corrupt Sudoku bank record")
+    return list(record)
+
+
+def _generate_batch(cell_removed: int, count: int, seed: int) -> bytes:
+    """Worker-process entry point: generate count puzzles and return them as records."""
+    rng = random.Random(seed)
+    return b"".join(encode_puzzle(generate_puzzle(cell_removed, rng)[0]) for _ in range(count))
+
+
+class PuzzleBank:
+    """Singleton store of pre-generated Sudoku puzzles, one pool per cells-removed level."""
+
+    _instance: Optional["PuzzleBank"] = None
+
+    def __init__(self, directory: Union[str, Path] = Path("saves") / "sudoku_bank",
+                 low_water: int = SUDOKU_BANK_LOW_WATER, target: int = SUDOKU_BANK_TARGET):
+        """
+        Create a bank rooted at directory.
+
+        Args:
+            low_water: refill a pool in the background once it holds fewer puzzles than this.
+            target: number of puzzles a background refill tops a pool up to.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.low_water = low_water
+        self.target = target
+        self._lock = threading.Lock()
+        self._refills: Dict[int, threading.Thread] = {}
+        self._stopping = threading.Event()
+
+    @classmethod
+    def get_instance(cls) -> "PuzzleBank":
+        """Return the global PuzzleBank singleton instance, creating it if necessary."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def path(self, cell_removed: int) -> Path:
+        """File holding the pool for one difficulty."""
+        return self.directory / f"removed_{cell_removed}.bin"
+
+    def count(self, cell_removed: int) -> int:
+        """Number of complete puzzles in a pool."""
+        try:
+            return self.path(cell_removed).stat().st_size // RECORD_SIZE
+        except FileNotFoundError:
+            return 0
+
+    # === Pool access ===
+    def add(self, cell_removed: int, puzzles: Iterable[Sequence[int]]) -> int:
+        """Append puzzles to a pool; returns how many were added."""
+        data = b"".join(encode_puzzle(puzzle) for puzzle in puzzles)
+        self._append(cell_removed, data)
+        return len(data) // RECORD_SIZE
+
+    def _append(self, cell_removed: int, data: bytes) -> None:
+        with self._lock:
+            with open(self.path(cell_removed), "ab") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size % RECORD_SIZE:
+                    f.truncate(size - size % RECORD_SIZE)
+                f.write(data)
+
+    def pop(self, cell_removed: int, refill: bool = True) -> Optional[List[int]]:
+        """Remove and return one puzzle (flat 81 ints), or None if the pool is empty.
+
+        Corrupt records are discarded. Unless refill is False, a pool left below the low-water
+        mark is topped up in the background.
+        """
+        puzzle = None
+        with self._lock:
+            try:
+                with open(self.path(cell_removed), "r+b") as f:
+                    records = f.seek(0, os.SEEK_END) // RECORD_SIZE
+                    while records and puzzle is None:
+                        records -= 1
+                        f.seek(records * RECORD_SIZE)
+                        try:
+                            puzzle = decode_puzzle(f.read(RECORD_SIZE))
+                        except ValueError:
+                            pass
+                    f.truncate(records * RECORD_SIZE)
+            except FileNotFoundError:
+                pass
+
+        if refill:
+            self.request_refill(cell_removed)
+        return puzzle
+
+    # === Background refill ===
+    def request_refill(self, cell_removed: int) -> Optional[threading.Thread]:
+        """Start a background refill for a pool below the low-water mark (one per pool)."""
+        if self.count(cell_removed) >= self.low_water or self._stopping.is_set():
+            return None
+        with self._lock:
+            thread = self._refills.get(cell_removed)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=self._refill, args=(cell_removed,),
+                                          name=f"sudoku-bank-{cell_removed}", daemon=True)
+                self._refills[cell_removed] = thread
+                thread.start()
+        return thread
+
+    def _refill(self, cell_removed: int) -> None:
+        rng = random.Random()
+        while not self._stopping.is_set() and self.count(cell_removed) < self.target:
+            self._append(cell_removed, encode_puzzle(generate_puzzle(cell_removed, rng)[0]))
+
+    def stop(self) -> None:
+        """Stop background refills and wait for them to finish their current puzzle."""
+        self._stopping.set()
+        for thread in list(self._refills.values()):
+            thread.join()
+        if PuzzleBank._instance is self:
+            PuzzleBank._instance = None
+
+    # === Bulk generation ===
+    def fill(self, cell_removed: int, count: int, workers: Optional[int] = None, chunk: int = 25) -> int:
+        """Generate count puzzles in parallel worker processes and append them to a pool."""
+        workers = workers or os.cpu_count() or 1
+        sizes = [min(chunk, count - start) for start in range(0, count, chunk)]
+        seeds = [random.randrange(2 ** 63) for _ in sizes]
+        added = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for data in pool.map(_generate_batch, [cell_removed] * len(sizes), sizes, seeds):
+                self._append(cell_removed, data)
+                added += len(data) // RECORD_SIZE
+        return added
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    levels = {"easy": 1, "medium": 2, "hard": 3, "expert": 4}
+    parser = argparse.ArgumentParser(description="Bulk-generate Sudoku puzzles into the puzzle bank.")
+    parser.add_argument("count", type=int, help="puzzles to generate per level")
+    parser.add_argument("--levels", nargs="+", choices=levels, default=list(levels))
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (defaults to CPU count)")
+    parser.add_argument("--directory", default=Path("saves") / "sudoku_bank")
+    args = parser.parse_args()
+
+    bank = PuzzleBank(args.directory)
+    for level in args.levels:
+        removed = SUDOKU_CELLS_REMOVED[levels[level]]
+        started = time.perf_counter()
+        added = bank.fill(removed, args.count, args.workers)
+        print(f"{level:<7} +{added} puzzles in {time.perf_counter() - started:.2f}s "
+              f"({bank.count(removed)} banked)")
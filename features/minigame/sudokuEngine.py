@@ -0,0 +1,213 @@
+import random
+from typing import List, Optional, Sequence
+
+"""
+sudokuEngine.py
+
+Bitmask constraint-propagation Sudoku solver and unique-solution puzzle generator.
+
+The board is a flat list of 81 ints (0 = empty). Digits used in each row, column and 3x3 box
+are kept as 9-bit masks (bit d-1 set = digit d used), so the candidates of a cell are one
+OR and a NOT instead of a 27-cell scan.
+
+Search (SudokuEngine._search):
+    - pick the most constrained empty cell (fewest candidates); a cell with a single
+      candidate is placed without branching (naked single), a cell with none fails the branch
+    - branch over the candidates of that cell, optionally in random order
+    - stop as soon as `limit` solutions are found; limit=2 answers "is it unique?"
+
+generate_puzzle() fills an empty board by a randomised solve, then removes cells in random
+order, putting a cell back whenever its removal would allow a second solution (checked by
+has_alternative: try each other candidate for the removed cell and look for one completion). If the
+requested number of removals cannot be reached with a unique solution (Sudoku needs at
+least 17 clues, and greedy removal usually stops around 22-26), the puzzle keeps as many
+removals as it could.
+"""
+
+SIZE = 81
+ALL_DIGITS = 0x1FF
+
+ROW_OF = tuple(pos // 9 for pos in range(SIZE))
+COL_OF = tuple(pos % 9 for pos in range(SIZE))
+BOX_OF = tuple((pos // 27) * 3 + (pos % 9) // 3 for pos in range(SIZE))
+POPCOUNT = tuple(bin(mask).count("1") for mask in range(ALL_DIGITS + 1))
+# mask -> digits whose bits are set, ascending
+DIGITS = tuple(tuple(d for d in range(1, 10) if mask >> (d - 1) & 1) for mask in range(ALL_DIGITS + 1))
+
+
+class SudokuEngine:
+    """Solver state for one board: flat cells plus row/column/box digit masks."""
+
+    __slots__ = ("cells", "rows", "cols", "boxes", "rng", "solution")
+
+    def __init__(self, board: Sequence, rng: Optional[random.Random] = None):
+        """Load a board given as 9 rows of 9 ints or a flat sequence of 81 ints.
+
+        Raises ValueError if the board has the wrong shape, a value outside 0-9, or a
+        digit repeated in a row, column or box.
+        """
+        cells = [value for row in board for value in row] if len(board) == 9 else list(board)
+        if len(cells) != SIZE:
+            raise ValueError("a Sudoku board has 81 cells")
+
+        self.cells = cells
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.rng = rng
+        self.solution: Optional[List[int]] = None
+
+        for pos, value in enumerate(cells):
+            if value == 0:
+                continue
+            if not 1 <= value <= 9:
+                raise ValueError(f"invalid Sudoku value {value!r} at cell {pos}")
+            bit = 1 << (value - 1)
+            if (self.rows[ROW_OF[pos]] | self.cols[COL_OF[pos]] | self.boxes[BOX_OF[pos]]) & bit:
+                raise ValueError(f"duplicate {value} at cell {pos}")
+            self.rows[ROW_OF[pos]] |= bit
+            self.cols[COL_OF[pos]] |= bit
+            self.boxes[BOX_OF[pos]] |= bit
+
+    def candidates(self, pos: int) -> int:
+        """Bitmask of digits that can legally go in cell pos."""
+        return ~(self.rows[ROW_OF[pos]] | self.cols[COL_OF[pos]] | self.boxes[BOX_OF[pos]]) & ALL_DIGITS
+
+    def solve(self) -> bool:
+        """Find one solution and store it in self.solution (the cells are left untouched)."""
+        self.solution = None
+        empties = [pos for pos in range(SIZE) if self.cells[pos] == 0]
+        return self._search(empties, 1) == 1
+
+    def count_solutions(self, limit: int = 2) -> int:
+        """Count solutions, stopping at limit; the first one found is kept in self.solution."""
+        self.solution = None
+        empties = [pos for pos in range(SIZE) if self.cells[pos] == 0]
+        return self._search(empties, limit)
+
+    def has_alternative(self, pos: int, value: int) -> bool:
+        """True if the empty cell pos can hold a digit other than value in some solution.
+
+        For a board known to have a solution with value at pos, this is "more than one
+        solution", but each probe only needs to find a single completion.
+        """
+        empties = [p for p in range(SIZE) if self.cells[p] == 0 and p != pos]
+        for digit in DIGITS[self.candidates(pos)]:
+            if digit == value:
+                continue
+            self.place(pos, digit)
+            found = self._search(empties, 1)
+            self.remove(pos)
+            if found:
+                return True
+        return False
+
+    def _search(self, empties: List[int], limit: int) -> int:
+        cells, rows, cols, boxes = self.cells, self.rows, self.cols, self.boxes
+
+        best_i, best_n, best_free = -1, 10, 0
+        for i, pos in enumerate(empties):
+            free = ~(rows[ROW_OF[pos]] | cols[COL_OF[pos]] | boxes[BOX_OF[pos]]) & ALL_DIGITS
+            n = POPCOUNT[free]
+            if n < best_n:
+                best_i, best_n, best_free = i, n, free
+                if n <= 1:
+                    break
+
+        if best_i < 0:
+            if self.solution is None:
+                self.solution = cells[:]
+            return 1
+        if best_n == 0:
+            return 0
+
+        pos = empties[best_i]
+        rest = empties[:best_i] + empties[best_i + 1:]
+        r, c, b = ROW_OF[pos], COL_OF[pos], BOX_OF[pos]
+        digits = DIGITS[best_free]
+        if self.rng is not None and best_n > 1:
+            digits = list(digits)
+            self.rng.shuffle(digits)
+
+        found = 0
+        for digit in digits:
+            bit = 1 << (digit - 1)
+            cells[pos] = digit
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            found += self._search(rest, limit - found)
+            cells[pos] = 0
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            if found >= limit:
+                break
+        return found
+
+    def remove(self, pos: int) -> int:
+        """Empty cell pos and return the digit it held."""
+        value = self.cells[pos]
+        if value:
+            bit = ~(1 << (value - 1))
+            self.rows[ROW_OF[pos]] &= bit
+            self.cols[COL_OF[pos]] &= bit
+            self.boxes[BOX_OF[pos]] &= bit
+            self.cells[pos] = 0
+        return value
+
+    def place(self, pos: int, value: int) -> None:
+        """Put value in the empty cell pos (no legality check)."""
+        bit = 1 << (value - 1)
+        self.rows[ROW_OF[pos]] |= bit
+        self.cols[COL_OF[pos]] |= bit
+        self.boxes[BOX_OF[pos]] |= bit
+        self.cells[pos] = value
+
+
+def generate_puzzle(cell_removed: int, rng: Optional[random.Random] = None):
+    """Return (puzzle, solution) as flat 81-int lists; the puzzle has exactly one solution.
+
+    Up to cell_removed cells are emptied; fewer if uniqueness cannot be kept (see module notes).
+    """
+    rng = rng or random.Random()
+    engine = SudokuEngine([0] * SIZE, rng)
+    engine.solve()
+    solution = engine.solution
+
+    engine = SudokuEngine(solution)
+    positions = list(range(SIZE))
+    rng.shuffle(positions)
+    removed = 0
+    for pos in positions:
+        if removed >= cell_removed:
+            break
+        value = engine.remove(pos)
+        if engine.has_alternative(pos, value):
+            engine.place(pos, value)
+        else:
+            removed += 1
+    return engine.cells[:], solution
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Benchmark puzzle generation across difficulties.")
+    parser.add_argument("-n", "--count", type=int, default=50, help="puzzles per difficulty")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    bench_rng = random.Random(args.seed)
+    for level, removed in (("easy", 35), ("medium", 45), ("hard", 55), ("expert", 65)):
+        timings, clues = [], []
+        for _ in range(args.count):
+            started = time.perf_counter()
+            puzzle, _ = generate_puzzle(removed, bench_rng)
+            timings.append((time.perf_counter() - started) * 1000)
+            clues.append(SIZE - puzzle.count(0))
+        timings.sort()
+        print(f"{level:<7} median {timings[len(timings) // 2]:6.1f} ms  "
+              f"p90 {timings[int(len(timings) * 0.9)]:6.1f} ms  "
+              f"clues {min(clues)}-{max(clues)}")
@@ -1,8 +1,12 @@
 from .baseClass import MinigameStrategy
+from .tetrisBoard import Bitboard, piece_state
+from .tetrisRender import TetrisRenderer
 from typing import Dict
 import curses
+import math
 import time
-from random import choice
+from collections import deque
+from random import Random
 import logging
 from utils.colorize import green, yellow
 from constants.configs import LINE
@@ -28,146 +32,103 @@ class Tetris(MinigameStrategy):
     WIDTH = 10
     HEIGHT = 20
 
-    def setup(self, player, pet):
+    MAX_GRAVITY_STEPS = 5  # gravity steps one wake-up may catch up after a stall
+    clock = staticmethod(time.monotonic)
+
+    def setup(self, player, pet, seed=None):
+        """Reset the game; a seed makes the piece sequence reproducible (headless runs)."""
         self.player = player
         self.pet = pet
-        self.board = [[0] * Tetris.WIDTH for _ in range(Tetris.HEIGHT)]
-        self.current_piece = choice(Tetris.SHAPES)
-        self.next_piece = choice(Tetris.SHAPES)
+        self.rng = Random(seed)
+        self.grid = Bitboard(Tetris.WIDTH, Tetris.HEIGHT)
+        self.current_piece = self.rng.choice(Tetris.SHAPES)
+        self.next_piece = self.rng.choice(Tetris.SHAPES)
         self.piece_offset = [0, Tetris.WIDTH // 2 - len(self.current_piece[0]) // 2]
         self.score = 0
         self.speed = 0.8
-        self.next_drop = time.time() + self.speed
+        self.gravity_time = 0.0
+        self.stalls = 0
+        self.input_latencies = deque(maxlen=1000)
         self.stdscr = None
+        self.renderer = TetrisRenderer()
         self.game_over = False
         self.lines_cleared = 0
         self.difficulty = 1
     
+    @property
+    def board(self):
+        """Live board[y][x] view over the bitboard (assigning a list-of-lists replaces it)."""
+        return self.grid.view()
+
+    @board.setter
+    def board(self, rows):
+        self.grid = Bitboard.from_rows(rows)
+
+    @property
+    def current_piece(self):
+        """The falling piece's cells in its current rotation (shared, do not mutate)."""
+        return self.piece.cells
+
+    @current_piece.setter
+    def current_piece(self, shape):
+        self.piece = piece_state(shape)
+
     @staticmethod
     def rotate(shape):
         """Rotate a shape 90 degrees clockwise."""
-        return [list(row) for row in zip(*shape[::-1])]
+        return [row[:] for row in piece_state(shape).next.cells]
     
     def check_collision(self, shape, offset):
         """Check if a shape collides with the board or boundaries."""
-        off_y, off_x = offset
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                by = y + off_y
-                bx = x + off_x
-                if cell and (bx < 0 or bx >= Tetris.WIDTH or by >= Tetris.HEIGHT or (by >= 0 and self.board[by][bx])):
-                    return True
-        return False
+        return self.grid.collides(piece_state(shape), offset[0], offset[1])
 
     def merge(self):
         """Merge the current piece into the board."""
-        off_y, off_x = self.piece_offset 
-        for y, row in enumerate(self.current_piece):
-            for x, cell in enumerate(row):
-                by = y + off_y
-                bx = x + off_x
-                if cell and 0 <= by < Tetris.HEIGHT and 0 <= bx < Tetris.WIDTH:
-                    self.board[by][bx] = 1
+        self.grid.merge(self.piece, self.piece_offset[0], self.piece_offset[1])
     
     def remove_full_lines(self):
         """Remove completed lines and return number cleared."""
-        new_board = [row for row in self.board if any(cell == 0 for cell in row)]
-        lines_cleared = Tetris.HEIGHT - len(new_board)
-        new_board = [[0] * Tetris.WIDTH for _ in range(lines_cleared)] + new_board
-        self.board = new_board
-        return lines_cleared
+        return self.grid.clear_full_lines()
 
-    @staticmethod
-    def display_menu():
+    def display_menu(self):
         """Show a description and choices to the player."""
-        print("\n" + LINE)
-        print("🟨 Tetris ⬜")
-        print(LINE)
-        print("Play this classic block-stacking game with your pet!")
-        print("\nControls:")
-        print("← → : Move left/right")
-        print("↑   : Rotate piece")
-        print("↓   : Soft drop")
-        print("Q   : Quit game")
-        print("\nObjective:")
-        print("- Clear lines by filling horizontal rows")
-        print("- Each line cleared gives 100 points")
-        print("- Game gets faster as you clear more lines")
-        print("- Game ends when blocks stack to the top")
-        print(LINE)
+        self.say("\n" + LINE)
+        self.say("🟨 Tetris ⬜")
+        self.say(LINE)
+        self.say("Play this classic block-stacking game with your pet!")
+        self.say("\nControls:")
+        self.say("← → : Move left/right")
+        self.say("↑   : Rotate piece")
+        self.say("↓   : Soft drop")
+        self.say("Q   : Quit game")
+        self.say("\nObjective:")
+        self.say("- Clear lines by filling horizontal rows")
+        self.say("- Each line cleared gives 100 points")
+        self.say("- Game gets faster as you clear more lines")
+        self.say("- Game ends when blocks stack to the top")
+        self.say(LINE)
     
-    def get_input(self):
+    async def get_input(self):
         """Collect any initial input from the player."""
-        choice = input(yellow("\nPress Enter to start the game...")).strip().lower()
+        choice = (await self.ask(yellow("\nPress Enter to start the game..."))).strip().lower()
         return choice
     
     def draw_board(self, win):
-        """Draw the game board, current piece, and score."""
-        win.clear()
-        height, width = win.getmaxyx()
-
-        grid_x = max(2, (width - Tetris.WIDTH * 2) // 2)
-        grid_y = max(1, (height - Tetris.HEIGHT) // 2)
-
-        self._draw_frame(win, grid_x, grid_y)
-        self._draw_board_cells(win, grid_x, grid_y)
-        self._draw_piece(win, self.current_piece, self.piece_offset, grid_x, grid_y)
-        self._draw_ui(win, grid_x, grid_y)
-
-        win.refresh()
-
-
-    def _draw_frame(self, win, grid_x, grid_y):
-        """Draw the board frame (borders)."""
-        for y in range(Tetris.HEIGHT + 2):
-            for x in range(Tetris.WIDTH * 2 + 2):
-                char = " "
-                if y == 0 or y == Tetris.HEIGHT + 1:
-                    char = "-"
-                elif x == 0 or x == Tetris.WIDTH * 2 + 1:
-                    char = "|"
-                win.addstr(grid_y + y, grid_x + x, char)
-
-
-    def _draw_board_cells(self, win, grid_x, grid_y):
-        """Draw the placed blocks on the board."""
-        for y, row in enumerate(self.board):
-            for x, cell in enumerate(row):
-                if cell:
-                    win.addstr(grid_y + 1 + y, grid_x + 1 + x * 2, '[]')
-
-
-    def _draw_piece(self, win, piece, offset, grid_x, grid_y):
-        """Draw a piece at a given offset."""
-        for y, row in enumerate(piece):
-            for x, cell in enumerate(row):
-                by = y + offset[0]
-                bx = x + offset[1]
-                if cell and 0 <= by < Tetris.HEIGHT and 0 <= bx < Tetris.WIDTH:
-                    win.addstr(grid_y + 1 + by, grid_x + 1 + bx * 2, '[]')
-
-
-    def _draw_ui(self, win, grid_x, grid_y):
-        """Draw score and next piece preview."""
-        win.addstr(grid_y, grid_x + Tetris.WIDTH * 2 + 4, f"Score: {self.score}")
-        win.addstr(grid_y + 2, grid_x + Tetris.WIDTH * 2 + 4, "Next:")
-        for y, row in enumerate(self.next_piece):
-            for x, cell in enumerate(row):
-                if cell:
-                    win.addstr(grid_y + 3 + y, grid_x + Tetris.WIDTH * 2 + 4 + x * 2, "[]")
+        """Draw the game board, current piece, and score (only the parts that changed)."""
+        return self.renderer.render(win, self)
 
     
-    def build_question(self):
+    async def build_question(self):
         """Collect difficulty choice before starting the game."""
 
-        print("\nSelect Difficulty Level:")
-        print("1. Easy (Slow speed)")
-        print("2. Medium (Normal speed)")
-        print("3. Hard (Fast speed)")
-        print("4. Expert (Very fast)")
-        print(LINE)
+        self.say("\nSelect Difficulty Level:")
+        self.say("1. Easy (Slow speed)")
+        self.say("2. Medium (Normal speed)")
+        self.say("3. Hard (Fast speed)")
+        self.say("4. Expert (Very fast)")
+        self.say(LINE)
         try:
-            diff = int(input("Choose your difficulty (1/2/3/4): ").strip())
+            diff = int((await self.ask("Choose your difficulty (1/2/3/4): ")).strip())
         except ValueError:
             diff = 1
         if diff not in range(1, 5):
@@ -194,7 +155,7 @@ class Tetris(MinigameStrategy):
         elif key == curses.KEY_UP:
             self._try_rotate()
         elif key == curses.KEY_DOWN:
-            self._try_drop()
+            self._handle_drop()
 
         return 'continue'
 
@@ -202,66 +163,95 @@ class Tetris(MinigameStrategy):
     def _try_move(self, d_row, d_col):
         """Attempt to move the piece by (d_row, d_col) if no collision."""
         new_offset = [self.piece_offset[0] + d_row, self.piece_offset[1] + d_col]
-        if not self.check_collision(self.current_piece, new_offset):
+        if not self.grid.collides(self.piece, new_offset[0], new_offset[1]):
             self.piece_offset = new_offset
 
 
     def _try_rotate(self):
         """Attempt to rotate the current piece if no collision."""
-        rotated = self.rotate(self.current_piece)
-        if not self.check_collision(rotated, self.piece_offset):
-            self.current_piece = rotated
-
-
-    def _try_drop(self):
-        """Attempt to move the piece down; if blocked, merge and spawn next piece."""
-        new_offset = [self.piece_offset[0] + 1, self.piece_offset[1]]
-        if not self.check_collision(self.current_piece, new_offset):
-            self.piece_offset = new_offset
-        else:
-            self.merge()
-            cleared = self.remove_full_lines()
-            self.score += cleared * 100
-            if cleared:
-                self.speed = max(0.1, self.speed - 0.02)
-
-            self._spawn_next_piece()
-
-            if self.check_collision(self.current_piece, self.piece_offset):
-                self.game_over = True
+        rotated = self.piece.next
+        if not self.grid.collides(rotated, self.piece_offset[0], self.piece_offset[1]):
+            self.piece = rotated
 
 
     def _spawn_next_piece(self):
         """Spawn the next piece at the top of the board."""
         self.current_piece = self.next_piece
-        self.next_piece = choice(Tetris.SHAPES)
+        self.next_piece = self.rng.choice(Tetris.SHAPES)
         self.piece_offset = [0, Tetris.WIDTH // 2 - len(self.current_piece[0]) // 2]
 
 
     def game_loop(self, stdscr):
-        """Main game loop using curses."""
+        """Main game loop: block in getch until a key arrives or the next gravity step is due."""
         curses.curs_set(0)
-        stdscr.nodelay(True)
-        stdscr.timeout(100)
 
-        next_drop = time.time() + self.speed
+        self.gravity_time = 0.0
+        self.draw_board(stdscr)
+        previous = self.clock()
 
         while not self.game_over:
-            current_time = time.time()
+            # Sleep in curses until the gravity deadline: no wake-ups while nothing changes
+            wait_ms = math.ceil(max(0.0, self.speed - self.gravity_time) * 1000)
+            stdscr.timeout(max(1, wait_ms))
             key = stdscr.getch()
+            now = self.clock()
+            if not self._run_frame(stdscr, now - previous, key):
+                break
+            previous = now
 
-            if key != -1:
-                if self._handle_key(key) == 'quit':
-                    break
+        logging.debug("Tetris renderer stats: %s, input latency: %s", self.renderer.stats(), self.input_latency())
+        self._display_game_over(stdscr)
+        return self.score
 
-            if current_time > next_drop:
-                next_drop = time.time() + self.speed
-                self._handle_drop()
 
+    def _run_frame(self, stdscr, elapsed, key=-1):
+        """Handle key and any keys queued behind it, advance gravity by elapsed seconds,
+        and render if anything moved.
+
+        Returns False if the player quit.
+        """
+        frame_start = self.clock()
+        handled = 0
+        if key != -1:
+            stdscr.timeout(0)
+        while key != -1 and not self.game_over:
+            if self._handle_key(key) == 'quit':
+                return False
+            handled += 1
+            key = stdscr.getch()
+
+        self.gravity_time += elapsed
+        steps = 0
+        while self.gravity_time >= self.speed and not self.game_over:
+            self.gravity_time -= self.speed
+            self._handle_drop()
+            steps += 1
+            if steps == Tetris.MAX_GRAVITY_STEPS:
+                # Stalled for several gravity periods: drop the backlog instead of bursting
+                self.gravity_time = 0.0
+                self.stalls += 1
+                break
+
+        if handled or steps:
             self.draw_board(stdscr)
+        if handled:
+            self.input_latencies.append(self.clock() - frame_start)
+        return True
 
-        self._display_game_over(stdscr)
-        return self.score
+
+    def input_latency(self):
+        """Key-to-screen latency in milliseconds over recent wake-ups that handled input.
+
+        getch returns as soon as a key arrives, so the latency is just the
+        drain-update-render time measured here.
+        """
+        samples = list(self.input_latencies)
+        worst = max(samples, default=0.0)
+        return {
+            "count": len(samples),
+            "mean_ms": sum(samples) * 1000 / len(samples) if samples else 0.0,
+            "max_ms": worst * 1000,
+        }
 
 
     def _handle_key(self, key):
@@ -273,9 +263,12 @@ class Tetris(MinigameStrategy):
 
 
     def _handle_drop(self):
-        """Handle automatic piece drop, collision, merging, and spawning new pieces."""
+        """Move the piece down one row; if blocked, lock it, clear lines and spawn the next piece.
+
+        This is the single drop path, shared by gravity and the soft-drop key.
+        """
         new_offset = [self.piece_offset[0] + 1, self.piece_offset[1]]
-        if not self.check_collision(self.current_piece, new_offset):
+        if not self.grid.collides(self.piece, new_offset[0], new_offset[1]):
             self.piece_offset = new_offset
         else:
             self.merge()
@@ -284,18 +277,11 @@ class Tetris(MinigameStrategy):
             self.score += cleared * 100
             if cleared:
                 self.speed = max(0.1, self.speed - 0.02)
-            self._spawn_new_piece()
-            if self.check_collision(self.current_piece, self.piece_offset):
+            self._spawn_next_piece()
+            if self.grid.collides(self.piece, self.piece_offset[0], self.piece_offset[1]):
                 self.game_over = True
 
 
-    def _spawn_new_piece(self):
-        """Spawn the next piece and reset its position."""
-        self.current_piece = self.next_piece
-        self.next_piece = choice(Tetris.SHAPES)
-        self.piece_offset = [0, Tetris.WIDTH // 2 - len(self.current_piece[0]) // 2]
-
-
     def _display_game_over(self, stdscr):
         """Display the game over screen."""
         if not self.game_over:
@@ -311,15 +297,17 @@ class Tetris(MinigameStrategy):
             logging.error(f"Unexpected error in game over screen: {e}", exc_info=True)
 
         stdscr.refresh()
-        stdscr.nodelay(False)
+        stdscr.timeout(-1)
         stdscr.getch()
 
 
-    def build_game(self):
+    async def build_game(self):
         """Run the interactive portion where the user provides moves."""
 
-        print("\nStarting Tetris...")
-        time.sleep(1)
+        self.say("\nStarting Tetris...")
+        await self.pause(1)
+        # curses owns the real terminal, so it runs on the main (loop) thread: Ctrl-C then
+        # unwinds through curses.wrapper, whose endwin() restores the terminal
         score = curses.wrapper(self.game_loop)
         return {
             "score": score,
@@ -348,27 +336,29 @@ class Tetris(MinigameStrategy):
         if passed:
             coins = 20 + (score // 100) * 5 + lines_cleared * 2
             pet_happiness = 10 + min(lines_cleared, 10) 
-            print(f"\n🎉 Great job! You cleared {lines_cleared} lines!")
+            self.say(f"\n🎉 Great job! You cleared {lines_cleared} lines!")
         else:
             coins = max(5, score // 50)  
             pet_happiness = 5
-            print("\n💪 Keep practicing! You'll get better!")
+            self.say("\n💪 Keep practicing! You'll get better!")
         
-        print(f"Reward: Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})")
-        print(green(f"You received Rp. {'{:,}'.format(coins * 1000)} 🎉"))
+        self.say(f"Reward: Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})")
+        self.say(green(f"You received Rp. {'{:,}'.format(coins * 1000)} 🎉"))
 
         return {"currency": coins, "pet_happiness": pet_happiness}
     
-    def play(self, player, pet):
-        self.setup(player, pet)
-        self.display_menu()
-        self.build_question()
-        choice = self.get_input()
-        if choice.lower() == 'q':
-            print("\nReturning to main menu...")
-            return {"currency": 0, "pet_happiness": 0}
-        
-        summary = self.build_game()
-        result = self.evaluate(summary)
-        reward = self.reward(result)
-        return reward
+    async def play_async(self, player, pet, input_source=None, output=None):
+        """Run the Tetris flow and return rewards (the game itself still needs a curses terminal)."""
+        with self.session(input_source, output):
+            self.setup(player, pet)
+            self.display_menu()
+            await self.build_question()
+            choice = await self.get_input()
+            if choice.lower() == 'q':
+                self.say("\nReturning to main menu...")
+                return {"currency": 0, "pet_happiness": 0}
+
+            summary = await self.build_game()
+            result = self.evaluate(summary)
+            reward = self.reward(result)
+            return reward
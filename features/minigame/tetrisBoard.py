@@ -0,0 +1,209 @@
+from typing import Dict, List, Sequence, Tuple
+
+"""
+tetrisBoard.py
+
+Bitboard storage for the Tetris minigame.
+
+The board is one int per row: bit x set means column x is filled. Every rotation state of a
+piece is precomputed once as a PieceState holding one mask per piece row, so:
+
+    collision   (rows[y] & (mask << x)) for each piece row, plus a width/floor bounds check
+    merge       rows[y] |= mask << x
+    line clear  drop every row equal to the full mask, pad with zeros at the top
+
+PieceStates are linked in a ring (`state.next` is the clockwise rotation), so rotating is a
+pointer hop instead of rebuilding lists. piece_state() maps any list-of-lists shape to its
+cached state, which keeps the old shape-based API working.
+
+BoardView/RowView expose the bitboard as the familiar `board[y][x]` list-of-lists, live and
+writable, for drawing code and callers that still index cells.
+"""
+
+
+class PieceState:
+    """One rotation of a piece: its cell grid, per-row bitmasks and the next rotation."""
+
+    __slots__ = ("cells", "masks", "left", "right", "bottom", "next")
+
+    def __init__(self, cells: List[List[int]]):
+        self.cells = cells  # shared with every caller; treat as read-only
+        self.masks = tuple(sum(1 << x for x, cell in enumerate(row) if cell) for row in cells)
+        occupied = 0
+        for mask in self.masks:
+            occupied |= mask
+        # Bounding box of the filled cells; empty rows/columns of the shape may leave the well
+        self.left = (occupied & -occupied).bit_length() - 1
+        self.right = occupied.bit_length()
+        self.bottom = max(y for y, mask in enumerate(self.masks) if mask) + 1
+        self.next: "PieceState" = self
+
+
+_STATES: Dict[Tuple[Tuple[int, ...], ...], PieceState] = {}
+
+
+def _shape_key(shape: Sequence[Sequence[int]]) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(tuple(1 if cell else 0 for cell in row) for row in shape)
+
+
+def piece_state(shape: Sequence[Sequence[int]]) -> PieceState:
+    """Return the cached PieceState for a shape, precomputing its whole rotation ring."""
+    key = _shape_key(shape)
+    state = _STATES.get(key)
+    if state is not None:
+        return state
+
+    ring = []
+    while key not in _STATES:
+        state = PieceState([list(row) for row in key])
+        _STATES[key] = state
+        ring.append(state)
+        key = tuple(zip(*key[::-1]))  # 90 degrees clockwise
+    for current, following in zip(ring, ring[1:] + [_STATES[key]]):
+        current.next = following
+    return ring[0]
+
+
+class Bitboard:
+    """A width x height Tetris well stored as one int per row."""
+
+    __slots__ = ("width", "height", "full", "rows")
+
+    def __init__(self, width: int = 10, height: int = 20):
+        self.width = width
+        self.height = height
+        self.full = (1 << width) - 1
+        self.rows = [0] * height
+
+    @classmethod
+    def from_rows(cls, board: Sequence[Sequence[int]]) -> "Bitboard":
+        """Build a bitboard from a list-of-lists board (truthy cell = filled)."""
+        grid = cls(len(board[0]), len(board))
+        grid.rows = [sum(1 << x for x, cell in enumerate(row) if cell) for row in board]
+        return grid
+
+    def collides(self, state: PieceState, off_y: int, off_x: int) -> bool:
+        """True if the piece at (off_y, off_x) leaves the well or overlaps a filled cell."""
+        if off_x + state.left < 0 or off_x + state.right > self.width or off_y + state.bottom > self.height:
+            return True
+        rows = self.rows
+        for y, mask in enumerate(state.masks, off_y):
+            if y >= 0 and mask and rows[y] & (mask << off_x if off_x >= 0 else mask >> -off_x):
+                return True
+        return False
+
+    def merge(self, state: PieceState, off_y: int, off_x: int) -> None:
+        """Write the piece into the board; cells above the top edge are dropped."""
+        rows = self.rows
+        for y, mask in enumerate(state.masks, off_y):
+            if 0 <= y < self.height:
+                rows[y] |= (mask << off_x if off_x >= 0 else mask >> -off_x) & self.full
+
+    def clear_full_lines(self) -> int:
+        """Remove completed rows and return how many were cleared."""
+        full = self.full
+        kept = [row for row in self.rows if row != full]
+        cleared = self.height - len(kept)
+        if cleared:
+            self.rows = [0] * cleared + kept
+        return cleared
+
+    def view(self) -> "BoardView":
+        return BoardView(self)
+
+
+class RowView:
+    """Live list-like view of one bitboard row."""
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid: Bitboard, y: int):
+        self.grid = grid
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.grid.width
+
+    def __getitem__(self, x: int) -> int:
+        if x < 0:
+            x += self.grid.width
+        if not 0 <= x < self.grid.width:
+            raise IndexError("board column out of range")
+        return self.grid.rows[self.y] >> x & 1
+
+    def __setitem__(self, x: int, value: int) -> None:
+        if not 0 <= x < self.grid.width:
+            raise IndexError("board column out of range")
+        if value:
+            self.grid.rows[self.y] |= 1 << x
+        else:
+            self.grid.rows[self.y] &= ~(1 << x)
+
+    def __iter__(self):
+        bits = self.grid.rows[self.y]
+        return (bits >> x & 1 for x in range(self.grid.width))
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class BoardView:
+    """Live `board[y][x]` view over a Bitboard."""
+
+    __slots__ = ("grid",)
+
+    def __init__(self, grid: Bitboard):
+        self.grid = grid
+
+    def __len__(self) -> int:
+        return self.grid.height
+
+    def __getitem__(self, y: int) -> RowView:
+        if y < 0:
+            y += self.grid.height
+        if not 0 <= y < self.grid.height:
+            raise IndexError("board row out of range")
+        return RowView(self.grid, y)
+
+    def __iter__(self):
+        return (RowView(self.grid, y) for y in range(self.grid.height))
+
+    def __eq__(self, other) -> bool:
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self) -> str:
+        return repr([list(row) for row in self])
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+    from .tetris import Tetris
+
+    parser = argparse.ArgumentParser(description="Micro-benchmark Tetris moves per second.")
+    parser.add_argument("-n", "--moves", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    game = Tetris()
+    game.setup(None, None)
+    moves = [rng.choice(("left", "right", "rotate", "drop", "drop")) for _ in range(args.moves)]
+    started = time.perf_counter()
+    for move in moves:
+        if game.game_over:
+            game.setup(None, None)
+        if move == "left":
+            game._try_move(0, -1)
+        elif move == "right":
+            game._try_move(0, 1)
+        elif move == "rotate":
+            game._try_rotate()
+        else:
+            game._handle_drop()
+    elapsed = time.perf_counter() - started
+    print(f"{args.moves / elapsed:,.0f} moves/s ({elapsed:.2f}s for {args.moves:,} moves)")
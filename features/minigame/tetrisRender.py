@@ -0,0 +1,152 @@
+import curses
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+"""
+tetrisRender.py
+
+Dirty-region curses renderer for the Tetris minigame.
+
+Instead of `win.clear()` and repainting the frame, every cell, the piece and the UI on every
+loop iteration, TetrisRenderer remembers what it put on screen last frame:
+
+- the well as one int per row (placed blocks with the falling piece OR-ed in); XOR against the
+  previous frame gives exactly the cells to repaint
+- the score text and the next-piece preview, repainted only when they change
+- the terminal size; a resize (or the first frame) triggers one full redraw
+
+Changed cells are written with addstr into the window buffer and pushed with
+win.noutrefresh() + curses.doupdate(). A frame with no changes is skipped entirely.
+
+Profiling counters (see stats()): frames drawn and skipped, frame time, and the bytes handed
+to addstr. curses adds cursor-movement sequences on top of that payload, so bytes_written is
+the cell/text payload, not an exact count of what reached the terminal.
+"""
+
+CELL = "[]"
+EMPTY = "  "
+PREVIEW_ROWS = 4
+PREVIEW_COLS = 4
+
+
+class TetrisRenderer:
+    """Incremental renderer: repaints only what changed since the previous frame."""
+
+    def __init__(self, doupdate: Callable[[], None] = curses.doupdate):
+        self._doupdate = doupdate
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self.full_redraws = 0
+        self.bytes_written = 0
+        self.frame_time_total = 0.0
+        self.last_frame_time = 0.0
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget the previous frame so the next render is a full redraw."""
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._origin = (0, 0)
+        self._rows: List[int] = []
+        self._score: Optional[str] = None
+        self._preview = None
+
+    def render(self, win: Any, game: Any) -> bool:
+        """Draw the game's current state; returns False if the frame was skipped (no changes)."""
+        started = time.perf_counter()
+        rows = self._compose(game)
+        dirty = False
+
+        screen_size = win.getmaxyx()
+        if screen_size != self._screen_size:
+            self._full_redraw(win, game, screen_size)
+            dirty = True
+
+        origin_y, origin_x = self._origin
+        for y, (old, new) in enumerate(zip(self._rows, rows)):
+            changed = old ^ new
+            while changed:
+                low = changed & -changed
+                x = low.bit_length() - 1
+                self._put(win, origin_y + 1 + y, origin_x + 1 + x * 2, CELL if new & low else EMPTY)
+                changed ^= low
+                dirty = True
+        self._rows = rows
+
+        score = f"Score: {game.score}"
+        if score != self._score:
+            padding = " " * max(0, len(self._score or "") - len(score))
+            self._put(win, origin_y, origin_x + game.WIDTH * 2 + 4, score + padding)
+            self._score = score
+            dirty = True
+
+        preview = game.next_piece
+        if preview is not self._preview:
+            self._draw_preview(win, preview, origin_y, origin_x + game.WIDTH * 2 + 4)
+            self._preview = preview
+            dirty = True
+
+        if dirty:
+            win.noutrefresh()
+            self._doupdate()
+            self.frames_drawn += 1
+        else:
+            self.frames_skipped += 1
+        self.last_frame_time = time.perf_counter() - started
+        self.frame_time_total += self.last_frame_time
+        return dirty
+
+    def stats(self) -> Dict[str, float]:
+        """Return profiling counters; frame times are in milliseconds."""
+        frames = self.frames_drawn + self.frames_skipped
+        return {
+            "frames_drawn": self.frames_drawn,
+            "frames_skipped": self.frames_skipped,
+            "full_redraws": self.full_redraws,
+            "bytes_written": self.bytes_written,
+            "last_frame_ms": self.last_frame_time * 1000,
+            "avg_frame_ms": self.frame_time_total * 1000 / frames if frames else 0.0,
+        }
+
+    # === Drawing helpers ===
+    def _put(self, win: Any, y: int, x: int, text: str) -> None:
+        win.addstr(y, x, text)
+        self.bytes_written += len(text.encode("utf-8"))
+
+    @staticmethod
+    def _compose(game: Any) -> List[int]:
+        """Placed blocks with the falling piece merged in, one int per row."""
+        rows = game.grid.rows[:]
+        off_y, off_x = game.piece_offset
+        for y, mask in enumerate(game.piece.masks, off_y):
+            if 0 <= y < len(rows):
+                rows[y] |= (mask << off_x if off_x >= 0 else mask >> -off_x) & game.grid.full
+        return rows
+
+    def _full_redraw(self, win: Any, game: Any, screen_size: Tuple[int, int]) -> None:
+        """Erase the window and draw the static frame; cells and UI are then drawn as changes."""
+        height, width = screen_size
+        origin_x = max(2, (width - game.WIDTH * 2) // 2)
+        origin_y = max(1, (height - game.HEIGHT) // 2)
+
+        win.erase()
+        border = "-" * (game.WIDTH * 2 + 2)
+        side = "|" + " " * (game.WIDTH * 2) + "|"
+        self._put(win, origin_y, origin_x, border)
+        for y in range(1, game.HEIGHT + 1):
+            self._put(win, origin_y + y, origin_x, side)
+        self._put(win, origin_y + game.HEIGHT + 1, origin_x, border)
+        self._put(win, origin_y + 2, origin_x + game.WIDTH * 2 + 4, "Next:")
+
+        self._screen_size = screen_size
+        self._origin = (origin_y, origin_x)
+        self._rows = [0] * game.HEIGHT
+        self._score = None
+        self._preview = None
+        self.full_redraws += 1
+
+    def _draw_preview(self, win: Any, piece: List[List[int]], origin_y: int, origin_x: int) -> None:
+        """Repaint the next-piece box (blank it, then draw the piece)."""
+        for y in range(PREVIEW_ROWS):
+            row = piece[y] if y < len(piece) else ()
+            line = "".join(CELL if x < len(row) and row[x] else EMPTY for x in range(PREVIEW_COLS))
+            self._put(win, origin_y + 3 + y, origin_x, line)
@@ -0,0 +1,173 @@
+import curses
+import io
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .tetris import Tetris
+from .tetrisBoard import Bitboard, PieceState
+
+"""
+tetrisSim.py
+
+Headless, deterministic Tetris runs for benchmarking and regression tests.
+
+The interactive game needs curses and a terminal (game_loop via curses.wrapper) and waits on
+a wall clock. Here a Tetris instance is driven directly instead:
+
+- Tetris.setup(..., seed=N) fixes the piece sequence, so a seed replays the same game
+- play_script() feeds key codes through Tetris.handle_input, exactly as the curses loop does
+- play_headless() asks a policy for the keys that place each piece, then hard-drops it with
+  the regular gravity step (_handle_drop); nothing sleeps and nothing is drawn
+- greedy_policy() tries every rotation and column of the current piece that its keys can
+  reach from the spawn offset on a scratch bitboard, and picks the placement with the best
+  weighted score of aggregate height, holes, bumpiness and cleared lines
+- simulate() plays one seeded game to the end (or a piece cap) and runs evaluate/reward on it
+
+`python -m features.minigame.tetrisSim` reports engine throughput in pieces per second.
+"""
+
+Policy = Callable[[Tetris], Iterable[int]]
+
+# Weights for greedy_policy (higher total = better placement)
+WEIGHTS = {"height": -0.51, "lines": 0.76, "holes": -0.36, "bumpiness": -0.18}
+
+_POPCOUNT = tuple(bin(mask).count("1") for mask in range(1 << Tetris.WIDTH))
+
+
+def board_features(rows: List[int], width: int) -> Tuple[int, int, int]:
+    """Return (aggregate height, holes, bumpiness) of a bitboard given top row first."""
+    height = len(rows)
+    seen = 0
+    holes = 0
+    column_heights = [0] * width
+    for y, row in enumerate(rows):
+        fresh = row & ~seen
+        while fresh:
+            low = fresh & -fresh
+            column_heights[low.bit_length() - 1] = height - y
+            fresh ^= low
+        holes += _POPCOUNT[seen & ~row]
+        seen |= row
+    bumpiness = sum(abs(a - b) for a, b in zip(column_heights, column_heights[1:]))
+    return sum(column_heights), holes, bumpiness
+
+
+def _rotations(state: PieceState) -> List[PieceState]:
+    ring = [state]
+    while ring[-1].next is not state:
+        ring.append(ring[-1].next)
+    return ring
+
+
+def _reachable_columns(grid: Bitboard, state: PieceState, y: int, x: int) -> List[int]:
+    """Columns a piece at (y, x) reaches by single steps sideways, as _try_move allows."""
+    left = x
+    while not grid.collides(state, y, left - 1):
+        left -= 1
+    right = x
+    while not grid.collides(state, y, right + 1):
+        right += 1
+    return list(range(left, right + 1))
+
+
+def best_placement(grid: Bitboard, piece: PieceState, spawn_y: int = 0, spawn_x: Optional[int] = None,
+                   weights: Dict[str, float] = WEIGHTS) -> Optional[Tuple[int, int, float]]:
+    """Return (rotations, column, score) of the best landing spot reachable from the spawn
+    offset, or None if nothing fits.
+
+    Only placements the key sequence can reach are scored: every rotation is applied in place
+    at the spawn offset (_try_rotate ignores a blocked turn) and the piece then steps sideways
+    on the spawn row (_try_move stops at the first blocked column).
+    """
+    if spawn_x is None:
+        spawn_x = grid.width // 2 - len(piece.cells[0]) // 2  # where Tetris spawns a piece
+    best = None
+    scratch = Bitboard(grid.width, grid.height)
+    for turns, state in enumerate(_rotations(piece)):
+        if grid.collides(state, spawn_y, spawn_x):
+            break  # this turn fails in place, so no later rotation is reachable either
+        for x in _reachable_columns(grid, state, spawn_y, spawn_x):
+            y = spawn_y
+            while not grid.collides(state, y + 1, x):
+                y += 1
+            scratch.rows = grid.rows[:]
+            scratch.merge(state, y, x)
+            lines = scratch.clear_full_lines()
+            height, holes, bumpiness = board_features(scratch.rows, grid.width)
+            score = (weights["height"] * height + weights["lines"] * lines
+                     + weights["holes"] * holes + weights["bumpiness"] * bumpiness)
+            if best is None or score > best[2]:
+                best = (turns, x, score)
+    return best
+
+
+def greedy_policy(game: Tetris) -> List[int]:
+    """Key codes that rotate and shift the current piece to the greedy placement."""
+    placement = best_placement(game.grid, game.piece, *game.piece_offset)
+    if placement is None:
+        return []
+    turns, column, _ = placement
+    keys = [curses.KEY_UP] * turns
+    # Rotation keeps the offset, so shift from the spawn column after rotating
+    shift = column - game.piece_offset[1]
+    keys += [curses.KEY_RIGHT if shift > 0 else curses.KEY_LEFT] * abs(shift)
+    return keys
+
+
+def play_script(game: Tetris, keys: Iterable[int]) -> bool:
+    """Feed key codes through handle_input; returns False if the script pressed quit."""
+    for key in keys:
+        if game.game_over:
+            break
+        if game.handle_input(key) == 'quit':
+            return False
+    return True
+
+
+def hard_drop(game: Tetris) -> None:
+    """Apply gravity steps until the current piece lands and the next one spawns."""
+    while not game.game_over:
+        row = game.piece_offset[0]
+        game._handle_drop()
+        if game.piece_offset[0] != row + 1:  # landed: the next piece spawned at the top
+            break
+
+
+def play_headless(game: Tetris, policy: Policy = greedy_policy, max_pieces: Optional[int] = None) -> int:
+    """Let policy place pieces until game over, quit or max_pieces; returns pieces placed."""
+    pieces = 0
+    while not game.game_over and (max_pieces is None or pieces < max_pieces):
+        if not play_script(game, policy(game)):
+            break
+        hard_drop(game)
+        pieces += 1
+    return pieces
+
+
+def simulate(seed: int, policy: Policy = greedy_policy, max_pieces: Optional[int] = 500) -> Dict:
+    """Play one seeded game headless and return its summary, evaluation and reward."""
+    game = Tetris()
+    game.setup(None, None, seed=seed)
+    pieces = play_headless(game, policy, max_pieces)
+    summary = {"score": game.score, "lines_cleared": game.lines_cleared, "game_over": game.game_over}
+    result = game.evaluate(summary)
+    game.output = io.StringIO()
+    reward = game.reward(result)
+    return {**summary, "pieces": pieces, "result": result, "reward": reward}
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Benchmark headless Tetris with the greedy AI.")
+    parser.add_argument("-g", "--games", type=int, default=20)
+    parser.add_argument("-p", "--max-pieces", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    runs = [simulate(args.seed + i, max_pieces=args.max_pieces) for i in range(args.games)]
+    elapsed = time.perf_counter() - started
+    pieces = sum(run["pieces"] for run in runs)
+    print(f"{args.games} games, {pieces:,} pieces in {elapsed:.2f}s -> {pieces / elapsed:,.0f} pieces/s")
+    print(f"mean lines {sum(run['lines_cleared'] for run in runs) / args.games:.1f}, "
+          f"game overs {sum(run['game_over'] for run in runs)}/{args.games}")
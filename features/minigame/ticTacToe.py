@@ -1,8 +1,11 @@
 from .baseClass import MinigameStrategy
+from .ticTacToeBoard import LineBoard, EMPTY
+from .ticTacToeSearch import TicTacToeSearch
 from typing import Any, Dict, List, Tuple
-from random import choice
+import asyncio
+from random import Random
 from utils.colorize import red, green, yellow
-from constants.configs import LINE
+from constants.configs import LINE, TICTACTOE_PET_SEARCH
 from colorama import init
 
 init(autoreset=True)
@@ -12,170 +15,141 @@ class TicTacToe(MinigameStrategy):
 
     name = "Tic Tac Toe"
 
-    def setup(self, player, pet):
+    def setup(self, player, pet, seed=None):
         self.player = player
         self.pet = pet
         self.row_length = 3
         self.col_length = 3
-        self.board = [[" " for _ in range(self.col_length)] for _ in range(self.row_length)]
         self.player_mark = "X"
         self.pet_mark = "O"
         self.first = True
         self.winner = None
         self.difficulty = 1
         self.win_length = 3
+        self.rng = Random(seed)
+        self._reset_board()
+
+    def _reset_board(self):
+        """Create an empty display board and its incremental line model."""
+        self.board = [[" " for _ in range(self.col_length)] for _ in range(self.row_length)]
+        self.lines = LineBoard(self.row_length, self.win_length)
+        self.searcher = TicTacToeSearch(self.row_length, self.win_length, (self.player_mark, self.pet_mark),
+                                        sudden_death=self.row_length < 4)
 
     def display_menu(self):
         """Show rules and rewards for the Tic Tac Toe minigame."""
-        print("\n" + LINE)
-        print("⭕ Tic Tac Toe ✖️")
-        print(LINE)
-        print("Let's play classic Tic-Tac-Toe with your pet!")
-        print("You are X, your pet is O.")
-        print(LINE)
-        print("Win ---> more currency")
-        print("Draw ---> small currency")
-        print("Loss ---> no currency")
-        print(LINE)
-
-    def build_question(self):
+        self.say("\n" + LINE)
+        self.say("⭕ Tic Tac Toe ✖️")
+        self.say(LINE)
+        self.say("Let's play classic Tic-Tac-Toe with your pet!")
+        self.say("You are X, your pet is O.")
+        self.say(LINE)
+        self.say("Win ---> more currency")
+        self.say("Draw ---> small currency")
+        self.say("Loss ---> no currency")
+        self.say(LINE)
+
+    async def build_question(self):
         """Collect board-size choice and prepare an empty board."""
-        print(yellow("Choose the size of your Tic Tac Toe board!"))
-        print(LINE)
-        print("1. 3 x 3 board")
-        print("2. 4 x 4 board")
-        print("3. 5 x 5 board")
-        print(LINE)
+        self.say(yellow("Choose the size of your Tic Tac Toe board!"))
+        self.say(LINE)
+        self.say("1. 3 x 3 board")
+        self.say("2. 4 x 4 board")
+        self.say("3. 5 x 5 board")
+        self.say(LINE)
         try:
-            diff = int(input("Choose your size of board (1/2/3): ").strip())
+            diff = int((await self.ask("Choose your size of board (1/2/3): ")).strip())
         except ValueError:
             diff = 1
         if diff not in range(1, 4):
             diff = 1
         self.difficulty = diff
-        if self.difficulty == 1:
-            length = 3
-            self.win_length = 3
-        elif self.difficulty == 2:
-            length = 4
-            self.win_length = 4
-        else:
-            length = 5
-            self.win_length = 5
+        self.resize(diff + 2)
 
+    def resize(self, length):
+        """Switch to an empty length x length board where a full row, column or diagonal wins."""
         self.row_length = length
         self.col_length = length
-        self.board = [[" " for _ in range(self.col_length)] for _ in range(self.row_length)]
+        self.win_length = length
+        self._reset_board()
 
     def render_board(self):
         """Render the current board to the console."""
-        print()
-        print("   " + " ".join(f"{c+1:3}" for c in range(self.col_length)))
-        print("  +" + "---+" * self.col_length)
+        self.say()
+        self.say("   " + " ".join(f"{c+1:3}" for c in range(self.col_length)))
+        self.say("  +" + "---+" * self.col_length)
         for r in range(self.row_length):
             row_cells = " | ".join(self.board[r][c] if self.board[r][c] != " " else " " for c in range(self.col_length))
-            print(f"{r+1:2}| {row_cells} |")
-            print("  +" + "---+" * self.col_length)
-        print()
+            self.say(f"{r+1:2}| {row_cells} |")
+            self.say("  +" + "---+" * self.col_length)
+        self.say()
 
     def available_moves(self):
         """Return list of empty cells as (row, col) tuples."""
-        available: List[Tuple[int, int]] = []
-        for i in range(self.row_length):
-            for j in range(self.col_length):
-                if self.board[i][j] == " ":
-                    available.append((i, j))
+        available: List[Tuple[int, int]] = [divmod(pos, self.col_length) for pos in self.lines.empties()]
         return available
 
-    def get_input(self):
+    def _is_empty(self, cell):
+        """Return True if the (row, col) cell has no mark."""
+        return self.lines.cells[cell[0] * self.col_length + cell[1]] == EMPTY
+
+    async def get_input(self):
         """Ask if the player wants to play first (Y/N)."""
         while True:
-            choice = input("\nDo you want to play first (Y/N)? ").strip().lower()
+            choice = (await self.ask("\nDo you want to play first (Y/N)? ")).strip().lower()
             if choice == "y":
                 self.first = True
                 break
             elif choice == "n":
                 self.first = False
                 break
-            print(red("Please answer Y/N!"))
+            self.say(red("Please answer Y/N!"))
 
     def check_winner(self):
-        """Check the board for winning sequences in all directions and return counts per mark."""
-        counts = {}
-
-        # Check all four directions
-        self._check_horizontal_wins(counts)
-        self._check_vertical_wins(counts)
-        self._check_diagonal_wins(counts)
-        self._check_anti_diagonal_wins(counts)
-
-        return counts
-
-    def _check_horizontal_wins(self, counts: dict) -> None:
-        """Check for horizontal winning sequences."""
-        for row in range(self.row_length):
-            for col in range(self.row_length - self.win_length + 1):
-                first = self.board[row][col]
-                if self._is_winning_sequence(row, col, 0, 1, first):
-                    counts[first] = counts.get(first, 0) + 1
-
-    def _check_vertical_wins(self, counts: dict) -> None:
-        """Check for vertical winning sequences."""
-        for col in range(self.col_length):
-            for row in range(self.row_length - self.win_length + 1):
-                first = self.board[row][col]
-                if self._is_winning_sequence(row, col, 1, 0, first):
-                    counts[first] = counts.get(first, 0) + 1
-
-    def _check_diagonal_wins(self, counts: dict) -> None:
-        """Check for diagonal winning sequences (top-left to bottom-right)."""
-        for row in range(self.row_length - self.win_length + 1):
-            for col in range(self.row_length - self.win_length + 1):
-                first = self.board[row][col]
-                if self._is_winning_sequence(row, col, 1, 1, first):
-                    counts[first] = counts.get(first, 0) + 1
-
-    def _check_anti_diagonal_wins(self, counts: dict) -> None:
-        """Check for anti-diagonal winning sequences (top-right to bottom-left)."""
-        for row in range(self.row_length - self.win_length + 1):
-            for col in range(self.win_length - 1, self.col_length):
-                first = self.board[row][col]
-                if self._is_winning_sequence(row, col, 1, -1, first):
-                    counts[first] = counts.get(first, 0) + 1
-
-    def _is_winning_sequence(self, start_row: int, start_col: int,
-                            row_delta: int, col_delta: int, mark: str) -> bool:
-        """Check if there's a winning sequence starting from given position."""
-        if mark == " ":
-            return False
-
-        for offset in range(self.win_length):
-            row = start_row + offset * row_delta
-            col = start_col + offset * col_delta
-            if self.board[row][col] != mark:
-                return False
-
-        return True
+        """Return the number of completed winning sequences per mark (kept incrementally)."""
+        return self.lines.check_winner()
 
     def make_move(self, row, col, mark):
         """Place a mark at row,col if valid and empty."""
         if (0 <= row < self.row_length) and (0 <= col < self.col_length) and (self.board[row][col] == " "):
             self.board[row][col] = mark
+            self.lines.place(row * self.col_length + col, mark)
             return True
         return False
 
+    def _winning_cells(self, mark, empties):
+        """Count empty cells after which mark would have at least one completed sequence."""
+        if self.lines.has_won(mark):
+            return len(empties)
+        return sum(1 for pos in empties if self.lines.completes(pos, mark))
+
     def winning_move(self, mark):
         """Return a winning move (row, col) for mark if available, otherwise None."""
-        for row, col in self.available_moves():
-            self.board[row][col] = mark
-            winner = self.check_winner()
-            self.board[row][col] = " "
-            if winner.get(mark, 0) > 0:
-                return row, col
+        empties = self.lines.empties()
+        for pos in empties:
+            if self.lines.has_won(mark) or self.lines.completes(pos, mark):
+                return divmod(pos, self.col_length)
         return None
 
+    def search_limits(self):
+        """(max depth, seconds) of the pet's search for its life stage, or None for heuristics."""
+        stage = self.pet.get_age_summary() if self.pet is not None else None
+        return TICTACTOE_PET_SEARCH.get(stage)
+
+    def search_move(self, max_depth=None, time_budget=None):
+        """Return the alpha-beta search's move (row, col) for the pet."""
+        pos = self.searcher.best_move(self.lines, self.pet_mark, max_depth, time_budget)
+        return divmod(pos, self.col_length)
+
     def pet_move(self):
-        """Compute the pet's move using heuristics: win, block, fork, center, corners, edges."""
+        """Compute the pet's move: alpha-beta search sized by the pet's age, else heuristics."""
+        limits = self.search_limits()
+        if limits:
+            return self.search_move(*limits)
+        return self.heuristic_move()
+
+    def heuristic_move(self):
+        """Compute a move using heuristics: win, block, fork, center, corners, edges."""
 
         # Prioritize immediate winning or blocking moves
         for mark in [self.pet_mark, self.player_mark]:
@@ -205,13 +179,13 @@ class TicTacToe(MinigameStrategy):
             return move
 
         # Fallback: choose any available move
-        return choice(self.available_moves())
+        return self.rng.choice(self.available_moves())
 
 
     def _choose_center(self):
         """Return the center cell if available, else None."""
         center = (self.row_length // 2, self.col_length // 2)
-        if center in self.available_moves():
+        if self._is_empty(center):
             return center
         return None
 
@@ -225,7 +199,7 @@ class TicTacToe(MinigameStrategy):
             (self.row_length - 1, self.col_length - 1)
         ]
         for corner in corners:
-            if corner in self.available_moves():
+            if self._is_empty(corner):
                 return corner
         return None
 
@@ -235,15 +209,15 @@ class TicTacToe(MinigameStrategy):
         edges = []
 
         for c in range(1, self.col_length - 1):
-            if (0, c) in self.available_moves():
+            if self._is_empty((0, c)):
                 edges.append((0, c))
-            if (self.row_length - 1, c) in self.available_moves():
+            if self._is_empty((self.row_length - 1, c)):
                 edges.append((self.row_length - 1, c))
 
         for r in range(1, self.row_length - 1):
-            if (r, 0) in self.available_moves():
+            if self._is_empty((r, 0)):
                 edges.append((r, 0))
-            if (r, self.col_length - 1) in self.available_moves():
+            if self._is_empty((r, self.col_length - 1)):
                 edges.append((r, self.col_length - 1))
 
         return self.best_edge(edges) if edges else None
@@ -253,25 +227,16 @@ class TicTacToe(MinigameStrategy):
         """Attempt to find a move that creates multiple immediate winning threats (fork)."""
         best_move = None
         max_forks = 0
+        empties = self.lines.empties()
 
-        for move in self.available_moves():
-            self.board[move[0]][move[1]] = mark
-
-            fork_count = 0
-            for test_move in self.available_moves():
-                self.board[test_move[0]][test_move[1]] = mark
-                wins = self.check_winner()
-
-                if wins.get(mark, 0) > 0:
-                    fork_count += 1
-
-                self.board[test_move[0]][test_move[1]] = " "
-
-            self.board[move[0]][move[1]] = " "
+        for pos in empties:
+            self.lines.place(pos, mark)
+            fork_count = self._winning_cells(mark, [test for test in empties if test != pos])
+            self.lines.undo(pos)
 
             if fork_count > max_forks:
                 max_forks = fork_count
-                best_move = move
+                best_move = divmod(pos, self.col_length)
 
         if max_forks >= 2:
             return best_move
@@ -311,17 +276,10 @@ class TicTacToe(MinigameStrategy):
         col_distance = abs(edge[1] - (self.col_length // 2))
         score = 2 - (row_distance + col_distance)
 
-        self.board[edge[0]][edge[1]] = self.pet_mark
-        likely_wins = 0
-
-        for test_move in self.available_moves():
-            self.board[test_move[0]][test_move[1]] = self.pet_mark
-            wins = self.check_winner()
-            if wins.get(self.pet_mark, 0) > 0:
-                likely_wins += 1
-            self.board[test_move[0]][test_move[1]] = " "
-
-        self.board[edge[0]][edge[1]] = " "
+        pos = edge[0] * self.col_length + edge[1]
+        self.lines.place(pos, self.pet_mark)
+        likely_wins = self._winning_cells(self.pet_mark, self.lines.empties())
+        self.lines.undo(pos)
         return score + likely_wins * 0.5
 
 
@@ -333,11 +291,12 @@ class TicTacToe(MinigameStrategy):
 
         for edge in edges:
             # Prioritize immediate winning move
-            self.board[edge[0]][edge[1]] = self.pet_mark
-            if self.winning_move(self.pet_mark):
-                self.board[edge[0]][edge[1]] = " "
+            pos = edge[0] * self.col_length + edge[1]
+            self.lines.place(pos, self.pet_mark)
+            wins = self.winning_move(self.pet_mark)
+            self.lines.undo(pos)
+            if wins:
                 return edge
-            self.board[edge[0]][edge[1]] = " "
 
             # Otherwise, pick edge closest to center
             distance = abs(edge[0] - center) + abs(edge[1] - center)
@@ -348,26 +307,26 @@ class TicTacToe(MinigameStrategy):
         return best_edge
 
 
-    def player_move(self):
+    async def player_move(self):
         """Prompt the player for a row/column move and validate it."""
-        print("\n" + LINE)
-        print("It's your turn! Pick your cell now!")
-        print(LINE)
+        self.say("\n" + LINE)
+        self.say("It's your turn! Pick your cell now!")
+        self.say(LINE)
         try:
-            row, col = map(int, input(f"\nEnter row (1-{self.row_length}) and column (1-{self.col_length}) --> ex: 2 3: ").strip().split())
+            row, col = map(int, (await self.ask(f"\nEnter row (1-{self.row_length}) and column (1-{self.col_length}) --> ex: 2 3: ")).strip().split())
             row -= 1
             col -= 1
         except ValueError:
-            print(red("Please input two numbers separated by space (e.g. '2 3')."))
+            self.say(red("Please input two numbers separated by space (e.g. '2 3')."))
             return None
         if row < 0 or row >= self.row_length:
-            print(red(f"Row number cannot be less than 1 or more than {self.row_length}!"))
+            self.say(red(f"Row number cannot be less than 1 or more than {self.row_length}!"))
             return None
         if col < 0 or col >= self.col_length:
-            print(red(f"Column number cannot be less than 1 or more than {self.col_length}!"))
+            self.say(red(f"Column number cannot be less than 1 or more than {self.col_length}!"))
             return None
-        if (row, col) not in self.available_moves():
-            print(yellow("Cell has been placed with mark!"))
+        if not self._is_empty((row, col)):
+            self.say(yellow("Cell has been placed with mark!"))
             return None
 
         return row, col
@@ -387,7 +346,7 @@ class TicTacToe(MinigameStrategy):
 
         return winner
 
-    def build_game(self):
+    async def build_game(self):
         """Run the main turn loop until the board is finished or no moves left."""
         player_turn = self.first
 
@@ -395,9 +354,9 @@ class TicTacToe(MinigameStrategy):
             self.render_board()
 
             if player_turn:
-                self._execute_player_turn()
+                await self._execute_player_turn()
             else:
-                self._execute_pet_turn()
+                await self._execute_pet_turn()
 
             if self._check_game_over():
                 break
@@ -406,19 +365,20 @@ class TicTacToe(MinigameStrategy):
 
         return {"winner": self.winner}
 
-    def _execute_player_turn(self) -> None:
+    async def _execute_player_turn(self) -> None:
         """Handle the player's turn."""
         move = None
         while move is None:
-            move = self.player_move()
+            move = await self.player_move()
         row, col = move
         self.make_move(row, col, self.player_mark)
 
-    def _execute_pet_turn(self) -> None:
+    async def _execute_pet_turn(self) -> None:
         """Handle the pet's turn."""
-        row, col = self.pet_move()
+        # An Elder's search may think for a second: keep it off the shared event loop
+        row, col = await asyncio.to_thread(self.pet_move)
         self.make_move(row, col, self.pet_mark)
-        print(f"Pet placed '{self.pet_mark}' at (row-{row + 1} col-{col + 1}).")
+        self.say(f"Pet placed '{self.pet_mark}' at (row-{row + 1} col-{col + 1}).")
 
     def _check_game_over(self) -> bool:
         """Check if the game has ended and set the winner."""
@@ -428,7 +388,7 @@ class TicTacToe(MinigameStrategy):
                 self.winner = self.count_sequence()
                 return True
 
-        if self.row_length >= 3 and (not self.available_moves()):
+        if self.row_length >= 3 and self.lines.empty_count == 0:
             self.render_board()
             self.winner = self.count_sequence()
             return True
@@ -452,28 +412,29 @@ class TicTacToe(MinigameStrategy):
         if outcome == "Win":
             coins = 20
             pet_happiness = 0
-            print("\nYou win! 🎉")
+            self.say("\nYou win! 🎉")
         elif outcome == "Draw":
             coins = 5
             pet_happiness = 2
-            print("\nIt's a draw!")
+            self.say("\nIt's a draw!")
         else:
             coins = 0
             pet_happiness = 5
-            print("\nYou lose.. 🥲")
-        print("Your pet is having fun playing with you!")
-        print(f"Reward: Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})")
-        print(green(f"You received Rp. {'{:,}'.format(coins * 1000)} 🎉"))
+            self.say("\nYou lose.. 🥲")
+        self.say("Your pet is having fun playing with you!")
+        self.say(f"Reward: Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})")
+        self.say(green(f"You received Rp. {'{:,}'.format(coins * 1000)} 🎉"))
         return {"currency": coins, "pet_happiness": pet_happiness}
 
-    def play(self, player: Any, pet: Any) -> Dict[str, int]:
+    async def play_async(self, player: Any, pet: Any, input_source=None, output=None) -> Dict[str, int]:
         """Run an entire TicTacToe game and return rewards."""
-        self.setup(player, pet)
-        self.display_menu()
-        self.build_question()
-        self.get_input()
-        summary = self.build_game()
-        result = self.evaluate(summary)
-        reward = self.reward(result)
-        return reward
+        with self.session(input_source, output):
+            self.setup(player, pet)
+            self.display_menu()
+            await self.build_question()
+            await self.get_input()
+            summary = await self.build_game()
+            result = self.evaluate(summary)
+            reward = self.reward(result)
+            return reward
 
@@ -0,0 +1,141 @@
+import io
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from utils.stats import nearest_rank
+from .ticTacToe import TicTacToe
+
+"""
+ticTacToeArena.py
+
+Headless Tic-Tac-Toe self-play for benchmarking and regression tests.
+
+The interactive game asks for moves with self.ask() (player_move via build_game). Here a
+TicTacToe instance is driven directly instead, writing its output to a discarded buffer:
+
+- an agent is a callable (game, mark) -> (row, col); marks are the game's player_mark ("X")
+  and pet_mark ("O"), and agents may play either side
+- heuristic_agent is the pet's rule-based AI (heuristic_move: win, block, fork, center,
+  corner, best edge), search_agent the alpha-beta search at a fixed depth/time, random_agent a
+  uniform choice, and perfect_agent the unbounded search: exact on 3x3; on 4x4 and 5x5 a full
+  solve is out of reach, so it gets PERFECT_BUDGET seconds per move and is only the strongest
+  available opponent
+- TicTacToe.setup(..., seed=N) seeds the game's RNG, so a seed replays the same games
+- play_game() runs moves through make_move and the regular end check (_check_game_over)
+- run_matchup() plays a series, alternating who moves first, and reports games/s, the
+  win/draw/loss rates of the first agent and move-latency percentiles per side
+
+`python -m features.minigame.ticTacToeArena` runs every matchup on 3x3, 4x4 and 5x5.
+"""
+
+Agent = Callable[[TicTacToe, str], Tuple[int, int]]
+
+PERFECT_BUDGET = 0.05  # seconds per perfect_agent move on boards it cannot solve outright
+SEARCH_LIMITS = (4, 0.05)  # (max depth, seconds) of search_agent
+PERCENTILES = (50, 90, 99)
+
+
+def heuristic_agent(game: TicTacToe, mark: str) -> Tuple[int, int]:
+    if mark == game.pet_mark:
+        return game.heuristic_move()
+    # The rule-based AI always plays the pet's mark: swap sides for the duration of the call
+    game.player_mark, game.pet_mark = game.pet_mark, game.player_mark
+    try:
+        return game.heuristic_move()
+    finally:
+        game.player_mark, game.pet_mark = game.pet_mark, game.player_mark
+
+
+def search_agent(game: TicTacToe, mark: str) -> Tuple[int, int]:
+    pos = game.searcher.best_move(game.lines, mark, *SEARCH_LIMITS)
+    return divmod(pos, game.col_length)
+
+
+def perfect_agent(game: TicTacToe, mark: str) -> Tuple[int, int]:
+    budget = None if game.searcher.sudden_death else PERFECT_BUDGET
+    pos = game.searcher.best_move(game.lines, mark, None, budget)
+    return divmod(pos, game.col_length)
+
+
+def random_agent(game: TicTacToe, mark: str) -> Tuple[int, int]:
+    return game.rng.choice(game.available_moves())
+
+
+AGENTS: Dict[str, Agent] = {
+    "heuristic": heuristic_agent,
+    "search": search_agent,
+    "random": random_agent,
+    "perfect": perfect_agent,
+}
+
+MATCHUPS = (("heuristic", "heuristic"), ("heuristic", "random"), ("heuristic", "perfect"),
+            ("search", "random"), ("search", "perfect"))
+
+
+def play_game(size: int, x_agent: Agent, o_agent: Agent, seed: int, x_first: bool = True,
+              latencies: Optional[Dict[str, List[float]]] = None) -> Optional[str]:
+    """Play one headless game; returns the winning mark or None for a draw."""
+    game = TicTacToe()
+    game.setup(None, None, seed=seed)
+    game.resize(size)
+    game.first = x_first
+    agents = {game.player_mark: x_agent, game.pet_mark: o_agent}
+    mark = game.player_mark if x_first else game.pet_mark
+    game.output = io.StringIO()
+    while True:
+        started = time.perf_counter()
+        row, col = agents[mark](game, mark)
+        if latencies is not None:
+            latencies[mark].append(time.perf_counter() - started)
+        if not game.make_move(row, col, mark):
+            raise ValueError(f"illegal move {(row, col)} by {mark}")
+        if game._check_game_over():
+            return game.winner
+        mark = game.pet_mark if mark == game.player_mark else game.player_mark
+
+
+def percentiles(samples: Sequence[float], points: Iterable[int] = PERCENTILES) -> Dict[str, float]:
+    """Nearest-rank percentiles of samples in seconds, returned in milliseconds."""
+    ordered = sorted(samples)
+    return {f"p{point}": nearest_rank(ordered, point) * 1000 for point in points}
+
+
+def run_matchup(size: int, first: str, second: str, games: int = 20, seed: int = 0) -> Dict:
+    """Play games between two named agents, alternating who moves first."""
+    latencies = {"X": [], "O": []}
+    outcomes = {"win": 0, "draw": 0, "loss": 0}
+    started = time.perf_counter()
+    for index in range(games):
+        winner = play_game(size, AGENTS[first], AGENTS[second], seed + index, index % 2 == 0, latencies)
+        outcomes["draw" if winner is None else ("win" if winner == "X" else "loss")] += 1
+    elapsed = time.perf_counter() - started
+    return {
+        "size": size,
+        "matchup": f"{first} vs {second}",
+        "games": games,
+        "games_per_s": games / elapsed if elapsed else float("inf"),
+        "rates": {outcome: count / games for outcome, count in outcomes.items()},
+        "latency_ms": {"first": percentiles(latencies["X"]), "second": percentiles(latencies["O"])},
+    }
+
+
+def run_arena(sizes: Iterable[int] = (3, 4, 5), matchups: Iterable[Tuple[str, str]] = MATCHUPS,
+              games: int = 20, seed: int = 0) -> List[Dict]:
+    """Run every matchup on every board size."""
+    return [run_matchup(size, first, second, games, seed) for size in sizes for first, second in matchups]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Tic-Tac-Toe AIs in headless self-play.")
+    parser.add_argument("-g", "--games", type=int, default=20)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=[3, 4, 5])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for result in run_arena(args.sizes, games=args.games, seed=args.seed):
+        rates = result["rates"]
+        print(f"{result['size']}x{result['size']} {result['matchup']:<22} {result['games_per_s']:8.1f} games/s  "
+              f"win {rates['win']:.0%} draw {rates['draw']:.0%} loss {rates['loss']:.0%}")
+        for side, points in result["latency_ms"].items():
+            print(f"    {side:<7} " + "  ".join(f"{name} {value:7.3f} ms" for name, value in points.items()))
@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional, Tuple
+
+"""
+ticTacToeBoard.py
+
+Incremental line bookkeeping for n x n Tic-Tac-Toe.
+
+Every winning window (win_length cells in a row, column, diagonal or anti-diagonal) is a
+"line". LineBoard precomputes the lines and, for each cell, the ids of the lines through it.
+It then keeps, per mark, how many cells of each line that mark holds, and how many lines the
+mark has completed:
+
+    place(pos, mark)     bump the counts of the lines through pos; a count reaching
+                         win_length completes a line
+    undo(pos)            the exact reverse
+    check_winner()       completed-line totals, already maintained: O(1)
+    completes(pos, mark) lines through the empty cell pos that mark would complete there,
+                         i.e. lines where mark already holds win_length - 1 cells
+
+Cells are flat indices (row * size + col). TicTacToe keeps its list-of-lists `board` for
+display and mirrors every move into a LineBoard for the win checks and AI helpers.
+"""
+
+EMPTY = " "
+
+
+def build_lines(size: int, win_length: int) -> List[Tuple[int, ...]]:
+    """All winning windows of an n x n board as tuples of flat cell indices."""
+    lines = []
+    span = size - win_length + 1
+    for row in range(size):
+        for col in range(span):
+            lines.append(tuple(row * size + col + k for k in range(win_length)))
+    for col in range(size):
+        for row in range(span):
+            lines.append(tuple((row + k) * size + col for k in range(win_length)))
+    for row in range(span):
+        for col in range(span):
+            lines.append(tuple((row + k) * size + col + k for k in range(win_length)))
+    for row in range(span):
+        for col in range(win_length - 1, size):
+            lines.append(tuple((row + k) * size + col - k for k in range(win_length)))
+    return lines
+
+
+class LineBoard:
+    """Board cells plus per-mark, per-line occupancy counts."""
+
+    __slots__ = ("size", "win_length", "cells", "lines", "cell_lines", "counts", "wins", "empty_count")
+
+    def __init__(self, size: int, win_length: Optional[int] = None):
+        self.size = size
+        self.win_length = win_length or size
+        self.cells = [EMPTY] * (size * size)
+        self.lines = build_lines(size, self.win_length)
+        cell_lines: List[List[int]] = [[] for _ in range(size * size)]
+        for line_id, line in enumerate(self.lines):
+            for pos in line:
+                cell_lines[pos].append(line_id)
+        self.cell_lines = tuple(tuple(ids) for ids in cell_lines)
+        self.counts: Dict[str, List[int]] = {}
+        self.wins: Dict[str, int] = {}
+        self.empty_count = size * size
+
+    def _counts_for(self, mark: str) -> List[int]:
+        counts = self.counts.get(mark)
+        if counts is None:
+            counts = self.counts[mark] = [0] * len(self.lines)
+            self.wins[mark] = 0
+        return counts
+
+    def place(self, pos: int, mark: str) -> None:
+        """Put mark on the empty cell pos."""
+        counts = self._counts_for(mark)
+        full = self.win_length
+        for line_id in self.cell_lines[pos]:
+            counts[line_id] += 1
+            if counts[line_id] == full:
+                self.wins[mark] += 1
+        self.cells[pos] = mark
+        self.empty_count -= 1
+
+    def undo(self, pos: int) -> None:
+        """Clear the cell pos, reversing place()."""
+        mark = self.cells[pos]
+        if mark == EMPTY:
+            return
+        counts = self.counts[mark]
+        full = self.win_length
+        for line_id in self.cell_lines[pos]:
+            if counts[line_id] == full:
+                self.wins[mark] -= 1
+            counts[line_id] -= 1
+        self.cells[pos] = EMPTY
+        self.empty_count += 1
+
+    def completes(self, pos: int, mark: str) -> int:
+        """Number of lines mark would complete by playing the empty cell pos."""
+        counts = self.counts.get(mark)
+        if counts is None:
+            return 0
+        target = self.win_length - 1
+        return sum(1 for line_id in self.cell_lines[pos] if counts[line_id] == target)
+
+    def check_winner(self) -> Dict[str, int]:
+        """Completed lines per mark, only for marks that have at least one."""
+        return {mark: wins for mark, wins in self.wins.items() if wins}
+
+    def has_won(self, mark: str) -> bool:
+        return self.wins.get(mark, 0) > 0
+
+    def empties(self) -> List[int]:
+        """Empty cells in row-major order."""
+        return [pos for pos, cell in enumerate(self.cells) if cell == EMPTY]
@@ -0,0 +1,259 @@
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+from .ticTacToeBoard import LineBoard, EMPTY
+
+"""
+ticTacToeSearch.py
+
+Search-based pet AI for n x n Tic-Tac-Toe: negamax with alpha-beta pruning.
+
+- Rules: with sudden_death (the 3x3 game) the first completed line wins. Otherwise (4x4 and
+  5x5) play continues until the board is full and the mark with more completed lines wins.
+- Positions are hashed with Zobrist keys, one 64-bit key per (cell, mark) plus a side-to-move
+  key. The search keeps eight hashes at once, one per board symmetry (rotations and
+  reflections), and files every position under the smallest. Symmetric positions therefore
+  share one transposition-table entry. The stored best move is kept in that canonical
+  orientation and mapped back when probed.
+- At the root, moves that lead to symmetric positions are searched once.
+- Moves are ordered: transposition-table move, then immediate wins, blocks, and cells
+  crossing many open lines.
+- Iterative deepening runs depth 1, 2, ... until max_depth, a proven result, or the time
+  budget. The answer is the best move of the deepest finished iteration.
+- At the depth limit, positions are scored by completed lines and by open lines (lines the
+  opponent has not entered), weighted by the square of how full they are.
+"""
+
+WIN = 1_000_000
+LINE_SCORE = 1_000
+_CHECK_EVERY = 512  # nodes between clock checks
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+def symmetries(size: int) -> List[Tuple[int, ...]]:
+    """The 8 symmetries of an n x n board as permutations of flat cell indices."""
+    def cell(row, col):
+        return row * size + col
+
+    last = size - 1
+    transforms = [
+        lambda r, c: (r, c), lambda r, c: (c, last - r), lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r), lambda r, c: (r, last - c), lambda r, c: (last - r, c),
+        lambda r, c: (c, r), lambda r, c: (last - c, last - r),
+    ]
+    return [tuple(cell(*transform(pos // size, pos % size)) for pos in range(size * size))
+            for transform in transforms]
+
+
+class TicTacToeSearch:
+    """Alpha-beta searcher with a symmetry-aware Zobrist transposition table."""
+
+    def __init__(self, size: int, win_length: Optional[int] = None, marks: Tuple[str, str] = ("X", "O"),
+                 sudden_death: Optional[bool] = None, seed: int = 0):
+        self.size = size
+        self.win_length = win_length or size
+        self.marks = marks
+        self.sudden_death = size < 4 if sudden_death is None else sudden_death
+        rng = random.Random(seed)
+        self.zobrist = {mark: [rng.getrandbits(64) for _ in range(size * size)] for mark in marks}
+        self.side_key = rng.getrandbits(64)
+        self.perms = symmetries(size)
+        self.inverse = [tuple(sorted(range(size * size), key=perm.__getitem__)) for perm in self.perms]
+        self.table: Dict[int, Tuple[int, int, int, int]] = {}  # key -> (depth, value, flag, canonical move)
+        self.nodes = 0
+        self.depth_reached = 0
+        self._hashes = [0] * 8
+        self._deadline = None
+
+    # === Public API ===
+    def best_move(self, board: LineBoard, mark: str, max_depth: Optional[int] = None,
+                  time_budget: Optional[float] = None) -> Optional[int]:
+        """Return the flat cell index of the best move for mark, or None if the board is full."""
+        empties = board.empties()
+        if not empties:
+            return None
+        opponent = self.marks[1] if mark == self.marks[0] else self.marks[0]
+        max_depth = min(max_depth or len(empties), len(empties))
+        self._deadline = time.perf_counter() + time_budget if time_budget else None
+        self._hashes = self._hash_board(board, mark)
+        self.nodes = 0
+        self.depth_reached = 0
+
+        root_moves = self._distinct_moves(board, empties, mark)
+        best = root_moves[0]
+        for depth in range(1, max_depth + 1):
+            try:
+                value, move = self._root(board, root_moves, best, depth, mark, opponent)
+            except SearchTimeout:
+                break
+            best = move
+            self.depth_reached = depth
+            if abs(value) >= WIN - board.size * board.size:
+                break  # proven win or loss: deeper search cannot change the move
+        return best
+
+    # === Hashing ===
+    def _hash_board(self, board: LineBoard, to_move: str) -> List[int]:
+        hashes = []
+        for perm in self.perms:
+            value = self.side_key if to_move == self.marks[1] else 0
+            for pos, cell in enumerate(board.cells):
+                if cell != EMPTY:
+                    value ^= self.zobrist[cell][perm[pos]]
+            hashes.append(value)
+        return hashes
+
+    def _toggle(self, pos: int, mark: str) -> None:
+        """XOR a (cell, mark) and the side-to-move key into all eight hashes."""
+        keys = self.zobrist[mark]
+        side = self.side_key
+        hashes = self._hashes
+        for t, perm in enumerate(self.perms):
+            hashes[t] ^= keys[perm[pos]] ^ side
+
+    def _canonical(self) -> Tuple[int, int]:
+        """(smallest hash, index of the symmetry that produced it)."""
+        hashes = self._hashes
+        best = min(hashes)
+        return best, hashes.index(best)
+
+    # === Search ===
+    def _distinct_moves(self, board: LineBoard, empties: List[int], mark: str) -> List[int]:
+        """Root moves with symmetric duplicates removed."""
+        seen = set()
+        moves = []
+        for pos in empties:
+            self._toggle(pos, mark)
+            key = self._canonical()[0]
+            self._toggle(pos, mark)
+            if key not in seen:
+                seen.add(key)
+                moves.append(pos)
+        return moves
+
+    def _root(self, board, moves, first, depth, mark, opponent):
+        alpha, beta = -WIN - 1, WIN + 1
+        ordered = [first] + [pos for pos in self._order(board, moves, mark, opponent, None) if pos != first]
+        best_move, best_value = ordered[0], -WIN - 1
+        for pos in ordered:
+            value = self._after_move(board, pos, depth, -beta, -alpha, mark, opponent, 1)
+            if value > best_value:
+                best_value, best_move = value, pos
+            alpha = max(alpha, value)
+        return best_value, best_move
+
+    def _after_move(self, board, pos, depth, alpha, beta, mark, opponent, ply):
+        """Play pos for mark, score it from mark's point of view, and take it back."""
+        completed = board.completes(pos, mark) if self.sudden_death else 0
+        board.place(pos, mark)
+        self._toggle(pos, mark)
+        try:
+            if completed:
+                value = WIN - ply
+            elif board.empty_count == 0:
+                value = self._final(board, mark, opponent, ply)
+            else:
+                value = -self._negamax(board, depth - 1, -beta, -alpha, opponent, mark, ply + 1)
+        finally:
+            self._toggle(pos, mark)
+            board.undo(pos)
+        return value
+
+    def _negamax(self, board, depth, alpha, beta, mark, opponent, ply):
+        self.nodes += 1
+        if self._deadline is not None and self.nodes % _CHECK_EVERY == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout
+        if depth <= 0:
+            return self._evaluate(board, mark, opponent)
+
+        key, symmetry = self._canonical()
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, flag, canonical_move = entry
+            tt_move = self.inverse[symmetry][canonical_move]
+            if entry_depth >= depth:
+                if flag == 0 or (flag < 0 and value <= alpha) or (flag > 0 and value >= beta):
+                    return value
+
+        original_alpha = alpha
+        best_value, best_move = -WIN - 1, None
+        for pos in self._order(board, board.empties(), mark, opponent, tt_move):
+            value = self._after_move(board, pos, depth, alpha, beta, mark, opponent, ply)
+            if value > best_value:
+                best_value, best_move = value, pos
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        flag = -1 if best_value <= original_alpha else (1 if best_value >= beta else 0)
+        self.table[key] = (depth, best_value, flag, self.perms[symmetry][best_move])
+        return best_value
+
+    def _order(self, board, moves, mark, opponent, tt_move):
+        """Sort moves: table move, wins, blocks, then cells crossing the most open lines."""
+        opponent_counts = board.counts.get(opponent)
+        my_counts = board.counts.get(mark)
+
+        def priority(pos):
+            if pos == tt_move:
+                return 1 << 30
+            score = board.completes(pos, mark) * 10_000 + board.completes(pos, opponent) * 1_000
+            for line_id in board.cell_lines[pos]:
+                if not opponent_counts or not opponent_counts[line_id]:
+                    score += 1 + (my_counts[line_id] if my_counts else 0)
+            return score
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def _final(self, board, mark, opponent, ply):
+        """Score a full board from mark's point of view."""
+        if self.sudden_death:
+            return 0
+        diff = board.wins.get(mark, 0) - board.wins.get(opponent, 0)
+        if diff == 0:
+            return 0
+        return (WIN - ply if diff > 0 else ply - WIN) + diff
+
+    def _evaluate(self, board, mark, opponent):
+        """Heuristic score at the depth limit, from the point of view of mark (to move)."""
+        mine = board.counts.get(mark)
+        theirs = board.counts.get(opponent)
+        score = LINE_SCORE * (board.wins.get(mark, 0) - board.wins.get(opponent, 0))
+        for line_id in range(len(board.lines)):
+            a = mine[line_id] if mine else 0
+            b = theirs[line_id] if theirs else 0
+            if a and not b:
+                score += a * a
+            elif b and not a:
+                score -= b * b
+        return score
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark search self-play on an n x n board.")
+    parser.add_argument("-s", "--size", type=int, default=4)
+    parser.add_argument("-d", "--depth", type=int, default=None)
+    parser.add_argument("-t", "--time-budget", type=float, default=0.5)
+    args = parser.parse_args()
+
+    board = LineBoard(args.size)
+    search = TicTacToeSearch(args.size)
+    mark, other = "X", "O"
+    nodes = 0
+    started = time.perf_counter()
+    while board.empty_count and not (search.sudden_death and board.check_winner()):
+        board.place(search.best_move(board, mark, args.depth, args.time_budget), mark)
+        nodes += search.nodes
+        print(f"{mark}: depth {search.depth_reached:2}, {search.nodes:,} nodes")
+        mark, other = other, mark
+    elapsed = time.perf_counter() - started
+    moves = args.size * args.size - board.empty_count
+    print(f"{moves} moves in {elapsed:.2f}s ({elapsed * 1000 / moves:.1f} ms/move, {nodes / elapsed:,.0f} nodes/s), "
+          f"lines {board.check_winner() or 'none'}")
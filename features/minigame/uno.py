@@ -1,9 +1,11 @@
 from .baseClass import MinigameStrategy
-from random import choice, shuffle
+from .unoCards import (
+    WILD, SKIP, REVERSE, DRAW_TWO, DRAW_FOUR, PLAYABLE, card_name, chosen, colour_of, is_wild, new_deck, value_of,
+)
+from random import Random
 from features.user import User
 from constants.configs import LINE, UnoConstants as UC
 from utils.colorize import red, green, blue
-import time
 from colorama import init
 
 init(autoreset=True)
@@ -13,96 +15,57 @@ class Uno(MinigameStrategy):
 
     name = "UNO Card"
 
-    def setup(self, player, pet):
+    def setup(self, player, pet, seed=None):
         self.player = player
         self.pet = pet
-        self.deck = []
+        self._reset_table([
+            {'name': 'You', 'hand': [], 'emoji': '👤'},
+            {'name': self.pet.name, 'hand': [], 'emoji': self.pet.emoji},
+        ], seed)
+        self.opponent = User.users.find_random(lambda user: user != self.player and user.pets)
+
+    def _reset_table(self, players, seed=None):
+        """Start a new table with the given player seats and a game RNG seeded with seed."""
+        self.deck = bytearray()
         self.top_card = None
-        self.player_hand = []
-        self.pet_hand = []
-        self.discard = []
+        self.discard = bytearray()
         self.turns = 0
         self.winner = None
         self.current_player_index = 0
         self.skip = False
-        self.players = [
-            {'name': 'You', 'hand': [], 'emoji': '👤'},
-            {'name': self.pet.name, 'hand': [], 'emoji': self.pet.emoji},
-        ]
-        other_players_with_pets = list(filter(lambda user: user != self.player and user.pets, User.users.values()))
-        if other_players_with_pets:
-            self.opponent = choice(other_players_with_pets)
-        else:
-            self.opponent = None
+        self.players = players
         self.direction = 1
+        self.reshuffles = 0
+        self.rng = Random(seed)
 
     def build_deck(self):
-        """Builds and returns a full UNO deck."""
-
-        self.deck = []
+        """Builds and returns a full, shuffled UNO deck (a bytearray of card codes)."""
 
-        # Number Cards
-        for color in UC.COLORS:
-            self.deck.append(f"{color} 0")
-            for v in UC.VALUES[1:]:
-                self.deck.append(f"{color} {v}")
-                self.deck.append(f"{color} {v}")
-        
-        # Action Cards (2 of each)
-        for color in UC.COLORS:
-            for action in UC.ACTION_CARDS:
-                self.deck.append(f"{color} {action}")
-                self.deck.append(f"{color} {action}")
-        
-        # Wild Cards (4 of each)
-        for wild in UC.WILD_CARDS:
-            for _ in range(4):
-                self.deck.append(wild)
-        
-        shuffle(self.deck)
+        self.deck = new_deck(shuffled=False)
+        self.rng.shuffle(self.deck)
         return self.deck
 
-    @staticmethod
-    def display_menu():
+    def display_menu(self):
         """Show a description and choices to the player."""
-        print("\n" + LINE)
-        print("🃏 UNO Card Minigame 🃏")
-        print(LINE)
-        print("Play this classic UNO card minigame with your pet!")
-        print("\nRules:")
-        print(LINE)
-        print("- Each player will be given cards depending on game choices.")
-        print("- Play one card matching the discard in color, number or symbol.")
-        print("- Skip: Next player misses turn")
-        print("- Reverse: Changes direction (3+ players)")
-        print("- DrawTwo: Next player draws 2 cards")
-        print("- Wild: Choose any color")
-        print("- Wild DrawFour: Choose color and next player draws 4")
-        print(LINE)
+        self.say("\n" + LINE)
+        self.say("🃏 UNO Card Minigame 🃏")
+        self.say(LINE)
+        self.say("Play this classic UNO card minigame with your pet!")
+        self.say("\nRules:")
+        self.say(LINE)
+        self.say("- Each player will be given cards depending on game choices.")
+        self.say("- Play one card matching the discard in color, number or symbol.")
+        self.say("- Skip: Next player misses turn")
+        self.say("- Reverse: Changes direction (3+ players)")
+        self.say("- DrawTwo: Next player draws 2 cards")
+        self.say("- Wild: Choose any color")
+        self.say("- Wild DrawFour: Choose color and next player draws 4")
+        self.say(LINE)
     
     @staticmethod
     def can_play(card, top_card):
-        """Return True if card can be played on top_card."""
-        card_parts = card.split()
-        top_parts = top_card.split()
-
-        card_color = card_parts[0]
-        card_value = ' '.join(card_parts[1:])
-
-        top_color = top_parts[0]
-        top_value = ' '.join(top_parts[1:]) if len(top_parts) > 1 else None
-
-        if "Wild" in card_color:
-            return True
-        
-        if top_parts[0] == "Wild" and len(top_parts) > 1:
-            chosen_color = top_parts[1]  
-            return card_parts[0] == chosen_color
-        
-        if top_color in UC.COLORS and top_value is None:
-            return card_color == top_color
-        
-        return card_color == top_color or card_value == top_value
+        """Return True if card can be played on top_card (both card codes)."""
+        return PLAYABLE[top_card] >> card & 1 == 1
     
     def draw_card(self):
         """Draw a card; reshuffle discard pile if deck is empty."""
@@ -111,92 +74,98 @@ class Uno(MinigameStrategy):
             self.deck.extend(self.discard)
             self.discard.clear()
             self.discard.append(top)
-            shuffle(self.deck)
+            self.rng.shuffle(self.deck)
+            self.reshuffles += 1
 
         return self.deck.pop()
 
     def get_valid_moves(self, hand):
         """Get all valid moves from a hand."""
-        return [card for card in hand if self.can_play(card, self.top_card)]
+        playable = PLAYABLE[self.top_card]
+        return [card for card in hand if playable >> card & 1]
 
-    def get_input(self, player):
+    async def get_input(self, player):
         """Get and validate user input for their turn."""
-        print(f"\n{player['name']}'s Turn:")
-        print(LINE)
-        print("Top Card:", self.top_card)
+        self.say(f"\n{player['name']}'s Turn:")
+        self.say(LINE)
+        self.say("Top Card:", card_name(self.top_card))
 
-        print("\nYour Hand:")
+        self.say("\nYour Hand:")
         for i, c in enumerate(player['hand']):
-            print(f" {i + 1}. {c}")
-        print(LINE)
+            self.say(f" {i + 1}. {card_name(c)}")
+        self.say(LINE)
 
         valid_moves = self.get_valid_moves(player['hand'])
 
         if valid_moves:
-            print("\nValid moves:")
+            self.say("\nValid moves:")
             for i, c in enumerate(valid_moves):
-                print(f"{i + 1}. {c}")
-            print(LINE)
-            choice = input("Play (h) or draw (p)? ").strip().lower()
+                self.say(f"{i + 1}. {card_name(c)}")
+            self.say(LINE)
+            choice = (await self.ask("Play (h) or draw (p)? ")).strip().lower()
             return choice, valid_moves
         else:
-            print(red("\nThere is no more valid moves for player!"))
+            self.say(red("\nThere is no more valid moves for player!"))
             return 'p', None
 
     
-    def build_question(self):
+    async def build_question(self):
         """Build the game setup - optional difficulty or rules."""
 
-        total_players = self._multiplayer_choice()
+        total_players = await self._multiplayer_choice()
         if total_players > 2:
             self._setup_player(total_players)
 
-        print("\nUNO Games:")
-        print(LINE)
-        print("1. Standard UNO (7 cards each)")
-        print("2. Quick UNO (5 cards each)")
-        print("3. Challenge UNO (10 cards each)")
-        print(LINE)
+        self.say("\nUNO Games:")
+        self.say(LINE)
+        self.say("1. Standard UNO (7 cards each)")
+        self.say("2. Quick UNO (5 cards each)")
+        self.say("3. Challenge UNO (10 cards each)")
+        self.say(LINE)
 
         try:
-            choice = int(input("Choose your game modes (1/2/3/4): ").strip())
+            choice = int((await self.ask("Choose your game modes (1/2/3/4): ")).strip())
         except ValueError:
             choice = 1
         if choice not in range(1, 5):
             choice = 1
 
+        if choice == 1:
+            hand_size = 7
+        elif choice == 2:
+            hand_size = 5
+        else:
+            hand_size = 10
+
+        self.deal(hand_size)
+
+    def deal(self, hand_size):
+        """Shuffle a fresh deck, turn up a non-wild top card and deal hand_size cards to everyone."""
         self.build_deck()
 
         self.top_card = self.draw_card()
-        while "Wild" in self.top_card:
+        while is_wild(self.top_card):
             self.deck.append(self.top_card)
-            shuffle(self.deck)
+            self.rng.shuffle(self.deck)
             self.top_card = self.draw_card()
         
         self.discard.append(self.top_card)
 
-        if choice == 1:
-            hand_size = 7
-        elif choice == 2:
-            hand_size = 5
-        else:
-            hand_size = 10
-
         for player in self.players:
             player['hand'] = [self.draw_card() for _ in range(hand_size) if self.deck]
     
-    def _multiplayer_choice(self):
+    async def _multiplayer_choice(self):
         """Choose number of players."""
 
-        print("\nUNO Multiplayer Games:")
-        print(LINE)
-        print("1. 2 Players")
-        print("2. 3 Players")
-        print("3. 4 Players")
-        print("4. 5 Players")
-        print(LINE)
+        self.say("\nUNO Multiplayer Games:")
+        self.say(LINE)
+        self.say("1. 2 Players")
+        self.say("2. 3 Players")
+        self.say("3. 4 Players")
+        self.say("4. 5 Players")
+        self.say(LINE)
         try:
-            player_count = int(input("Choose your game modes (1/2/3/4): ").strip())
+            player_count = int((await self.ask("Choose your game modes (1/2/3/4): ")).strip())
         except ValueError:
             player_count = 1
 
@@ -211,14 +180,14 @@ class Uno(MinigameStrategy):
         """Setup players list based on total players."""
 
         if not self.opponent:
-            print(red("\nNo other players available!"))
+            self.say(red("\nNo other players available!"))
 
         elif len(self.opponent.pets) < total_players - 2:
-            print(red("\nNot enough player!"))
+            self.say(red("\nNot enough player!"))
         else:
             list_player_names = [player['name'] for player in self.players]
             for _ in range(total_players - 2):
-                opponent_pet = choice([pet for pet in self.opponent.pets 
+                opponent_pet = self.rng.choice([pet for pet in self.opponent.pets 
                     if pet.name not in list_player_names])
                 self.players.append({
                     'name': opponent_pet.name,
@@ -227,50 +196,58 @@ class Uno(MinigameStrategy):
                 })
                 list_player_names.append(opponent_pet.name)
 
-    def _play_card(self, player, card):
-        """Play a card from hand. Returns the played card."""
+    def _play_card(self, player, card, colour=None):
+        """Play a card from hand (colour: the one a wild sets, chosen here if None). Returns the played card."""
         next_player_idx = (self.current_player_index + self.direction) % len(self.players)
 
         if card in player['hand']:
             player['hand'].remove(card)
-            print(f"\n{player['emoji']} {player['name']}: {card}")
+            self.say(f"\n{player['emoji']} {player['name']}: {card_name(card)}")
 
-        if 'Wild' in card:
-            played_card = self._handle_wild(player, card, next_player_idx)
-            self.discard.append(played_card)
-            return played_card
+        value = value_of(card)
+        if colour_of(card) == WILD:
+            # The physical card goes to the discard pile; the chosen colour becomes the top card
+            self.discard.append(card)
+            return self._handle_wild(player, card, next_player_idx, colour)
 
-        if 'DrawTwo' in card:
+        if value == DRAW_TWO:
             self._handle_draw_two(next_player_idx)
             self.skip = True
 
-        if 'Skip' in card:
+        if value == SKIP:
             self.skip = True
 
-        if 'Reverse' in card and len(self.players) > 2:
+        if value == REVERSE and len(self.players) > 2:
             self.direction *= -1
-            print(f"Direction reversed! Now going {'↻ clockwise' if self.direction == 1 else '↺ counter-clockwise'}")
+            self.say(f"Direction reversed! Now going {'↻ clockwise' if self.direction == 1 else '↺ counter-clockwise'}")
 
         self.discard.append(card)
         return card
 
 
-    def _handle_wild(self, player, card, next_player_idx):
+    def _handle_wild(self, player, card, next_player_idx, colour=None):
         """Handle Wild and Wild Draw Four cards."""
-        color = None
-        if player['name'].lower() != 'you':
-            color = choice(UC.COLORS)
-            print(f"{player['emoji']} {player['name'].title()} changes color to:", color)
-        else:
-            while color not in UC.COLORS:
-                color = input("Choose color (RED/YELLOW/GREEN/BLUE): ").strip().upper()
+        color = colour or self.choose_colour(player)
 
-        if 'DrawFour' in card:
+        if value_of(card) == DRAW_FOUR:
             for _ in range(4):
                 self.players[next_player_idx]['hand'].append(self.draw_card())
             self.skip = True
 
-        return f"Wild {color}"
+        return chosen(UC.COLORS.index(color))
+
+    def choose_colour(self, player):
+        """Pick at random the colour a pet's wild card sets (the player is asked in player_turn)."""
+        color = self.rng.choice(UC.COLORS)
+        self.say(f"{player['emoji']} {player['name'].title()} changes color to:", color)
+        return color
+
+    async def _ask_colour(self):
+        """Ask the player the colour their wild card sets."""
+        color = None
+        while color not in UC.COLORS:
+            color = (await self.ask("Choose color (RED/YELLOW/GREEN/BLUE): ")).strip().upper()
+        return color
 
 
     def _handle_draw_two(self, next_player_idx):
@@ -280,19 +257,25 @@ class Uno(MinigameStrategy):
 
     def _handle_draw(self, player):
         """Handle drawing a card when no valid moves."""
+        new_card = self._draw_playable(player)
+        if new_card is None:
+            return self.top_card
+        return self._play_card(player, new_card)
 
-        print(blue("\nDrawing..."))
+    def _draw_playable(self, player):
+        """Draw one card into the hand; returns it if it can be played, else None."""
+
+        self.say(blue("\nDrawing..."))
         new_card = self.draw_card()
         player['hand'].append(new_card)
 
-        print(f"{player['emoji']} {player['name'].title()} drew:", new_card)
+        self.say(f"{player['emoji']} {player['name'].title()} drew:", card_name(new_card))
     
         if self.can_play(new_card, self.top_card):
-            print(green(f"{player['name']} can play it!"))
-            return self._play_card(player, new_card)
-        else:
-            print(red("Cannot play. Turn ends."))
-            return self.top_card
+            self.say(green(f"{player['name']} can play it!"))
+            return new_card
+        self.say(red("Cannot play. Turn ends."))
+        return None
         
     def next_player(self):
         """Move to next player based on direction."""
@@ -301,82 +284,103 @@ class Uno(MinigameStrategy):
             self.skip = False
             self.current_player_index = (self.current_player_index + self.direction) % len(self.players)
             if self.players[self.current_player_index]['name'].lower() == 'you':
-                print(blue("Your turn skipped!"))
+                self.say(blue("Your turn skipped!"))
             else:
-                print(blue(f"{self.players[self.current_player_index]['name']}'s turn skipped!"))
+                self.say(blue(f"{self.players[self.current_player_index]['name']}'s turn skipped!"))
             self.current_player_index = (self.current_player_index + self.direction) % len(self.players)
         else:
             self.current_player_index = (self.current_player_index + self.direction) % len(self.players)
 
-    def player_turn(self, player):
+    async def player_turn(self, player):
         """Handle the player's full turn."""
         while True:
-            choice, valid_moves = self.get_input(player)
+            choice, valid_moves = await self.get_input(player)
 
             if choice == 'h' and valid_moves:
                 try:
-                    card_number = int(input('\nEnter card number: '))
+                    card_number = int(await self.ask('\nEnter card number: '))
                     card = valid_moves[card_number - 1]
-                    return self._play_card(player, card)
                 except (ValueError, IndexError):
-                    print(red("Invalid input! Please try again."))
+                    self.say(red("Invalid input! Please try again."))
+                    continue
             else:
-                return self._handle_draw(player)
+                card = self._draw_playable(player)
+                if card is None:
+                    return self.top_card
+            colour = await self._ask_colour() if is_wild(card) else None
+            return self._play_card(player, card, colour)
 
     
-    def opponent_turn(self, player):
+    async def opponent_turn(self, player):
         """Handle pet(s) move."""
 
-        print(f"\n{player['name']}'s Turn...")
-        print(LINE)
-        time.sleep(1)
-        valid_moves = self.get_valid_moves(player['hand'])
+        self.say(f"\n{player['name']}'s Turn...")
+        self.say(LINE)
+        await self.pause(1)
+        return self._bot_turn(player)
 
-        if valid_moves:
-            card = choice(valid_moves)
+    def _bot_turn(self, player):
+        """Play the card choose_card picks, or draw when there is none."""
+        valid_moves = self.get_valid_moves(player['hand'])
 
+        card = self.choose_card(player, valid_moves) if valid_moves else None
+        if card is not None:
             return self._play_card(player, card)
         
         else:
             return self._handle_draw(player)
 
-    def build_game(self):
+    def choose_card(self, player, valid_moves):
+        """Pick the card a pet plays from its valid moves (None draws instead)."""
+        return self.rng.choice(valid_moves)
+
+    async def build_game(self):
         """Run the interactive game loop."""
 
-        print("\nList of UNO Participants: ")
-        print(LINE)
+        self.say("\nList of UNO Participants: ")
+        self.say(LINE)
         for i, p in enumerate(self.players):
-            print(f" {i + 1}. {p['name']}")
+            self.say(f" {i + 1}. {p['name']}")
 
-        print(f"\nDealing with {len(self.players[0]['hand'])} cards each...")
-        time.sleep(1)
+        self.say(f"\nDealing with {len(self.players[0]['hand'])} cards each...")
+        await self.pause(1)
 
         while True:
             current_player = self.players[self.current_player_index]
-            print(f"Top Card: {self.top_card}")
+            self.say(f"Top Card: {card_name(self.top_card)}")
             if current_player['name'].lower() == "you":
-                card = self.player_turn(current_player)
+                card = await self.player_turn(current_player)
             else:
-                card = self.opponent_turn(current_player)
+                card = await self.opponent_turn(current_player)
 
-            if not current_player['hand']:
-                self.winner = current_player['name']
+            if self._finish_turn(current_player, card):
                 break
 
-            if card and card != self.top_card:
-                self.top_card = card
-            
-            if len(current_player['hand']) == 1 and current_player['name'].lower() != 'you':
-                print(green(f"\n{current_player['emoji']} {current_player['name']}: UNO!"))
-            
-            self.next_player()
-            self.turns += 1
+        return self.summary()
 
+    def _finish_turn(self, current_player, card):
+        """Apply the card a turn ended with; returns True when current_player has won."""
+        if not current_player['hand']:
+            self.winner = current_player['name']
+            return True
+
+        if card is not None and card != self.top_card:
+            self.top_card = card
+        
+        if len(current_player['hand']) == 1 and current_player['name'].lower() != 'you':
+            self.say(green(f"\n{current_player['emoji']} {current_player['name']}: UNO!"))
+        
+        self.next_player()
+        self.turns += 1
+        return False
+
+    def summary(self):
+        """Raw result of the finished game, as returned by build_game."""
         return {
             "winner": self.winner,
             "turns": self.turns,
-            "player_cards_left": len(self.player_hand),
-            "pet_cards_left": len(self.pet_hand),
+            "player_cards_left": len(self.players[0]['hand']),
+            "pet_cards_left": len(self.players[1]['hand']),
             "deck_size": len(self.deck)
         }
     
@@ -409,29 +413,19 @@ class Uno(MinigameStrategy):
         if outcome == "Win":
             coins = 30 + max(0, 20 - turns) + max(0, 10 - player_cards)
             pet_happiness = 2
-            print(green(f"\n🎉 You won in {turns} turns!"))
+            self.say(green(f"\n🎉 You won in {turns} turns!"))
         else:
             if winner == self.pet.name:
                 coins = max(5, 15 - player_cards)
                 pet_happiness = 10
-                print(green(f"\n🎉 Your pet won in {turns} turns!"))
+                self.say(green(f"\n🎉 Your pet won in {turns} turns!"))
             else:
                 coins = max(5, 35 - player_cards)
                 pet_happiness = 5
-                print(f"\nThe winner is: {winner}!")
-                print(red("\n💪 Better luck next time!"))
+                self.say(f"\nThe winner is: {winner}!")
+                self.say(red("\n💪 Better luck next time!"))
         
-        print(f"Reward: Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})")
-        print(green(f"You received Rp. {'{:,}'.format(coins * 1000)} 🎉"))
+        self.say(f"Reward: Rp. {'{:,}'.format(coins * 1000)}. Pet happiness (+{pet_happiness})")
+        self.say(green(f"You received Rp. {'{:,}'.format(coins * 1000)} 🎉"))
 
         return {"currency": coins, "pet_happiness": pet_happiness}
-    
-    def play(self, player, pet):
-        """Run the full UNO game and return rewards."""
-        self.setup(player, pet)
-        self.display_menu()
-        self.build_question()
-        summary = self.build_game()
-        result = self.evaluate(summary)
-        reward = self.reward(result)
-        return reward
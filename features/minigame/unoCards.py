@@ -0,0 +1,166 @@
+from random import shuffle
+from typing import Dict, Iterable, List, Optional, Tuple
+from constants.configs import UnoConstants as UC
+
+"""
+unoCards.py
+
+Integer card model for the UNO minigame.
+
+A card is one byte: colour in the high nibble, value in the low nibble.
+
+    colour  0-3 = UC.COLORS (RED, YELLOW, GREEN, BLUE), 4 = WILD
+    value   0-9 numbers, 10 Skip, 11 Reverse, 12 DrawTwo, 13 ColourChanger, 14 DrawFour,
+            15 CHOSEN
+
+CHOSEN only appears on the discard pile's top card. A played wild leaves "Wild <COLOUR>" on
+top (colour nibble = the chosen colour), while the physical wild card goes to the discard pile
+so a reshuffle puts real cards back in the deck.
+
+A deck is a bytearray of codes (108 cards, see new_deck), so shuffle, pop and extend work on
+raw bytes. PLAYABLE[top] is a bitmask over card codes: bit `card` is set when card may be
+played on top, so can_play is a shift and an AND and get_valid_moves is a filter over it.
+The rules match the string version they replace: wilds always play, a chosen colour matches
+only that colour, otherwise colour or value must match.
+
+Strings ("RED DrawTwo", "Wild DrawFour", "Wild RED") are for display only: card_name() and,
+for input or old saves, card_code().
+"""
+
+WILD = len(UC.COLORS)
+SKIP, REVERSE, DRAW_TWO = (len(UC.VALUES) + i for i in range(len(UC.ACTION_CARDS)))
+COLOUR_CHANGER, DRAW_FOUR = (DRAW_TWO + 1 + i for i in range(len(UC.WILD_CARDS)))
+CHOSEN = 15
+VALUE_MASK = 0x0F
+CODES = (WILD + 1) << 4
+
+_VALUE_NAMES = UC.VALUES + UC.ACTION_CARDS + [wild.split()[1] for wild in UC.WILD_CARDS]
+
+
+def card(colour: int, value: int) -> int:
+    return colour << 4 | value
+
+
+def colour_of(code: int) -> int:
+    return code >> 4
+
+
+def value_of(code: int) -> int:
+    return code & VALUE_MASK
+
+
+def is_wild(code: int) -> bool:
+    return code >> 4 == WILD
+
+
+def chosen(colour: int) -> int:
+    """Top-card code left by a wild after colour was chosen."""
+    return card(colour, CHOSEN)
+
+
+def _is_card(code: int) -> bool:
+    colour, value = code >> 4, code & VALUE_MASK
+    if colour == WILD:
+        return value in (COLOUR_CHANGER, DRAW_FOUR)
+    return colour < WILD and value <= DRAW_TWO
+
+
+def _name(code: int) -> Optional[str]:
+    colour, value = code >> 4, code & VALUE_MASK
+    if colour == WILD:
+        return f"Wild {_VALUE_NAMES[value]}" if _is_card(code) else None
+    if colour < WILD and value == CHOSEN:
+        return f"Wild {UC.COLORS[colour]}"
+    return f"{UC.COLORS[colour]} {_VALUE_NAMES[value]}" if _is_card(code) else None
+
+
+NAMES: Tuple[Optional[str], ...] = tuple(_name(code) for code in range(CODES))
+_BY_NAME: Dict[str, int] = {name: code for code, name in enumerate(NAMES) if name is not None}
+
+
+def card_name(code: int) -> str:
+    return NAMES[code]
+
+
+def card_code(name: str) -> int:
+    """Parse a display string back to its code; raises ValueError for unknown cards."""
+    try:
+        return _BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"unknown UNO card {name!r}") from None
+
+
+def _playable(top: int) -> int:
+    mask = 0
+    top_colour, top_value = top >> 4, top & VALUE_MASK
+    for code in range(CODES):
+        if not _is_card(code):
+            continue
+        colour, value = code >> 4, code & VALUE_MASK
+        if colour == WILD:
+            ok = True
+        elif top_colour == WILD:
+            ok = False  # an unresolved wild on top: only wilds follow it
+        elif top_value == CHOSEN:
+            ok = colour == top_colour
+        else:
+            ok = colour == top_colour or value == top_value
+        if ok:
+            mask |= 1 << code
+    return mask
+
+
+PLAYABLE: Tuple[int, ...] = tuple(_playable(top) for top in range(CODES))
+
+
+def can_play(code: int, top: int) -> bool:
+    return PLAYABLE[top] >> code & 1 == 1
+
+
+def valid_moves(hand: Iterable[int], top: int) -> List[int]:
+    mask = PLAYABLE[top]
+    return [code for code in hand if mask >> code & 1]
+
+
+def _full_deck() -> bytes:
+    """One 0 and two of 1-9, Skip, Reverse, DrawTwo per colour; four of each wild."""
+    deck = bytearray()
+    for colour in range(WILD):
+        deck.append(card(colour, 0))
+        for value in range(1, DRAW_TWO + 1):
+            deck += bytes((card(colour, value),)) * 2
+    for value in (COLOUR_CHANGER, DRAW_FOUR):
+        deck += bytes((card(WILD, value),)) * 4
+    return bytes(deck)
+
+
+DECK = _full_deck()
+
+
+def new_deck(shuffled: bool = True) -> bytearray:
+    """A full 108-card deck as a bytearray of codes."""
+    deck = bytearray(DECK)
+    if shuffled:
+        shuffle(deck)
+    return deck
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="Micro-benchmark UNO valid-move lookups.")
+    parser.add_argument("-n", "--lookups", type=int, default=200_000)
+    parser.add_argument("--hand", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = [(rng.sample(DECK, args.hand), rng.choice(DECK[:-8])) for _ in range(1000)]
+    started = time.perf_counter()
+    for i in range(args.lookups):
+        hand, top = cases[i % 1000]
+        valid_moves(hand, top)
+    elapsed = time.perf_counter() - started
+    print(f"{args.lookups / elapsed:,.0f} lookups/s for {args.hand}-card hands ({elapsed:.2f}s)")
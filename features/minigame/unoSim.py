@@ -0,0 +1,200 @@
+import io
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+from constants.configs import UnoConstants as UC
+from utils.stats import nearest_rank
+from .uno import Uno
+from .unoCards import DRAW_TWO, SKIP, WILD, colour_of, is_wild, value_of
+
+"""
+unoSim.py
+
+Headless, seeded UNO games for tournaments, policy comparisons and reward tuning.
+
+The interactive game asks the human for input and pauses a second before every pet turn
+(opponent_turn). Here every seat is a bot and the game's own rules are driven directly:
+
+- HeadlessUno seats one policy per player. Its choose_card / choose_colour hooks ask that
+  policy; turns run through Uno._bot_turn (play or draw) and Uno._finish_turn (winner check,
+  top card, next player), the same code build_game uses, minus the pause
+- Uno._reset_table(..., seed=N) seeds the game's RNG (shuffles, random choices), so a seed
+  replays the same game
+- the game's output (self.say) goes to a null stream; nothing touches the terminal
+- policies: RandomPolicy (what pets do), ColourHoardingPolicy (dump minority colours, keep
+  the majority colour and name it on wilds) and WildLastPolicy (hold wilds until nothing else
+  plays, lead with Skip/DrawTwo)
+- seat 0 is named "You" and seat 1 is the pet, so Uno.evaluate/reward price every game as
+  the real game would; tournament() reports the resulting payout distribution
+
+Games can stall: with every card in hands, the deck and discard pile can both run dry.
+HeadlessUno.draw_card checks for that before drawing and raises DeckExhausted; such games
+(and those past max_turns) end without a winner and are counted as stalled. Any other error
+is a bug and propagates.
+
+`python -m features.minigame.unoSim` runs a tournament and prints games/s and the stats.
+"""
+
+PET_NAME = "Pet"
+
+
+class DeckExhausted(Exception):
+    """Raised when a card must be drawn but the deck and the reshufflable discard are empty."""
+
+
+class _NullOutput(io.TextIOBase):
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+class _Seat:
+    name = PET_NAME
+    emoji = "🐾"
+
+
+def _colour_counts(hand: Sequence[int]) -> List[int]:
+    counts = [0] * WILD
+    for card in hand:
+        if not is_wild(card):
+            counts[colour_of(card)] += 1
+    return counts
+
+
+class RandomPolicy:
+    """Uniformly random valid card and colour: the built-in pet behaviour."""
+
+    name = "random"
+
+    def choose_card(self, game: Uno, hand: Sequence[int], valid: Sequence[int]) -> Optional[int]:
+        return game.rng.choice(valid)
+
+    def choose_colour(self, game: Uno, hand: Sequence[int]) -> str:
+        return game.rng.choice(UC.COLORS)
+
+
+class ColourHoardingPolicy(RandomPolicy):
+    """Keep the colour held most of; play cards of the rarest colour first."""
+
+    name = "hoard"
+
+    def choose_card(self, game, hand, valid):
+        counts = _colour_counts(hand)
+        return min(valid, key=lambda card: (is_wild(card), counts[colour_of(card)] if not is_wild(card) else 0))
+
+    def choose_colour(self, game, hand):
+        counts = _colour_counts(hand)
+        return UC.COLORS[counts.index(max(counts))]
+
+
+class WildLastPolicy(ColourHoardingPolicy):
+    """Hold wilds until nothing else plays; lead with Skip and DrawTwo, then high numbers."""
+
+    name = "wild-last"
+
+    def choose_card(self, game, hand, valid):
+        return max(valid, key=lambda card: (not is_wild(card), value_of(card) in (SKIP, DRAW_TWO), value_of(card)))
+
+
+POLICIES = {policy.name: policy for policy in (RandomPolicy, ColourHoardingPolicy, WildLastPolicy)}
+
+
+class HeadlessUno(Uno):
+    """Uno whose every seat is played by a policy."""
+
+    def __init__(self, policies: Sequence[RandomPolicy], seed: Optional[int] = None):
+        names = ["You", PET_NAME] + [f"Bot{i}" for i in range(3, len(policies) + 1)]
+        self.pet = _Seat()
+        self.output = _NullOutput()
+        self._reset_table([{'name': name, 'hand': [], 'emoji': '', 'policy': policy}
+                           for name, policy in zip(names, policies)], seed)
+
+    def draw_card(self):
+        # The top card stays on the discard pile, so only the cards under it can be reshuffled
+        if not self.deck and len(self.discard) <= 1:
+            raise DeckExhausted
+        return super().draw_card()
+
+    def choose_card(self, player, valid_moves):
+        return player['policy'].choose_card(self, player['hand'], valid_moves)
+
+    def choose_colour(self, player):
+        return player['policy'].choose_colour(self, player['hand'])
+
+
+def play_game(policies: Sequence[RandomPolicy], hand_size: int = 7, seed: Optional[int] = None,
+              max_turns: int = 2000) -> Dict:
+    """Play one headless game; returns the build_game summary plus seat and stall details."""
+    game = HeadlessUno(policies, seed)
+    stalled = False
+    game.deal(hand_size)
+    while True:
+        current = game.players[game.current_player_index]
+        try:
+            card = game._bot_turn(current)
+        except DeckExhausted:
+            stalled = True
+            break
+        if game._finish_turn(current, card) or game.turns >= max_turns:
+            stalled = game.winner is None
+            break
+    summary = game.summary()
+    reward = game.reward(game.evaluate(summary))
+    seat = next((i for i, player in enumerate(game.players) if player['name'] == game.winner), None)
+    return {**summary, "winner_seat": seat, "stalled": stalled, "reshuffles": game.reshuffles,
+            "cards_left": [len(player['hand']) for player in game.players], "reward": reward}
+
+
+def tournament(policy_names: Sequence[str], games: int = 1000, hand_size: int = 7, seed: int = 0) -> Dict:
+    """Play seeded games, rotating seats so each policy starts from each position."""
+    seats = len(policy_names)
+    wins = Counter()
+    turns, reshuffles, coins = [], [], []
+    stalled = 0
+    started = time.perf_counter()
+    for index in range(games):
+        shift = index % seats
+        order = list(policy_names[shift:]) + list(policy_names[:shift])
+        result = play_game([POLICIES[name]() for name in order], hand_size, seed + index)
+        turns.append(result["turns"])
+        reshuffles.append(result["reshuffles"])
+        coins.append(result["reward"]["currency"])
+        if result["stalled"]:
+            stalled += 1
+        else:
+            wins[order[result["winner_seat"]]] += 1
+    elapsed = time.perf_counter() - started
+    turns.sort()
+    coins.sort()
+    return {
+        "games": games,
+        "games_per_s": games / elapsed if elapsed else float("inf"),
+        "win_rate": {name: wins[name] / games / policy_names.count(name) for name in dict.fromkeys(policy_names)},
+        "stalled": stalled / games,
+        "turns": {"mean": sum(turns) / games, "p50": nearest_rank(turns, 50), "p90": nearest_rank(turns, 90),
+                  "max": turns[-1]},
+        "reshuffles": {"mean": sum(reshuffles) / games, "games_with": sum(1 for r in reshuffles if r) / games},
+        "coins": {"mean": sum(coins) / games, "p10": nearest_rank(coins, 10), "p50": nearest_rank(coins, 50),
+                  "p90": nearest_rank(coins, 90)},
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a headless UNO tournament between bot policies.")
+    parser.add_argument("policies", nargs="*", default=["random", "hoard", "wild-last"],
+                        help=f"one policy per seat (2-5) from {', '.join(POLICIES)}")
+    parser.add_argument("-g", "--games", type=int, default=2000)
+    parser.add_argument("--hand", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not 2 <= len(args.policies) <= 5:
+        parser.error("choose 2 to 5 policies")
+
+    stats = tournament(args.policies, args.games, args.hand, args.seed)
+    print(f"{stats['games']} games in {stats['games'] / stats['games_per_s']:.2f}s -> {stats['games_per_s']:,.0f} games/s")
+    print("win rate   " + "  ".join(f"{name} {rate:.1%}" for name, rate in stats["win_rate"].items())
+          + f"  stalled {stats['stalled']:.1%}")
+    print("turns      " + "  ".join(f"{key} {value:.1f}" for key, value in stats["turns"].items()))
+    print(f"reshuffles mean {stats['reshuffles']['mean']:.2f}, in {stats['reshuffles']['games_with']:.0%} of games")
+    print("seat-0 payout (coins) " + "  ".join(f"{key} {value:.1f}" for key, value in stats["coins"].items()))
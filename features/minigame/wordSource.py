@@ -0,0 +1,233 @@
+import os
+import re
+import sys
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+"""
+wordSource.py
+
+Memory-mapped, indexed access to the MemoryMatch word list (datas/words.txt).
+
+Loading the ~370k-word dictionary into a Python list costs far more than the handful of
+words a game needs. WordSource instead builds an offset index once, stores it in a
+sidecar file (`words.txt.idx`) next to the word list, and memory-maps both files. Picking
+a word is then an O(1) slice of the mapped file: no list is ever materialised.
+
+Words are bucketed by character class and length, and the offsets are stored sorted by
+(class, length). A difficulty band (a length range over a few classes) is therefore at
+most one contiguous run per class, and WordSource.band() samples it in constant time.
+
+Sidecar layout (little-endian):
+
+    header  magic b"WIDX", version u32, source size u64, source mtime_ns u64, word count u32
+    table   BUCKETS + 1 x u32 prefix starts, bucket = class * MAX_BUCKET_LENGTH + (length - 1)
+    body    word count x u32 byte offsets of each word's first character, in bucket order
+
+Words longer than MAX_BUCKET_LENGTH share the last length bucket of their class. The
+sidecar is rebuilt whenever the word list's size or mtime changes. If it cannot be
+written (read-only install), the index is kept in memory for the process instead.
+
+WordSource and WordBand implement __len__/__getitem__, so random.choice() works on both.
+"""
+
+INDEX_MAGIC = b"WIDX"
+INDEX_VERSION = 2
+
+# Character classes, easiest first
+COMMON = 0  # lowercase a-z without j/q/x/z
+RARE = 1    # lowercase a-z using at least one of j/q/x/z
+OTHER = 2   # digits, capitals, punctuation, non-ASCII
+CLASSES = (COMMON, RARE, OTHER)
+MAX_BUCKET_LENGTH = 24
+BUCKETS = len(CLASSES) * MAX_BUCKET_LENGTH
+
+_HEADER = struct.Struct("<4sIQQI")
+_TABLE = struct.Struct(f"<{BUCKETS + 1}I")
+_OFFSET = struct.Struct("<I")
+_WORD = re.compile(rb"\S+")
+_LOWER = re.compile(rb"[a-z]+")
+_RARE_LETTER = re.compile(rb"[jqxz]")
+
+
+def word_class(word: bytes) -> int:
+    """Classify a word (as bytes) into COMMON, RARE or OTHER."""
+    if not _LOWER.fullmatch(word):
+        return OTHER
+    return RARE if _RARE_LETTER.search(word) else COMMON
+
+
+class WordSource:
+    """Random-access view over a whitespace-separated word list, in bucket order."""
+
+    _shared: Dict[str, "WordSource"] = {}
+
+    def __init__(self, path: Union[str, Path] = "datas/words.txt"):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self._words: Optional[mmap.mmap] = None
+        self._offsets: Union[mmap.mmap, array, None] = None
+        self._table: Tuple[int, ...] = ()
+        self._base = 0
+        self._count = 0
+        self._bands: Dict[tuple, "WordBand"] = {}
+
+    @classmethod
+    def shared(cls, path: Union[str, Path] = "datas/words.txt") -> "WordSource":
+        """Return a process-wide WordSource for path (mapped once, reused by every game)."""
+        key = os.path.abspath(path)
+        if key not in cls._shared:
+            cls._shared[key] = cls(path)
+        return cls._shared[key]
+
+    # === Sequence protocol ===
+    def __len__(self) -> int:
+        self._open()
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        self._open()
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        return self._word_at(i)
+
+    def _word_at(self, i: int) -> str:
+        if isinstance(self._offsets, array):
+            start = self._offsets[i]
+        else:
+            start = _OFFSET.unpack_from(self._offsets, self._base + 4 * i)[0]
+        return _WORD.match(self._words, start).group().decode("utf-8")
+
+    # === Difficulty bands ===
+    def band(self, min_length: int, max_length: int, classes: Iterable[int] = (COMMON,)) -> "WordBand":
+        """Return the words of min_length..max_length characters in the given classes.
+
+        Lengths above MAX_BUCKET_LENGTH are clamped, so a max_length past it includes every
+        longer word as well. Bands are cached per source.
+        """
+        self._open()
+        low = max(1, min(min_length, MAX_BUCKET_LENGTH))
+        high = min(max_length, MAX_BUCKET_LENGTH)
+        key = (low, high, tuple(sorted(set(classes))))
+        if key not in self._bands:
+            runs = []
+            for word_cls in key[2]:
+                if low > high:
+                    break
+                first = self._table[word_cls * MAX_BUCKET_LENGTH + low - 1]
+                last = self._table[word_cls * MAX_BUCKET_LENGTH + high]
+                if last > first:
+                    runs.append((first, last - first))
+            self._bands[key] = WordBand(self, runs)
+        return self._bands[key]
+
+    def bucket_size(self, word_cls: int, length: int) -> int:
+        """Number of words in one (class, length) bucket."""
+        self._open()
+        bucket = word_cls * MAX_BUCKET_LENGTH + min(length, MAX_BUCKET_LENGTH) - 1
+        return self._table[bucket + 1] - self._table[bucket]
+
+    # === Index management ===
+    def _open(self) -> None:
+        """Map the word list and its offset index on first use."""
+        if self._words is not None:
+            return
+
+        stat = self.path.stat()
+        with open(self.path, "rb") as f:
+            words = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+
+        if not self._load_sidecar(stat):
+            table, offsets = self._build_index(words)
+            if not self._write_sidecar(stat, table, offsets) or not self._load_sidecar(stat):
+                self._table, self._offsets, self._base, self._count = tuple(table), offsets, 0, len(offsets)
+        # Published last, so a failed open is retried rather than leaving a half-built source
+        self._words = words
+
+    def _load_sidecar(self, stat: os.stat_result) -> bool:
+        """Map the sidecar index if it exists and matches the current word list."""
+        try:
+            with open(self.index_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+
+        body = _HEADER.size + _TABLE.size
+        if len(index) < body:
+            index.close()
+            return False
+        magic, version, size, mtime_ns, count = _HEADER.unpack_from(index, 0)
+        if (magic, version, size, mtime_ns) != (INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns) \
+                or len(index) != body + 4 * count:
+            index.close()
+            return False
+
+        self._table = _TABLE.unpack_from(index, _HEADER.size)
+        self._offsets, self._base, self._count = index, body, count
+        return True
+
+    @staticmethod
+    def _build_index(words: Union[mmap.mmap, bytes]) -> Tuple[List[int], array]:
+        """Scan the word list once, bucket every word, and return (prefix table, offsets)."""
+        buckets = [array("I") for _ in range(BUCKETS)]
+        appenders = [bucket.append for bucket in buckets]
+        lower, rare_letter = _LOWER.fullmatch, _RARE_LETTER.search
+        for match in _WORD.finditer(words):
+            word = match.group()
+            if lower(word):
+                length = len(word)
+                word_cls = RARE if rare_letter(word) else COMMON
+            else:
+                length = len(word.decode("utf-8", "replace"))
+                word_cls = OTHER
+            appenders[word_cls * MAX_BUCKET_LENGTH + min(length, MAX_BUCKET_LENGTH) - 1](match.start())
+
+        table = [0]
+        offsets = array("I")
+        for bucket in buckets:
+            offsets.extend(bucket)
+            table.append(len(offsets))
+        return table, offsets
+
+    def _write_sidecar(self, stat: os.stat_result, table: List[int], offsets: array) -> bool:
+        """Atomically write the sidecar index; returns False if the directory is read-only."""
+        if sys.byteorder != "little":
+            offsets = array("I", offsets)
+            offsets.byteswap()
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns, len(offsets)))
+                f.write(_TABLE.pack(*table))
+                f.write(offsets.tobytes())
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            return False
+        return True
+
+
+class WordBand:
+    """Words of one difficulty band: a few contiguous runs of a WordSource's bucket order."""
+
+    def __init__(self, source: WordSource, runs: List[Tuple[int, int]]):
+        self.source = source
+        self.runs = runs
+        self._count = sum(count for _, count in runs)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        for first, count in self.runs:
+            if i < count:
+                return self.source._word_at(first + i)
+            i -= count
@@ -17,8 +17,8 @@ This module provides:
   (food, soap, potion), and behaviors (feed, play, bath, health care, sleep, etc).
 
 Notes:
-- The VirtualPet class stores simple integer stats (0..100) and provides helper
-  methods to render upgrade/status summaries using the Formatter utility.
+- The VirtualPet class stores simple integer stats (0..100) in __slots__ (no per-pet
+  __dict__) and renders upgrade/status summaries with one Formatter shared by all pets.
 - Potion/food/soap definitions are provided as class-level dictionaries to be
   referenced by shop/inventory code.
 - This file focuses on behavior and in-memory state; persistence and user-facing
@@ -35,6 +35,8 @@ class AbstractPet(ABC):
     actions that change internal stats (play, feed, bath, health care, sleep).
     """
 
+    __slots__ = ("name", "age", "type")
+
     def __init__(self, name: str, age: float = 0.0, species: str = "Pet") -> None:
         self.name: str = name
         self.age: float = age
@@ -91,9 +93,16 @@ class VirtualPet(AbstractPet):
       - name, age, type: identity fields.
       - happiness, hunger, sanity, health, fat, energy: core integer stats (roughly 0..100).
       - generosity: small counter used by conversation logic to limit gifts.
-      - format: Formatter instance used to render status boxes for the CLI.
+      - format: class-level Formatter shared by every pet to render status boxes for the CLI.
+
+    Per-pet state lives in __slots__; subclasses keep species data (emoji, tastes, songs)
+    as class attributes so it is stored once per species rather than once per pet.
     """
 
+    __slots__ = ("happiness", "hunger", "sanity", "health", "fat", "energy", "generosity")
+
+    format = Formatter()
+
     def __init__(self, name: str, age: float = 0.0, species: str = "Pet"):
         """
         Initialize a VirtualPet with randomized baseline stats.
@@ -110,7 +119,6 @@ class VirtualPet(AbstractPet):
         self.fat: int = 0
         self.energy: int = randrange(0, 50)
         self.generosity = 0
-        self.format = Formatter()
 
     def get_mood(self) -> str:
         """
@@ -175,6 +183,40 @@ class VirtualPet(AbstractPet):
         self.age += 0.2
         self.limit_stat()
 
+    def catch_up(self, ticks: int) -> None:
+        """
+        Apply `ticks` calls of time_past() in O(1), e.g. for time spent offline.
+
+        The first tick is applied normally; afterwards every stat is an integer in 0..100 and
+        the rules reduce to counting the ticks that trigger each penalty:
+          - hunger falls by 10 per tick until it clamps at 0;
+          - happiness loses 5 on each tick whose decremented hunger is below 50;
+          - health loses 10 on each tick whose decremented hunger is exactly 0 (only the
+            tick that starts at hunger 10), or on every tick if energy is 0.
+        Age grows by 0.2 per tick, computed as one multiplication, so it can differ from
+        repeated addition in the last floating-point digits.
+        """
+        if ticks <= 0:
+            return
+        self.time_past()
+        rest = ticks - 1
+        if rest == 0:
+            return
+
+        hunger = self.hunger
+        # Ticks j = 0..rest-1 start with hunger max(0, hunger - 10j); penalised while that is < 60
+        first_unhappy = max(0, (hunger - 60) // 10 + 1)
+        unhappy_ticks = max(0, rest - first_unhappy)
+        if self.energy == 0:
+            sick_ticks = rest
+        else:
+            sick_ticks = int(hunger >= 10 and hunger % 10 == 0 and (hunger - 10) // 10 < rest)
+
+        self.hunger = max(0, hunger - 10 * rest)
+        self.happiness = max(0, self.happiness - 5 * unhappy_ticks)
+        self.health = max(0, self.health - 10 * sick_ticks)
+        self.age += 0.2 * rest
+
     def get_age(self) -> float:
         """Return the pet's age (float, game-specific units)."""
         return self.age
@@ -342,4 +384,4 @@ class VirtualPet(AbstractPet):
         print(f"{self.name}'s energy increased by {hours * 10}" \
                f" and hunger decreased by {hours * 5}.")
 
-        print(yellow(self.sleep_upgrade_stats()))
\ No newline at end of file
+        print(yellow(self.sleep_upgrade_stats()))
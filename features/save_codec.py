@@ -0,0 +1,265 @@
+import json
+import struct
+from typing import Any, Dict, List
+
+"""
+save_codec.py
+
+Encoders/decoders for the on-disk save snapshot formats used by SaveManager.
+
+Two formats are supported:
+- "json":   UTF-8 JSON (the historical format, pretty-printed with indent=4).
+- "binary": a compact, versioned, msgpack-style encoding.
+
+Binary layout (all integers little-endian):
+
+    magic  b"VPSV"                                  4 bytes
+    format version                                  u8
+    string table: count, mode byte, then either one NUL-joined utf-8 blob
+                  (length-prefixed) or, if any string contains NUL,
+                  (length, utf-8 bytes) per entry                   (varints)
+    one tagged value (the snapshot)
+
+Every string in the snapshot (dict keys, pet types, item names, usernames, ...)
+is stored once in the string table and referenced by index, so the repeated keys
+of pet records and inventory items cost one or two bytes each. Integers are
+zigzag varints, so typical stats (0..100) take a single byte.
+
+Readers reject unknown magic bytes or newer format versions with SaveFormatError
+instead of guessing, so old builds never misread files written by newer ones.
+"""
+
+MAGIC = b"VPSV"
+FORMAT_VERSION = 1
+
+SAVE_FORMATS = ("json", "binary")
+FILE_EXTENSIONS = {"json": ".json", "binary": ".bin"}
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+_TABLE_JOINED, _TABLE_PREFIXED = range(2)
+_DOUBLE = struct.Struct("<d")
+
+
+class SaveFormatError(ValueError):
+    """Raised when a save payload is not in a recognised or supported format."""
+
+
+def format_for_path(name: str) -> str:
+    """Return the save format implied by a shard file name."""
+    return "binary" if name.endswith(FILE_EXTENSIONS["binary"]) else "json"
+
+
+def encode(data: Any, save_format: str) -> bytes:
+    """Serialize a snapshot in the requested format."""
+    if save_format == "binary":
+        return encode_binary(data)
+    if save_format == "json":
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    raise SaveFormatError(f"Unknown save format: {save_format!r}")
+
+
+def decode(payload: bytes, save_format: str) -> Any:
+    """Deserialize a snapshot written in the given format."""
+    if save_format == "binary":
+        return decode_binary(payload)
+    if save_format == "json":
+        try:
+            return json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise SaveFormatError(f"Corrupt JSON save: {e}") from e
+    raise SaveFormatError(f"Unknown save format: {save_format!r}")
+
+
+# === Binary encoder ===
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_binary(data: Any) -> bytes:
+    """Serialize a JSON-compatible value to the compact binary format."""
+    strings: Dict[str, int] = {}
+    body = bytearray()
+
+    def intern(text: str) -> None:
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        _write_varint(body, index)
+
+    def write(value: Any) -> None:
+        if value is None:
+            body.append(_NONE)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif isinstance(value, int):
+            body.append(_INT)
+            _write_varint(body, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, float):
+            body.append(_FLOAT)
+            body.extend(_DOUBLE.pack(value))
+        elif isinstance(value, str):
+            body.append(_STR)
+            intern(value)
+        elif isinstance(value, (list, tuple)):
+            body.append(_LIST)
+            _write_varint(body, len(value))
+            for item in value:
+                write(item)
+        elif isinstance(value, dict):
+            body.append(_DICT)
+            _write_varint(body, len(value))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise SaveFormatError(f"Dict keys must be strings, got {type(key).__name__}")
+                intern(key)
+                write(item)
+        else:
+            raise SaveFormatError(f"Cannot encode value of type {type(value).__name__}")
+
+    write(data)
+
+    out = bytearray(MAGIC)
+    out.append(FORMAT_VERSION)
+    _write_varint(out, len(strings))
+    if any("\x00" in text for text in strings):
+        out.append(_TABLE_PREFIXED)
+        for text in strings:
+            raw = text.encode("utf-8")
+            _write_varint(out, len(raw))
+            out += raw
+    else:
+        # One NUL-joined blob decodes with a single split() instead of a loop per string
+        raw = "\x00".join(strings).encode("utf-8")
+        out.append(_TABLE_JOINED)
+        _write_varint(out, len(raw))
+        out += raw
+    out += body
+    return bytes(out)
+
+
+# === Binary decoder ===
+def _decode_text(raw) -> str:
+    try:
+        return str(raw, "utf-8")
+    except UnicodeDecodeError as e:
+        raise SaveFormatError("Corrupt string table in binary save") from e
+
+
+def decode_binary(payload: bytes) -> Any:
+    """Deserialize a value written by encode_binary."""
+    if payload[:4] != MAGIC:
+        raise SaveFormatError("Not a binary save (bad magic bytes)")
+    if len(payload) < 5 or payload[4] > FORMAT_VERSION:
+        raise SaveFormatError(f"Unsupported binary save version: {payload[4:5].hex() or 'missing'}")
+
+    view = memoryview(payload)
+    pos = 5
+    size = len(payload)
+
+    def read_varint() -> int:
+        nonlocal pos
+        result = shift = 0
+        while True:
+            if pos >= size:
+                raise SaveFormatError("Truncated binary save")
+            byte = payload[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    count = read_varint()
+    if pos >= size:
+        raise SaveFormatError("Truncated binary save")
+    table_mode = payload[pos]
+    pos += 1
+    table: List[str] = []
+    if table_mode == _TABLE_JOINED:
+        length = read_varint()
+        if pos + length > size:
+            raise SaveFormatError("Truncated binary save")
+        if count:
+            table = _decode_text(view[pos:pos + length]).split("\x00")
+        pos += length
+        if len(table) != count:
+            raise SaveFormatError("Corrupt string table in binary save")
+    elif table_mode == _TABLE_PREFIXED:
+        for _ in range(count):
+            length = read_varint()
+            if pos + length > size:
+                raise SaveFormatError("Truncated binary save")
+            table.append(_decode_text(view[pos:pos + length]))
+            pos += length
+    else:
+        raise SaveFormatError(f"Unknown string table mode {table_mode}")
+
+    def read() -> Any:
+        nonlocal pos
+        tag = payload[pos]
+        pos += 1
+        if tag == _INT:
+            raw = payload[pos]
+            if raw < 0x80:
+                # Single-byte fast path: covers every stat and most counters
+                pos += 1
+            else:
+                raw = read_varint()
+            return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1)
+        if tag == _STR:
+            index = payload[pos]
+            if index < 0x80:
+                pos += 1
+                return table[index]
+            return table[read_varint()]
+        if tag == _DICT:
+            count = read_varint()
+            result = {}
+            for _ in range(count):
+                index = payload[pos]
+                if index < 0x80:
+                    pos += 1
+                else:
+                    index = read_varint()
+                # Inline the common small int / string leaves to avoid a call per value
+                tag = payload[pos]
+                raw = payload[pos + 1] if pos + 1 < size else 0x80
+                if tag == _INT and raw < 0x80:
+                    pos += 2
+                    result[table[index]] = (raw >> 1) if not raw & 1 else -((raw + 1) >> 1)
+                elif tag == _STR and raw < 0x80:
+                    pos += 2
+                    result[table[index]] = table[raw]
+                else:
+                    result[table[index]] = read()
+            return result
+        if tag == _LIST:
+            return [read() for _ in range(read_varint())]
+        if tag == _FLOAT:
+            if pos + 8 > size:
+                raise SaveFormatError("Truncated binary save")
+            value = _DOUBLE.unpack_from(payload, pos)[0]
+            pos += 8
+            return value
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        raise SaveFormatError(f"Unknown value tag {tag}")
+
+    try:
+        value = read()
+    except IndexError as e:
+        raise SaveFormatError("Truncated or corrupt binary save") from e
+    except RecursionError as e:
+        raise SaveFormatError("Binary save is nested too deeply") from e
+    if pos != size:
+        raise SaveFormatError("Trailing bytes after binary save")
+    return value
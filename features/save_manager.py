@@ -1,27 +1,40 @@
 # features/save_manager.py
+import os
+import copy
 import json
+import hashlib
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
+from constants.configs import SAVE_FORMAT
+from .save_codec import SAVE_FORMATS, FILE_EXTENSIONS, SaveFormatError, encode, decode, format_for_path
 
 """
 save_manager.py
 
 Singleton SaveManager responsible for saving, loading, deleting, and listing
-player save data as JSON in the `saves/player_saves.json` file.
+player save data as JSON under the `saves/` directory.
 
 Design notes:
 - Implements a simple singleton pattern so callers can obtain SaveManager.get_instance()
-  and operate on the single shared save file.
-- Saves are stored as a mapping username -> game_state dict. Each saved state is
-  annotated with a 'last_saved' ISO timestamp.
+  and operate on the shared save directory.
+- Saves are sharded: every account lives in its own `saves/users/<digest>.json` (or `.bin`)
+  file and a
+  small `saves/index.json` maps username -> shard file name. Saving, loading or deleting one
+  user only touches that user's shard (the index is rewritten only when an account is
+  created or removed).
+- Each saved state is annotated with a 'last_saved' ISO timestamp.
+- Writes are crash-safe: every save/delete is first appended (and fsynced) to the
+  write-ahead journal `saves/journal.log`, which is the commit point. Shards and the index
+  are only rewritten at checkpoints, via temp file + fsync + rename, so a crash can never
+  leave a half-written shard behind. On startup the journal is replayed and checkpointed.
+- Shards are written in the configured format (`SAVE_FORMAT`: "json" or the compact,
+  versioned "binary" format from save_codec). Reads pick the codec from the file extension,
+  so mixed directories work and convert_saves() rewrites every shard into one format.
+- The legacy single-file format (`saves/player_saves.json`) is still understood: on first
+  run it is split into shards and the old file is kept as `player_saves.json.migrated`.
 - The implementation is tolerant of missing/corrupt save files and returns empty
   mappings in those cases.
-
-Changes:
-- Translated inline comments to English and added module/class/method docstrings.
-- Fixed minor whitespace typos in attribute access (self.save_directory / self.save_file).
-  No behavioral changes were made.
 """
 
 
@@ -31,6 +44,9 @@ class SaveManager:
     _instance: Optional["SaveManager"] = None
     _initialized: bool = False
 
+    # Number of journal records after which pending saves are folded into the shards
+    JOURNAL_CHECKPOINT_EVERY: int = 50
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(SaveManager, cls).__new__(cls)
@@ -38,7 +54,9 @@ class SaveManager:
 
     def __init__(self):
         """
-        Initialize the save directory and file on first construction.
+        Initialize the save directory, shard directory and index on first construction.
+
+        Shards are written in the format named by constants.configs.SAVE_FORMAT.
 
         The constructor is idempotent: subsequent instantiations reuse the same
         underlying save directory/file information.
@@ -48,6 +66,19 @@ class SaveManager:
             self.save_directory = Path("saves")
             self.save_directory.mkdir(exist_ok=True)
             self.save_file = self.save_directory / "player_saves.json"
+            self.save_format = SAVE_FORMAT
+            self.users_directory = self.save_directory / "users"
+            self.users_directory.mkdir(exist_ok=True)
+            self.index_file = self.save_directory / "index.json"
+            self.journal_file = self.save_directory / "journal.log"
+            # username -> latest journaled state not yet checkpointed (None marks a deletion)
+            self._pending: Dict[str, Optional[Dict[str, Any]]] = {}
+            # shard files replaced by a file in another format, removed at the next checkpoint
+            self._stale_shards: set = set()
+            self._journal_records = 0
+            self._index = self._load_index()
+            self._migrate_legacy_saves()
+            self._replay_journal()
             SaveManager._initialized = True
 
     @classmethod
@@ -61,25 +92,20 @@ class SaveManager:
         """
         Save game state for a specific user.
 
-        The provided game_state mapping will be stored under the username key and
-        annotated with a 'last_saved' ISO timestamp.
+        The provided game_state mapping is annotated with a 'last_saved' ISO timestamp
+        and committed to the journal; it reaches the user's shard file at the next checkpoint.
 
         Returns:
             True on success, False on failure.
         """
         try:
-            # Load existing saves
-            all_saves = self._load_all_saves()
-
             # Add timestamp
             game_state["last_saved"] = datetime.now().isoformat()
 
-            # Update user's save
-            all_saves[username] = game_state
-
-            # Write to file
-            with open(self.save_file, "w", encoding="utf-8") as f:
-                json.dump(all_saves, f, indent=4, ensure_ascii=False)
+            # Commit to the journal, then apply in memory
+            self._append_journal({"op": "save", "username": username, "state": game_state})
+            self._apply_record(username, copy.deepcopy(game_state))
+            self._maybe_checkpoint()
 
             print(f"\n✅ Game saved successfully for {username}!")
             return True
@@ -96,11 +122,11 @@ class SaveManager:
             The saved mapping if present, otherwise None.
         """
         try:
-            all_saves = self._load_all_saves()
+            game_state = self._get_state(username)
 
-            if username in all_saves:
+            if game_state is not None:
                 print(f"\n✅ Game loaded successfully for {username}!")
-                return all_saves[username]
+                return game_state
             else:
                 print(f"\n⚠️ No save file found for {username}.")
                 return None
@@ -117,13 +143,10 @@ class SaveManager:
             True if a save was removed, False if none existed or on error.
         """
         try:
-            all_saves = self._load_all_saves()
-
-            if username in all_saves:
-                del all_saves[username]
-
-                with open(self.save_file, "w", encoding="utf-8") as f:
-                    json.dump(all_saves, f, indent=4, ensure_ascii=False)
+            if username in self._index:
+                self._append_journal({"op": "delete", "username": username})
+                self._apply_record(username, None)
+                self._maybe_checkpoint()
 
                 print(f"\n✅ Save deleted for {username}!")
                 return True
@@ -136,22 +159,267 @@ class SaveManager:
             return False
 
     def list_saves(self) -> list:
-        """Return a list of usernames for which saves exist."""
-        all_saves = self._load_all_saves()
-        return list(all_saves.keys())
+        """Return a list of usernames for which saves exist (read from the index only)."""
+        return list(self._index.keys())
+
+    def convert_saves(self, save_format: str) -> int:
+        """
+        Rewrite every shard in the given format ("json" or "binary").
+
+        Future saves use the new format too. Returns the number of shards converted.
+        """
+        if save_format not in SAVE_FORMATS:
+            raise SaveFormatError(f"Unknown save format: {save_format!r}")
+
+        self._checkpoint()
+        self.save_format = save_format
+        converted = 0
+        for username in list(self._index):
+            if format_for_path(self._index[username]) == save_format:
+                continue
+            game_state = self._read_shard(username)
+            if game_state is None:
+                continue
+            self._apply_record(username, game_state)
+            converted += 1
+        self._checkpoint()
+        return converted
 
     def _load_all_saves(self) -> Dict[str, Any]:
         """
-        Load and return the complete save mapping from disk.
+        Load and return the complete username -> save mapping from every shard.
+
+        This is O(total players) and is only meant for bulk tooling; per-user
+        operations should go through load_game/save_game instead.
+        """
+        all_saves = {}
+        for username in self._index:
+            game_state = self._get_state(username)
+            if game_state is not None:
+                all_saves[username] = game_state
+        return all_saves
+
+    # === Shard helpers ===
+    @staticmethod
+    def _shard_name(username: str, save_format: str = "json") -> str:
+        """Return a filesystem-safe, case-insensitive shard file name for a username."""
+        digest = hashlib.sha1(username.casefold().encode("utf-8")).hexdigest()
+        return f"{digest}{FILE_EXTENSIONS[save_format]}"
+
+    def _shard_path(self, username: str) -> Path:
+        """Return the path of the shard file holding the given user's save."""
+        return self.users_directory / self._index.get(username, self._shard_name(username, self.save_format))
+
+    def _get_state(self, username: str) -> Optional[Dict[str, Any]]:
+        """Return a user's latest state, preferring journaled-but-not-checkpointed data."""
+        if username in self._pending:
+            return copy.deepcopy(self._pending[username])
+        if username in self._index:
+            return self._read_shard(username)
+        return None
+
+    def _read_shard(self, username: str) -> Optional[Dict[str, Any]]:
+        """Read one user's shard; returns None if it is missing or corrupt."""
+        return self._read_snapshot(self._shard_path(username))
+
+    @staticmethod
+    def _read_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+        """Decode a shard file using the codec implied by its extension."""
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                return decode(f.read(), format_for_path(path.name))
+        except SaveFormatError:
+            # Corrupted shard -> only this user's save is unavailable
+            return None
+
+    @staticmethod
+    def _write_snapshot(path: Path, data: Dict[str, Any]) -> None:
+        """Atomically serialize a mapping to the given path in the codec implied by its extension."""
+        SaveManager._write_atomic(path, encode(data, format_for_path(path.name)))
+
+    @staticmethod
+    def _write_atomic(path: Path, payload: bytes) -> None:
+        """
+        Atomically write bytes to the given path.
+
+        The data is written to a sibling temp file, fsynced and renamed over the target,
+        so readers only ever see the old or the new complete file.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        SaveManager._fsync_directory(path.parent)
+
+    @staticmethod
+    def _fsync_directory(directory: Path) -> None:
+        """Flush a directory entry so a completed rename survives power loss (POSIX only)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _load_index(self) -> Dict[str, str]:
+        """
+        Load the username -> shard file mapping.
+
+        A missing index with existing shards, or a corrupt index, is rebuilt from the shards.
+        """
+        if not self.index_file.exists():
+            return self._rebuild_index()
+
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            return self._rebuild_index()
+
+    def _rebuild_index(self) -> Dict[str, str]:
+        """
+        Reconstruct the index by scanning every shard for its stored username.
+
+        If a user has shards in both formats (crash during conversion), the newest wins.
+        """
+        index = {}
+        shards = [path for ext in FILE_EXTENSIONS.values() for path in self.users_directory.glob(f"*{ext}")]
+        for path in sorted(shards, key=lambda shard: shard.stat().st_mtime_ns):
+            try:
+                username = self._read_snapshot(path).get("user", {}).get("username")
+            except AttributeError:
+                continue
+            if username:
+                index[username] = path.name
+        return index
+
+    def _write_index(self) -> None:
+        """Persist the in-memory index to disk."""
+        self._write_snapshot(self.index_file, self._index)
+
+    # === Journal helpers ===
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """
+        Durably append one record to the write-ahead journal.
+
+        The record is committed once this returns. If the write fails part-way, the
+        journal is truncated back so the torn bytes cannot corrupt the next record.
+        """
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.journal_file, "ab") as f:
+            start = f.tell()
+            try:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            except Exception:
+                f.truncate(start)
+                raise
+        self._journal_records += 1
+
+    def _apply_record(self, username: str, game_state: Optional[Dict[str, Any]]) -> None:
+        """Apply a save (state) or delete (None) to the in-memory view."""
+        self._pending[username] = game_state
+        if game_state is None:
+            self._index.pop(username, None)
+            return
+
+        shard_name = self._shard_name(username, self.save_format)
+        current = self._index.get(username)
+        if current != shard_name:
+            if current is not None:
+                self._stale_shards.add(current)
+            self._index[username] = shard_name
+
+    def _replay_journal(self) -> None:
+        """
+        Re-apply every complete journal record left by a previous run, then checkpoint.
 
-        Returns an empty dict if the save file does not exist or is corrupt.
+        A torn trailing record (crash mid-append) is not valid JSON and is ignored.
+        """
+        if not self.journal_file.exists():
+            return
+
+        with open(self.journal_file, "rb") as f:
+            for raw in f:
+                try:
+                    record = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                if record.get("op") == "save":
+                    self._apply_record(record["username"], record["state"])
+                elif record.get("op") == "delete":
+                    self._apply_record(record["username"], None)
+
+        self._checkpoint()
+
+    def _maybe_checkpoint(self) -> None:
+        """Checkpoint once enough records have accumulated in the journal."""
+        if self._journal_records >= self.JOURNAL_CHECKPOINT_EVERY:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """
+        Fold pending journal records into the shards and index, then reset the journal.
+
+        Shards and the index are replaced atomically and the journal is only emptied once
+        they are durable, so a crash at any point is recovered by replaying the journal.
+        """
+        for username, game_state in self._pending.items():
+            if game_state is None:
+                for save_format in SAVE_FORMATS:
+                    (self.users_directory / self._shard_name(username, save_format)).unlink(missing_ok=True)
+            else:
+                self._write_snapshot(self._shard_path(username), game_state)
+        if self._pending or not self.index_file.exists():
+            self._write_index()
+        for shard_name in self._stale_shards - set(self._index.values()):
+            (self.users_directory / shard_name).unlink(missing_ok=True)
+        self._stale_shards = set()
+
+        with open(self.journal_file, "wb") as f:
+            os.fsync(f.fileno())
+        self._pending = {}
+        self._journal_records = 0
+
+    def _migrate_legacy_saves(self) -> None:
+        """
+        Split a legacy `player_saves.json` into per-user shards.
+
+        The legacy file is renamed to `player_saves.json.migrated` afterwards so the
+        migration only runs once and the original data is kept as a backup.
         """
         if not self.save_file.exists():
-            return {}
+            return
 
         try:
             with open(self.save_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                legacy_saves = json.load(f)
         except json.JSONDecodeError:
-            # Corrupted file -> treat as no saves
-            return {}
\ No newline at end of file
+            # Corrupted legacy file -> nothing to migrate, but keep it for inspection
+            return
+
+        for username, game_state in legacy_saves.items():
+            if username not in self._index:
+                shard_name = self._shard_name(username, self.save_format)
+                self._write_snapshot(self.users_directory / shard_name, game_state)
+                self._index[username] = shard_name
+
+        self._write_index()
+        self.save_file.replace(self.save_file.with_name(self.save_file.name + ".migrated"))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert saved games between the JSON and binary formats.")
+    parser.add_argument("format", choices=SAVE_FORMATS, help="target save format")
+    args = parser.parse_args()
+    count = SaveManager.get_instance().convert_saves(args.format)
+    print(f"Converted {count} save(s) to {args.format}.")
@@ -1,11 +1,13 @@
 import math
 import re
-import bcrypt
 from constants.configs import FOOD_DEF, SOAP_DEF, POTION_DEF, VALID_PASSWORD
-from random import randrange
-from typing import Dict, Any, Optional
+from collections.abc import MutableMapping
+from random import randrange, shuffle
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional
 from colorama import init
 from .pet import VirtualPet
+from .credential import Credential
+from .auth_service import AuthService
 from utils.colorize import red, yellow, green
 init(autoreset=True)
 
@@ -21,37 +23,128 @@ Responsibilities:
   (create_memento / restore_from_memento) used by the memento/save system.
 
 Notes:
-- Passwords are hashed with bcrypt. When restoring from saved state the module accepts
-  pre-hashed passwords (starting with the bcrypt prefix).
+- Passwords are held as a Credential (bcrypt). When restoring from saved state the stored
+  hash is wrapped as-is (any bcrypt variant, never re-hashed); a successful login upgrades
+  hashes whose cost differs from the configured BCRYPT_ROUNDS.
+- All bcrypt work runs on the AuthService worker pool; login/register are synchronous
+  wrappers and login_async/register_async await the same pool.
 - Inventory is initialized from the VirtualPet class-level item definitions.
+- User.users is a lazy UserRegistry: saved accounts are known by name only and a full
+  User (with pets) is built the first time it is looked up.
 - This file includes light input validation and prints user-facing messages; core logic is unchanged.
 """
 
+class UserRegistry(MutableMapping):
+    """
+    Case-folded username -> User mapping that hydrates saved accounts on demand.
+
+    Saved accounts are registered as stubs (just their stored username) through
+    attach_loader(); the loader callable builds the full User the first time the key
+    is looked up. Membership tests, len() and iteration over keys never hydrate.
+    """
+
+    def __init__(self):
+        self._users: Dict[str, "User"] = {}
+        self._stubs: Dict[str, str] = {}
+        self._loader: Optional[Callable[[str], Optional["User"]]] = None
+
+    def attach_loader(self, usernames: Iterable[str], loader: Callable[[str], Optional["User"]]) -> None:
+        """Register saved usernames as stubs, to be built with `loader(username)` on first access."""
+        self._loader = loader
+        for username in usernames:
+            key = username.casefold()
+            if key not in self:
+                self._stubs[key] = username
+
+    def __getitem__(self, key: str) -> "User":
+        if key in self._users:
+            return self._users[key]
+        if key in self._stubs and self._loader is not None:
+            user = self._loader(self._stubs[key])
+            if user is not None:
+                del self._stubs[key]
+                self._users[key] = user
+                return user
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, user: "User") -> None:
+        self._stubs.pop(key, None)
+        self._users[key] = user
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._users:
+            del self._users[key]
+        elif key in self._stubs:
+            del self._stubs[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._users or key in self._stubs
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._users)
+        yield from list(self._stubs)
+
+    def __len__(self) -> int:
+        return len(self._users) + len(self._stubs)
+
+    def clear(self) -> None:
+        """Forget every loaded user and stub without hydrating anything."""
+        self._users.clear()
+        self._stubs.clear()
+
+    def loaded(self) -> list:
+        """Return the users that are already built (no hydration)."""
+        return list(self._users.values())
+
+    def find_random(self, predicate: Callable[["User"], Any]) -> Optional["User"]:
+        """
+        Return a uniformly random user satisfying `predicate`, or None.
+
+        Candidates are visited in random order and hydrated one at a time, so only the
+        accounts inspected before the first match are built.
+        """
+        keys = list(self)
+        shuffle(keys)
+        for key in keys:
+            try:
+                user = self[key]
+            except KeyError:
+                continue
+            if predicate(user):
+                return user
+        return None
+
+
 class User:
     """
     Represents a player / account in the game.
 
     Attributes:
-        users: class-level mapping of username -> User (in-memory registry).
+        users: class-level lazy registry of username -> User (see UserRegistry).
         current_user: class-level pointer to the signed-in user.
     """
 
-    users: Dict[str, "User"] = {}
+    users: UserRegistry = UserRegistry()
     current_user: Optional["User"] = None
 
-    def __init__(self, username: str, password: str):
+    def __init__(self, username: str, password: str, hashed: bool = False):
         """
         Create a new User instance.
 
         Args:
             username: the account name.
-            password: plaintext password or existing bcrypt hash (starting with $2b$).
+            password: plaintext password or existing bcrypt hash ($2a$/$2b$/$2x$/$2y$).
+            hashed: treat `password` as a stored hash even if it is malformed or empty
+                (used when restoring from saves, so no hashing work is ever done there).
         """
         self.username = username
         # Accept pre-hashed bcrypt strings or hash plaintext passwords
-        self.__password_hash = (
-            self._hash_password(password) if not password.startswith('$2b$') else password
-        )
+        if hashed or Credential.is_bcrypt_hash(password):
+            self.__credential = Credential.from_stored(password)
+        else:
+            self.__credential = AuthService.get_instance().hash_password(password)
         self.pets: list = []
         self.music: Dict[str, Any] = {}
         self.food: Dict[str, Any] = {}
@@ -67,12 +160,12 @@ class User:
     @staticmethod
     def _hash_password(password: str) -> str:
         """Return a bcrypt hash for the given plaintext password."""
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        return AuthService.get_instance().hash_password(password).hash
 
     @staticmethod
     def _check_password(password: str, hashed: str) -> bool:
         """Verify a plaintext password against a bcrypt hash."""
-        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        return AuthService.get_instance().check_password(Credential.from_stored(hashed), password)
 
     @property
     def currency(self) -> int:
@@ -99,7 +192,12 @@ class User:
     @property
     def password(self) -> str:
         """Return the stored bcrypt password hash (do not expose plaintext)."""
-        return self.__password_hash
+        return self.__credential.hash
+
+    @property
+    def credential(self) -> Credential:
+        """Return the password Credential (hash, bcrypt variant and cost)."""
+        return self.__credential
 
     @password.setter
     def password(self, new_password: str):
@@ -114,7 +212,7 @@ class User:
             print(yellow("Password must contain:"))
             print(yellow("At least 8 characters, 1 uppercase, 1 lowercase, 1 digit, 1 special char\n"))
             return
-        self.__password_hash = self._hash_password(new_password)
+        self.__credential = AuthService.get_instance().hash_password(new_password)
 
     def add_pet(self, pet: VirtualPet) -> None:
         """Attach a new pet to this user's pet list."""
@@ -141,52 +239,75 @@ class User:
         return False
 
     @classmethod
-    def register(cls, username: str, password: str) -> Optional[int]:
-        """
-        Register a new user.
-
-        Returns:
-          1 on success, None on failure (and prints diagnostic messages).
-        """
+    def _can_register(cls, username: str, password: str) -> bool:
+        """Validate a registration request, printing the reason when it is rejected."""
         print()
         key = username.casefold()
-        
+
         if key in cls.users:
             print(red("This username has already existed!\n"))
-            return None
+            return False
         if username.strip().lower() in password.strip().lower():
             print(red("Password cannot be the same as username!\n"))
-            return None
+            return False
 
         if not re.match(VALID_PASSWORD, password):
             print(red("Password is too weak!\n"))
             print(yellow("Password must contain:"))
             print(yellow("At least 8 characters, 1 uppercase, 1 lowercase, 1 digit, 1 special char\n"))
-            return None
+            return False
+        return True
 
-        new_user = cls(username, password)
-        cls.users[key] = new_user
+    @classmethod
+    def _complete_registration(cls, new_user: "User") -> int:
+        """Add a freshly created user to the registry and sign them in."""
+        cls.users[new_user.username.casefold()] = new_user
         cls.current_user = new_user
-        print(green(f"User {username} registered successfully.\n"))
+        print(green(f"User {new_user.username} registered successfully.\n"))
         return 1
 
     @classmethod
-    def login(cls, username: str, password: str) -> Optional[int]:
+    def register(cls, username: str, password: str) -> Optional[int]:
         """
-        Authenticate a user by username and plaintext password.
+        Register a new user.
 
         Returns:
-          1 on success, None on failure.
+          1 on success, None on failure (and prints diagnostic messages).
         """
+        if not cls._can_register(username, password):
+            return None
+        return cls._complete_registration(cls(username, password))
+
+    @classmethod
+    async def register_async(cls, username: str, password: str) -> Optional[int]:
+        """
+        Register a new user, hashing the password on the AuthService pool.
+
+        Returns:
+          1 on success, None on failure (and prints diagnostic messages).
+        """
+        if not cls._can_register(username, password):
+            return None
+        credential = await AuthService.get_instance().hash_password_async(password)
+        # Another registration may have taken the name while the hash was computed
+        if username.casefold() in cls.users:
+            print(red("This username has already existed!\n"))
+            return None
+        return cls._complete_registration(cls(username, credential.hash, hashed=True))
+
+    @classmethod
+    def _login_candidate(cls, username: str) -> Optional["User"]:
+        """Look up the account for a login attempt, printing a message if it is unknown."""
         print()
-        key = username.casefold()
-        if key not in cls.users:
+        user = cls.users.get(username.casefold())
+        if user is None:
             print(red("User not found!\n"))
-            return None
+        return user
 
-        user = cls.users[key]
-        # Access the instance's stored hash to validate credentials
-        if not cls._check_password(password, user.__password_hash):
+    @classmethod
+    def _complete_login(cls, user: "User", username: str, verified: bool) -> Optional[int]:
+        """Sign the user in after a verification attempt."""
+        if not verified:
             print(red("Wrong password!\n"))
             return None
 
@@ -194,6 +315,51 @@ class User:
         print(green(f"Welcome back, {username}!\n"))
         return 1
 
+    @classmethod
+    def login(cls, username: str, password: str) -> Optional[int]:
+        """
+        Authenticate a user by username and plaintext password.
+
+        Returns:
+          1 on success, None on failure.
+        """
+        user = cls._login_candidate(username)
+        if user is None:
+            return None
+
+        service = AuthService.get_instance()
+        with service.timed_login():
+            # Access the instance's stored credential to validate the password
+            verified = service.check_password(user.__credential, password)
+            # Upgrade legacy variants / outdated cost factors while the plaintext is available
+            if verified and user.__credential.needs_rehash():
+                user.__credential = service.hash_password(password)
+
+        return cls._complete_login(user, username, verified)
+
+    @classmethod
+    async def login_async(cls, username: str, password: str) -> Optional[int]:
+        """
+        Authenticate a user without blocking the event loop on bcrypt.
+
+        Returns:
+          1 on success, None on failure.
+
+        Raises:
+          AuthServiceBusy: if the authentication queue is full.
+        """
+        user = cls._login_candidate(username)
+        if user is None:
+            return None
+
+        service = AuthService.get_instance()
+        with service.timed_login():
+            verified = await service.check_password_async(user.__credential, password)
+            if verified and user.__credential.needs_rehash():
+                user.__credential = await service.hash_password_async(password)
+
+        return cls._complete_login(user, username, verified)
+
     @classmethod
     def _logout(cls) -> bool:
         """Clear the current_user pointer (used by UI flows)."""
@@ -226,7 +392,7 @@ class User:
 
         user_data = {
             "username": self.username,
-            "password": self.__password_hash,
+            "password": self.__credential.hash,
             "currency": self._currency,
             "inventory": self.inventory,
             "music": self.music,
@@ -246,7 +412,7 @@ class User:
         from .animal import Cat, Rabbit, Dino, Dragon, Pou
 
         self.username = memento.get("username", self.username)
-        self.__password_hash = memento.get("password", self.__password_hash)
+        self.__credential = Credential.from_stored(memento.get("password", self.__credential.hash))
         self._currency = memento.get("currency", 0)
         self.inventory = memento.get("inventory", self.inventory)
         self.music = memento.get("music", {})
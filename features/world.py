@@ -0,0 +1,89 @@
+from typing import Iterable, List
+from .pet import VirtualPet
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only where NumPy is missing
+    np = None
+
+"""
+world.py
+
+Columnar, vectorised simulation of the passage of time for many pets at once.
+
+PetWorld copies the stats of a set of VirtualPet objects into NumPy columns and applies
+the VirtualPet.time_past rules to every pet in one vectorised step:
+
+    hunger -= 10
+    happiness -= 5            where hunger < 50
+    health -= 10              where hunger == 0 or energy == 0 (before clamping)
+    age += 0.2
+    stats = clip(trunc(stats), 0, 100); age = max(age, 0.0)      (limit_stat)
+
+Stats are held as float64 so comparisons and int() truncation behave exactly as in
+the scalar path; results are written back to the pet objects with write_back().
+
+NumPy is an optional dependency: importing this module works without it, but
+constructing a PetWorld raises ImportError.
+"""
+
+
+class PetWorld:
+    """
+    Columnar store of pet stats with a vectorised time_past().
+
+    Attributes:
+        pets: the VirtualPet objects backing each row (row i <-> pets[i]).
+        columns: mapping of stat name -> float64 NumPy array.
+    """
+
+    STATS = ("sanity", "fat", "hunger", "happiness", "energy", "health")
+
+    def __init__(self, pets: Iterable[VirtualPet] = ()):
+        if np is None:
+            raise ImportError("PetWorld requires NumPy (pip install numpy).")
+        self.pets: List[VirtualPet] = list(pets)
+        self.columns = {}
+        self.load()
+
+    def load(self) -> None:
+        """(Re)read every pet's stats into the columns."""
+        for stat in self.STATS + ("age",):
+            self.columns[stat] = np.fromiter(
+                (getattr(pet, stat) for pet in self.pets), dtype=np.float64, count=len(self.pets)
+            )
+
+    def add(self, pet: VirtualPet) -> None:
+        """Append one pet as a new row."""
+        self.pets.append(pet)
+        for stat, column in self.columns.items():
+            self.columns[stat] = np.append(column, np.float64(getattr(pet, stat)))
+
+    def time_past(self, steps: int = 1) -> None:
+        """Advance every pet by `steps` ticks of VirtualPet.time_past, in place."""
+        cols = self.columns
+        hunger, happiness, health = cols["hunger"], cols["happiness"], cols["health"]
+        energy, age = cols["energy"], cols["age"]
+        for _ in range(steps):
+            hunger -= 10
+            happiness -= np.where(hunger < 50, 5, 0)
+            health -= np.where((hunger == 0) | (energy == 0), 10, 0)
+            age += 0.2
+            self._limit_stats()
+
+    def _limit_stats(self) -> None:
+        """Vectorised VirtualPet.limit_stat: truncate, clamp to 0..100, keep age >= 0."""
+        for stat in self.STATS:
+            column = self.columns[stat]
+            np.trunc(column, out=column)
+            np.clip(column, 0, 100, out=column)
+        np.maximum(self.columns["age"], 0.0, out=self.columns["age"])
+
+    def write_back(self) -> None:
+        """Copy the column values back onto the pet objects."""
+        stat_values = {stat: self.columns[stat].astype(np.int64).tolist() for stat in self.STATS}
+        ages = self.columns["age"].tolist()
+        for i, pet in enumerate(self.pets):
+            for stat in self.STATS:
+                setattr(pet, stat, stat_values[stat][i])
+            pet.age = ages[i]
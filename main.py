@@ -9,6 +9,7 @@ from utils.colorize import (
 )
 from utils.formatter import clear
 from utils.loading import loading_bar
+from features.minigame.baseClass import Pacer
 
 
 init(autoreset=True)
@@ -388,6 +389,8 @@ class Main:
 
 
 if __name__ == "__main__":
+    if "--turbo" in sys.argv:
+        Pacer.get_instance().turbo = True
     pet_game = Main()
     print("Starting UI...")
     pet_game.run()
\ No newline at end of file
@@ -0,0 +1,198 @@
+import asyncio
+import builtins
+import io
+import os
+import threading
+import time
+import pytest
+from features.minigame.baseClass import ConsoleInput, MinigameStrategy, Pacer, QueueInput, ScriptedInput
+from features.minigame.mathQuiz import MathQuiz
+from features.minigame.ticTacToe import TicTacToe
+
+
+class _EchoGame(MinigameStrategy):
+    """Minimal game: asks for a name in build_question and a number in build_game."""
+
+    name = "Echo"
+
+    def setup(self, player, pet):
+        self.answers = []
+
+    def display_menu(self):
+        self.say(f"Echo for {id(self)}")
+
+    async def get_input(self):
+        pass
+
+    async def build_question(self):
+        self.loop_thread = threading.current_thread()
+        self.answers.append(await self.ask("name? "))
+
+    async def build_game(self):
+        await self.pacer.pause(1)
+        self.answers.append(await self.ask("number? "))
+        return self.answers
+
+    def evaluate(self, answer):
+        return {"answers": answer}
+
+    def reward(self, result):
+        self.say(f"{result['answers'][0]} earned {result['answers'][1]}")
+        return {"currency": int(result["answers"][1]), "pet_happiness": 0, "name": result["answers"][0]}
+
+
+@pytest.fixture(autouse=True)
+def turbo(monkeypatch):
+    """Run every test with pacing disabled."""
+    monkeypatch.setattr(Pacer, "_instance", Pacer(scale=0.0))
+
+
+class TestAsyncLifecycle:
+    """Tests for play_async and per-session input and output."""
+
+    def test_steps_read_session_input(self):
+        """Test the input-taking steps are answered by the session's source."""
+
+        source = ScriptedInput(["Mochi", "7"])
+        reward = asyncio.run(_EchoGame().play_async(None, None, source, io.StringIO()))
+        assert reward == {"currency": 7, "pet_happiness": 0, "name": "Mochi"}
+        assert source.prompts == ["name? ", "number? "]
+
+    def test_steps_run_on_the_loop(self):
+        """Test the async steps are awaited on the event loop thread, without a worker."""
+
+        game = _EchoGame()
+        reward = asyncio.run(game.play_async(None, None, ScriptedInput(["Pou", "3"]), io.StringIO()))
+        assert reward["currency"] == 3
+        assert game.loop_thread is threading.main_thread()
+
+    def test_exhausted_script_raises(self):
+        """Test running out of scripted answers surfaces as EOFError."""
+
+        with pytest.raises(EOFError):
+            asyncio.run(_EchoGame().play_async(None, None, ScriptedInput(["only one"]), io.StringIO()))
+
+    def test_concurrent_sessions_stay_separate(self):
+        """Test many sessions in one loop each receive only their own answers."""
+
+        async def main():
+            sources = [QueueInput() for _ in range(12)]
+            tasks = [asyncio.create_task(_EchoGame().play_async(None, None, source, io.StringIO()))
+                     for source in sources]
+            await asyncio.sleep(0)
+            for index in reversed(range(len(sources))):
+                sources[index].feed(f"pet{index}")
+            for index, source in enumerate(sources):
+                source.feed(str(index))
+            return await asyncio.gather(*tasks)
+
+        rewards = asyncio.run(main())
+        assert [(reward["name"], reward["currency"]) for reward in rewards] == [(f"pet{i}", i) for i in range(12)]
+
+    def test_more_sessions_than_workers_all_prompt(self):
+        """Test more quiz sessions than default executor workers all reach their prompt before any answer."""
+
+        sessions = 2 * min(32, (os.cpu_count() or 1) + 4) + 1
+        threads_before = threading.active_count()
+
+        async def main():
+            sources = [QueueInput() for _ in range(sessions)]
+            tasks = [asyncio.create_task(MathQuiz().play_async(None, None, source, io.StringIO()))
+                     for source in sources]
+
+            async def all_prompted():
+                while not all(source.prompts for source in sources):
+                    await asyncio.sleep(0.001)
+
+            await asyncio.wait_for(all_prompted(), timeout=5)
+            waiting_threads = threading.active_count()
+            for source in sources:
+                for line in ["1"] + ["0"] * 5:  # easy: five questions
+                    source.feed(line)
+            return waiting_threads, await asyncio.gather(*tasks)
+
+        waiting_threads, rewards = asyncio.run(main())
+        assert waiting_threads == threads_before
+        assert len(rewards) == sessions and all(set(reward) == {"currency", "pet_happiness"} for reward in rewards)
+
+    def test_output_is_per_session(self, capsys):
+        """Test each session writes only to its own output, never to the shared stdout."""
+
+        async def main():
+            outputs = [io.StringIO(), io.StringIO()]
+            await asyncio.gather(*(_EchoGame().play_async(None, None, ScriptedInput([name, "1"]), output)
+                                   for name, output in zip(["Mochi", "Pou"], outputs)))
+            return [output.getvalue() for output in outputs]
+
+        mochi, pou = asyncio.run(main())
+        assert "Mochi earned 1" in mochi and "Pou" not in mochi
+        assert "Pou earned 1" in pou and "Mochi" not in pou
+        assert capsys.readouterr().out == ""
+
+    def test_console_input_reads_builtin_input(self, monkeypatch):
+        """Test ConsoleInput calls input() and sessions leave builtins.input untouched."""
+
+        original = builtins.input
+        asyncio.run(_EchoGame().play_async(None, None, ScriptedInput(["a", "1"]), io.StringIO()))
+        assert builtins.input is original
+
+        monkeypatch.setattr(builtins, "input", lambda prompt="": f"console:{prompt}")
+        assert asyncio.run(ConsoleInput()("? ")) == "console:? "
+
+    def test_tictactoe_plays_through_async_source(self):
+        """Test a full TicTacToe game driven by an async source that picks free cells."""
+
+        game = TicTacToe()
+
+        async def player(prompt):
+            if "size" in prompt:
+                return "2"
+            if "first" in prompt:
+                return "y"
+            row, col = game.available_moves()[0]
+            return f"{row + 1} {col + 1}"
+
+        output = io.StringIO()
+        reward = asyncio.run(game.play_async(None, None, player, output))
+        assert set(reward) == {"currency", "pet_happiness"}
+        assert game.row_length == 4 and game.winner in (None, "X", "O")
+        assert "You received" in output.getvalue()
+
+    def test_pet_search_does_not_block_other_sessions(self, monkeypatch):
+        """Test another session keeps running on the loop while a pet is searching for its move."""
+
+        ticks = []
+        during_search = []
+
+        def slow_pet_move(game):
+            before = len(ticks)
+            time.sleep(0.2)
+            during_search.append(len(ticks) - before)
+            return game.available_moves()[0]
+
+        monkeypatch.setattr(TicTacToe, "pet_move", slow_pet_move)
+        game = TicTacToe()
+
+        async def player(prompt):
+            if "size" in prompt:
+                return "1"
+            if "first" in prompt:
+                return "n"
+            row, col = game.available_moves()[0]
+            return f"{row + 1} {col + 1}"
+
+        async def ticker(done):
+            while not done.is_set():
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            done = asyncio.Event()
+            ticking = asyncio.create_task(ticker(done))
+            reward = await game.play_async(None, None, player, io.StringIO())
+            done.set()
+            await ticking
+            return reward
+
+        assert set(asyncio.run(main())) == {"currency", "pet_happiness"}
+        assert during_search and min(during_search) >= 5
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import pytest
+import features.credential as credential_module
+from features.auth_service import AuthService, AuthServiceBusy
+from features.user import User
+
+pytestmark = pytest.mark.usefixtures("clean_user_registry")
+
+
+@pytest.fixture
+def auth_service(monkeypatch):
+    """Fixture that installs a small, fast AuthService as the singleton."""
+    monkeypatch.setattr(credential_module, "BCRYPT_ROUNDS", 4)
+    service = AuthService(max_workers=2, max_pending=4)
+    monkeypatch.setattr(AuthService, "_instance", service)
+    yield service
+    service.shutdown()
+
+
+class TestAuthService:
+    """Tests for the pooled, async authentication service."""
+
+    def test_sync_wrappers_use_pool(self, auth_service: AuthService):
+        """Test that the synchronous login still works on top of the pool."""
+
+        User.register('jessica29', '29.September.2006')
+        User._logout()
+
+        assert User.login('jessica29', '29.September.2006') == 1
+        assert User.login('jessica29', 'WrongTest1!') is None
+        assert auth_service.latency_percentiles()['count'] == 2
+
+    def test_async_register_and_login(self, auth_service: AuthService):
+        """Test registering and logging in concurrently from one event loop."""
+
+        async def scenario():
+            await User.register_async('Jess2Jes', 'JeCloud22./')
+            await User.register_async('DevinOwl32', 'ChristmasV.32')
+            return await asyncio.gather(
+                User.login_async('Jess2Jes', 'JeCloud22./'),
+                User.login_async('DevinOwl32', 'ChristmasV.32'),
+                User.login_async('DevinOwl32', 'wrongPass.32'),
+            )
+
+        assert asyncio.run(scenario()) == [1, 1, None]
+        assert len(User.users) == 2
+
+    def test_concurrent_register_same_name(self, auth_service: AuthService):
+        """Test that only one of two concurrent registrations of a name succeeds."""
+
+        async def scenario():
+            return await asyncio.gather(
+                User.register_async('Jess2Jes', 'JeCloud22./'),
+                User.register_async('jess2jes', 'OtherPass.99'),
+            )
+
+        results = asyncio.run(scenario())
+        assert sorted(results, key=lambda r: r is None) == [1, None]
+        assert len(User.users) == 1
+        # Whichever hash finished first owns the account; the other password is not accepted
+        winner, loser = ('JeCloud22./', 'OtherPass.99') if results[0] else ('OtherPass.99', 'JeCloud22./')
+        assert User.login('Jess2Jes', winner) == 1
+        assert User.login('Jess2Jes', loser) is None
+
+    def test_async_rejects_when_queue_full(self, auth_service: AuthService):
+        """Test that the bounded queue sheds async work instead of growing."""
+
+        release = threading.Event()
+        blockers = [auth_service.submit(release.wait) for _ in range(auth_service.max_pending)]
+
+        async def attempt():
+            return await auth_service.hash_password_async('29.September.2006')
+
+        with pytest.raises(AuthServiceBusy):
+            asyncio.run(attempt())
+
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+        assert asyncio.run(attempt()).verify('29.September.2006')
+
+    def test_latency_percentiles(self, auth_service: AuthService):
+        """Test nearest-rank percentiles over recorded login timings."""
+
+        assert auth_service.latency_percentiles() == {"count": 0, "p50": 0.0, "p90": 0.0, "p99": 0.0}
+
+        auth_service._latencies.extend(i / 1000 for i in range(1, 101))
+        stats = auth_service.latency_percentiles()
+
+        assert stats['count'] == 100
+        assert stats['p50'] == pytest.approx(50)
+        assert stats['p90'] == pytest.approx(90)
+        assert stats['p99'] == pytest.approx(99)
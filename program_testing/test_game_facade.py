@@ -0,0 +1,156 @@
+import copy
+import datetime
+import pytest
+import features.save_manager as save_manager_module
+import utils.gameFacade as game_facade_module
+from features.animal import Cat, Dragon
+from features.save_manager import SaveManager
+from features.user import User
+from utils.gameFacade import GameFacade
+
+STATS = ("sanity", "fat", "hunger", "happiness", "energy", "health")
+
+
+@pytest.fixture
+def facade(tmp_path, monkeypatch, registered_user) -> GameFacade:
+    """Fixture that builds a GameFacade for a signed-in user, saving under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SaveManager, "_instance", None)
+    monkeypatch.setattr(SaveManager, "_initialized", False)
+    game_facade = GameFacade()
+    game_facade._connect_to_game()
+    return game_facade
+
+
+class TestGameFacade:
+    """Tests for the facade's game-hour tick and offline catch-up."""
+
+    def test_spend_time_does_not_age_pets(self, facade: GameFacade):
+        """Test menu actions that only spend a game-hour counter leave every pet's stats alone."""
+
+        pet = Cat('WeeWee', 1.0)
+        facade.current_user.add_pet(pet)
+        before = copy.copy(pet)
+
+        for _ in range(3):
+            facade.spend_time()
+
+        assert facade.game.spend == 3
+        assert [getattr(pet, stat) for stat in STATS] == [getattr(before, stat) for stat in STATS]
+        assert pet.age == before.age
+
+    def test_interact_ages_only_that_pet(self, facade: GameFacade, monkeypatch):
+        """Test interacting with a pet ticks that pet once and leaves its siblings alone."""
+
+        monkeypatch.setattr(facade.game, "interact", lambda pet: None)
+        chosen, sibling = Cat('WeeWee', 1.0), Dragon('Dugong', 0.0)
+        facade.current_user.add_pet(chosen)
+        facade.current_user.add_pet(sibling)
+        expected, untouched = copy.copy(chosen), copy.copy(sibling)
+        expected.time_past()
+
+        facade.interact_pet(chosen)
+
+        assert [getattr(chosen, stat) for stat in STATS] == [getattr(expected, stat) for stat in STATS]
+        assert [getattr(sibling, stat) for stat in STATS] == [getattr(untouched, stat) for stat in STATS]
+        assert chosen.age == pytest.approx(expected.age)
+
+    def test_advance_world_ticks_only_current_user(self, facade: GameFacade):
+        """Test advance_world matches per-pet time_past for the signed-in user and skips other loaded users."""
+
+        other = User('DevinOwl32', User.current_user.password, hashed=True)
+        User.users[other.username.casefold()] = other
+        pets = [Cat('WeeWee', 1.0), Dragon('Dugong', 0.0)]
+        pets[1].hunger, pets[1].energy = 10, 0
+        stranger = Cat('Mochi', 4.2)
+        stranger.hunger, stranger.happiness = 55, 3
+        for pet in pets:
+            facade.current_user.add_pet(pet)
+        other.add_pet(stranger)
+        expected = [copy.copy(pet) for pet in pets]
+        untouched = copy.copy(stranger)
+        for pet in expected:
+            for _ in range(3):
+                pet.time_past()
+
+        assert facade.advance_world(3) == 2
+        for pet, ref in zip(pets, expected):
+            for stat in STATS:
+                assert getattr(pet, stat) == getattr(ref, stat), stat
+            assert pet.age == pytest.approx(ref.age)
+        assert [getattr(stranger, stat) for stat in STATS] == [getattr(untouched, stat) for stat in STATS]
+        assert stranger.age == untouched.age
+
+    def test_login_catches_up_time_offline(self, facade: GameFacade, monkeypatch):
+        """Test logging in to a save from ten hours ago applies ten offline ticks."""
+
+        pet = Cat('WeeWee', 1.0)
+        pet.hunger, pet.happiness, pet.energy = 100, 100, 50
+        facade.current_user.add_pet(pet)
+        expected = copy.copy(pet)
+        for _ in range(10):
+            expected.time_past()
+
+        loaded = _relog_after(facade, monkeypatch, datetime.timedelta(hours=10, minutes=30))
+        for stat in STATS:
+            assert getattr(loaded, stat) == getattr(expected, stat), stat
+        assert (loaded.hunger, loaded.happiness) == (0, 75)
+        assert loaded.age == pytest.approx(3.0)
+
+    def test_offline_ticks_are_capped(self, facade: GameFacade, monkeypatch):
+        """Test a week away applies only OFFLINE_MAX_TICKS ticks."""
+
+        monkeypatch.setattr(game_facade_module, "OFFLINE_MAX_TICKS", 4)
+        pet = Cat('WeeWee', 1.0)
+        pet.hunger, pet.happiness, pet.energy, pet.health = 100, 100, 50, 80
+        facade.current_user.add_pet(pet)
+        expected = copy.copy(pet)
+        for _ in range(4):
+            expected.time_past()
+
+        loaded = _relog_after(facade, monkeypatch, datetime.timedelta(days=7))
+        for stat in STATS:
+            assert getattr(loaded, stat) == getattr(expected, stat), stat
+        assert loaded.age == pytest.approx(1.8)
+
+    def test_pets_survive_a_long_absence(self, facade: GameFacade, monkeypatch):
+        """Test a starving, exhausted pet left for a week keeps 1 health instead of dying offline."""
+
+        pet = Dragon('Dugong', 0.0)
+        pet.hunger, pet.energy, pet.health = 20, 0, 30
+        facade.current_user.add_pet(pet)
+
+        loaded = _relog_after(facade, monkeypatch, datetime.timedelta(days=7))
+        assert loaded.hunger == 0
+        assert loaded.health == 1
+
+    def test_offline_ageing_can_be_disabled(self, facade: GameFacade, monkeypatch):
+        """Test OFFLINE_TICK_HOURS = 0 leaves pets exactly as they were saved."""
+
+        monkeypatch.setattr(game_facade_module, "OFFLINE_TICK_HOURS", 0)
+        pet = Cat('WeeWee', 1.0)
+        facade.current_user.add_pet(pet)
+        before = copy.copy(pet)
+
+        loaded = _relog_after(facade, monkeypatch, datetime.timedelta(days=7))
+        assert [getattr(loaded, stat) for stat in STATS] == [getattr(before, stat) for stat in STATS]
+        assert loaded.age == pytest.approx(before.age)
+
+
+def _relog_after(facade: GameFacade, monkeypatch, away: datetime.timedelta):
+    """Save as if `away` ago, log out and back in, and return the reloaded first pet."""
+
+    saved_at = datetime.datetime.now() - away
+
+    class SavedEarlier(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return saved_at
+
+    with monkeypatch.context() as patch:
+        patch.setattr(save_manager_module, "datetime", SavedEarlier)
+        assert facade.save_game()
+    facade.logout_user()
+
+    assert facade.login_user('jessica29', '29.September.2006')
+    return facade.current_user.pets[0]
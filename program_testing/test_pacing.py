@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import pytest
+from features.minigame import baseClass
+from features.minigame.baseClass import Pacer
+from features.minigame.uno import Uno
+
+
+@pytest.fixture
+def pacer(monkeypatch) -> Pacer:
+    """A fresh Pacer installed as the singleton for the test."""
+    fresh = Pacer(scale=1.0)
+    monkeypatch.setattr(Pacer, "_instance", fresh)
+    return fresh
+
+
+class TestPacer:
+    """Tests for the shared minigame pacing scheduler."""
+
+    def test_scale_and_turbo(self, pacer: Pacer):
+        """Test delays are scaled, and turbo turns them off and back on."""
+
+        pacer.scale = 0.5
+        assert pacer.delay(2) == 1.0
+        pacer.turbo = True
+        assert pacer.turbo and pacer.delay(2) == 0.0
+        pacer.turbo = False
+        assert pacer.scale == 0.5
+        assert pacer.requested == 4 and pacer.waited == 1.0
+
+    def test_turbo_keeps_custom_scale(self):
+        """Test switching turbo on twice and off again restores the scale set before it."""
+
+        pacer = Pacer(0.25)
+        pacer.turbo = True
+        pacer.turbo = True
+        pacer.turbo = False
+        assert pacer.scale == 0.25
+        with pacer.turbo_mode():
+            pacer.turbo = False
+            assert pacer.scale == 0.25
+        assert pacer.scale == 0.25
+
+    def test_turbo_mode_restores_scale(self, pacer: Pacer):
+        """Test the turbo context manager restores the previous scale."""
+
+        pacer.scale = 0.25
+        with pacer.turbo_mode():
+            assert pacer.turbo
+        assert pacer.scale == 0.25
+
+    def test_wait_in_turbo_never_sleeps(self, pacer: Pacer, monkeypatch):
+        """Test a blocking wait in turbo mode returns without calling time.sleep."""
+
+        def fail(seconds):
+            raise AssertionError("slept in turbo mode")
+
+        monkeypatch.setattr(baseClass.time, "sleep", fail)
+        with pacer.turbo_mode():
+            pacer.wait(5)
+            asyncio.run(Uno().pause(5))
+        assert pacer.requested == 10 and pacer.waited == 0
+
+    def test_counters_are_thread_safe(self, pacer: Pacer):
+        """Test blocking waits from many threads add up exactly."""
+
+        def waits():
+            for _ in range(5000):
+                pacer.wait(0.5)
+
+        with pacer.turbo_mode():
+            threads = [threading.Thread(target=waits) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert pacer.requested == 8 * 5000 * 0.5 and pacer.waited == 0
+
+    def test_pauses_do_not_block_other_sessions(self, pacer: Pacer):
+        """Test concurrent paused sessions overlap instead of running back to back."""
+
+        pacer.scale = 0.01  # 1 nominal second -> 10 ms
+
+        async def session(log, name):
+            for step in range(3):
+                log.append((name, step))
+                await pacer.pause(1)
+
+        async def main():
+            log = []
+            started = time.perf_counter()
+            await asyncio.gather(session(log, "a"), session(log, "b"))
+            return log, time.perf_counter() - started
+
+        log, elapsed = asyncio.run(main())
+        assert log[:2] == [("a", 0), ("b", 0)]
+        assert elapsed < 0.06 * 2
+
+    def test_turbo_pause_still_yields(self, pacer: Pacer):
+        """Test a zero-length pause lets other tasks run."""
+
+        async def main():
+            log = []
+
+            async def worker(name):
+                for step in range(2):
+                    log.append(name)
+                    await pacer.pause(3)
+
+            with pacer.turbo_mode():
+                await asyncio.gather(worker("a"), worker("b"))
+            return log
+
+        assert asyncio.run(main()) == ["a", "b", "a", "b"]
+
+    def test_animate_yields_every_frame(self, pacer: Pacer):
+        """Test animate yields frames in order with one paced interval per frame."""
+
+        async def main():
+            return [frame async for frame in pacer.animate("abc", 0.5)]
+
+        with pacer.turbo_mode():
+            assert asyncio.run(main()) == ["a", "b", "c"]
+        assert pacer.requested == 1.5
@@ -0,0 +1,48 @@
+import copy
+import random
+import pytest
+from features.animal import Cat, Dragon
+
+STATS = ("sanity", "fat", "hunger", "happiness", "energy", "health")
+
+
+def _random_pet(rng: random.Random) -> Cat:
+    """Build a pet whose stats hit the rule boundaries (hunger 10/60, energy 0, out of range)."""
+    pet = rng.choice([Cat, Dragon])('WeeWee', 0.0)
+    for stat in STATS:
+        setattr(pet, stat, rng.choice([0, 10, 20, 50, 55, 60, 70, 100, rng.randrange(-30, 140)]))
+    pet.age = rng.choice([0.0, -1.0, rng.random() * 20])
+    return pet
+
+
+class TestPetCatchUp:
+    """Tests for the closed-form offline catch-up."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_iterative_time_past(self, seed: int):
+        """Test catch_up(N) against N calls of time_past for random N and stats."""
+
+        rng = random.Random(seed)
+        for _ in range(300):
+            pet = _random_pet(rng)
+            expected = copy.copy(pet)
+            ticks = rng.choice([0, 1, 2, rng.randrange(3, 40), rng.randrange(40, 2000)])
+
+            for _ in range(ticks):
+                expected.time_past()
+            pet.catch_up(ticks)
+
+            for stat in STATS:
+                assert getattr(pet, stat) == getattr(expected, stat), (stat, ticks)
+            assert pet.age == pytest.approx(expected.age, abs=1e-9)
+
+    def test_month_offline(self):
+        """Test a month of hourly ticks: hunger and happiness bottom out, health drops once."""
+
+        pet = Cat('WeeWee', 1.0)
+        pet.hunger, pet.happiness, pet.health, pet.energy = 100, 100, 100, 50
+
+        pet.catch_up(24 * 30)
+
+        assert (pet.hunger, pet.happiness, pet.health) == (0, 0, 90)
+        assert pet.age == pytest.approx(1.0 + 0.2 * 24 * 30)
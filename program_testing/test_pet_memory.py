@@ -0,0 +1,67 @@
+import tracemalloc
+from features.animal import Cat, Dragon
+from features.pet import VirtualPet
+from utils.formatter import Formatter
+
+
+class LegacyLayoutPet:
+    """Reference pet using the pre-__slots__ layout: a per-instance __dict__ and Formatter."""
+
+    def __init__(self, name: str, age: float = 0.0):
+        self.name = name
+        self.age = age
+        self.type = "Cat"
+        self.happiness = 10
+        self.hunger = 10
+        self.sanity = 10
+        self.health = 10
+        self.fat = 0
+        self.energy = 10
+        self.generosity = 0
+        self.format = Formatter()
+        self.emoji = "🐈"
+        self.fav_food = "Chicken"
+        self.music_taste = "Pop"
+        self.dislike_music = "Reggae"
+        self.songs = "Born Again by Doja Cat", "Golden by HUNTR/X", "Busy Woman by Sabrina Carpenter"
+
+
+def bytes_per_instance(factory, count: int = 5000) -> float:
+    """Return the average traced allocation per instance created by factory()."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(instances) == count
+    return (after - before) / count
+
+
+class TestPetMemory:
+    """Memory benchmark for the compact pet representation."""
+
+    def test_pets_have_no_instance_dict(self):
+        """Test that pets store their stats in __slots__ only."""
+
+        pet = Cat('WeeWee', 1.0)
+
+        assert not hasattr(pet, '__dict__')
+        assert pet.format is VirtualPet.format is Dragon('Dugong', 0.0).format
+        assert pet.songs is Cat('Mochi', 0.0).songs
+
+    def test_species_data_is_class_level(self):
+        """Test that species constants are shared class attributes, not per-pet copies."""
+
+        assert Cat.emoji == Cat('WeeWee', 1.0).emoji == "🐈"
+        assert 'fav_food' in vars(Dragon) and 'songs' in vars(Dragon)
+
+    def test_memory_per_pet(self):
+        """Benchmark: a pet must use well under half the memory of the legacy layout."""
+
+        name = 'WeeWee'
+        compact = bytes_per_instance(lambda: Cat(name, 1.0))
+        legacy = bytes_per_instance(lambda: LegacyLayoutPet(name, 1.0))
+
+        assert compact * 2 < legacy
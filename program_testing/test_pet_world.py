@@ -0,0 +1,58 @@
+import copy
+import random
+import pytest
+from features.animal import Cat, Dino, Pou
+
+np = pytest.importorskip("numpy")
+from features.world import PetWorld  # noqa: E402
+
+
+def _random_pets(rng: random.Random, count: int) -> list:
+    """Build pets with stats biased towards the rule boundaries (0, 10, 50, 100)."""
+    pets = []
+    for i in range(count):
+        pet = rng.choice([Cat, Dino, Pou])(f"pet{i}", 0.0)
+        for stat in PetWorld.STATS:
+            setattr(pet, stat, rng.choice([0, 10, 49, 50, 59, 60, 100, rng.randrange(-20, 130)]))
+        pet.age = rng.choice([0.0, -1.0, rng.random() * 20])
+        pets.append(pet)
+    return pets
+
+
+class TestPetWorld:
+    """Tests for the vectorised time_past engine."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_scalar_time_past(self, seed: int):
+        """Test that a vectorised tick gives exactly the scalar VirtualPet.time_past result."""
+
+        rng = random.Random(seed)
+        pets = _random_pets(rng, 500)
+        expected = [copy.copy(pet) for pet in pets]
+
+        world = PetWorld(pets)
+        for _ in range(rng.randrange(1, 40)):
+            world.time_past()
+            for pet in expected:
+                pet.time_past()
+        world.write_back()
+
+        for pet, ref in zip(pets, expected):
+            for stat in PetWorld.STATS + ("age",):
+                assert getattr(pet, stat) == getattr(ref, stat), stat
+
+    def test_multi_step_and_add(self):
+        """Test time_past(steps) and rows appended after construction."""
+
+        first, second = Cat('WeeWee', 1.0), Dino('Rex', 2.0)
+        first.hunger, second.hunger = 60, 10
+        world = PetWorld([first])
+        world.add(second)
+
+        world.time_past(3)
+        world.write_back()
+
+        assert first.hunger == 30 and first.happiness >= 0
+        assert second.hunger == 0
+        assert first.age == pytest.approx(1.6)
+        assert isinstance(first.hunger, int)
@@ -0,0 +1,86 @@
+import pytest
+from features.save_codec import (
+    FORMAT_VERSION, MAGIC, SaveFormatError, decode, decode_binary, encode, encode_binary
+)
+
+SNAPSHOT = {
+    "user": {
+        "username": "jessica29",
+        "password": "$2b$12$" + "a" * 53,
+        "currency": 25000,
+        "inventory": {"food": {"Ice Cream": 3, "Salad": 0}, "potion": {"Fat Burner": 2}},
+        "music": {},
+        "food": {},
+        "pets": [
+            {"name": "WeeWee", "type": "Cat", "age": 2.2, "happiness": 90, "hunger": 0,
+             "sanity": 85, "health": 100, "fat": 5, "energy": 80, "generosity": 2},
+            {"name": "Dugong", "type": "Dragon", "age": 0.0, "happiness": 0, "hunger": 40,
+             "sanity": 10, "health": 1, "fat": 0, "energy": 0, "generosity": 0},
+        ],
+    },
+    "game": {"day": 3, "spend": -1, "clock": 23, "flags": [True, False, None], "big": 2 ** 70},
+    "last_saved": "2026-10-16T10:00:00",
+    "tail": {"weird\x00key": -1, "ünïcode": "🐈", "empty": None},
+}
+
+
+class TestSaveCodec:
+    """Tests for the JSON and binary save codecs."""
+
+    @pytest.mark.parametrize("save_format", ["json", "binary"])
+    def test_round_trip(self, save_format: str):
+        """Test that both formats reproduce the snapshot exactly."""
+
+        assert decode(encode(SNAPSHOT, save_format), save_format) == SNAPSHOT
+
+    def test_binary_is_compact_and_versioned(self):
+        """Test that the binary payload is headed by magic + version and beats pretty JSON."""
+
+        payload = encode_binary(SNAPSHOT)
+
+        assert payload[:4] == MAGIC
+        assert payload[4] == FORMAT_VERSION
+        assert len(payload) * 2 < len(encode(SNAPSHOT, "json"))
+        assert payload.count(b"happiness") == 1
+
+    def test_rejects_newer_version(self):
+        """Test that a file from a newer format version is refused rather than misread."""
+
+        payload = bytearray(encode_binary(SNAPSHOT))
+        payload[4] = FORMAT_VERSION + 1
+
+        with pytest.raises(SaveFormatError):
+            decode_binary(bytes(payload))
+
+    @pytest.mark.parametrize("cut", [0, 3, 5, 40, -1])
+    def test_rejects_truncated_payload(self, cut: int):
+        """Test that every truncation is reported as SaveFormatError."""
+
+        payload = encode_binary(SNAPSHOT)
+
+        with pytest.raises(SaveFormatError):
+            decode_binary(payload[:cut])
+
+    @pytest.mark.parametrize("snapshot", [SNAPSHOT, {"user": {"username": "jessica29"}}])
+    def test_rejects_corrupt_string_table(self, snapshot: dict):
+        """Test invalid UTF-8 in either string table layout is reported as SaveFormatError."""
+
+        payload = encode_binary(snapshot).replace(b"jessica29", b"jessic\xff\xfe9")
+
+        with pytest.raises(SaveFormatError):
+            decode_binary(payload)
+
+    def test_rejects_deep_nesting(self):
+        """Test a payload nested past the recursion limit is reported as SaveFormatError."""
+
+        header = encode_binary(None)[:-1]
+        one_item_list = encode_binary([None])[len(header):-1]
+
+        with pytest.raises(SaveFormatError):
+            decode_binary(header + one_item_list * 100_000 + encode_binary(None)[-1:])
+
+    def test_rejects_unknown_format(self):
+        """Test that unknown format names are refused."""
+
+        with pytest.raises(SaveFormatError):
+            encode(SNAPSHOT, "xml")
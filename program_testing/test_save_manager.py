@@ -0,0 +1,239 @@
+import json
+import random
+import pytest
+import features.save_manager as save_manager_module
+from features.save_manager import SaveManager
+
+
+@pytest.fixture
+def save_manager(tmp_path, monkeypatch) -> SaveManager:
+    """Fixture that builds a fresh SaveManager rooted in a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SaveManager, "_instance", None)
+    monkeypatch.setattr(SaveManager, "_initialized", False)
+    return SaveManager.get_instance()
+
+
+def _state(currency: int, username: str = "x") -> dict:
+    return {"user": {"username": username, "currency": currency, "pets": []}, "game": {"day": 1}}
+
+
+def _restart() -> SaveManager:
+    """Simulate a process restart by dropping the singleton and building a new one."""
+    SaveManager._instance = None
+    SaveManager._initialized = False
+    return SaveManager.get_instance()
+
+
+class SimulatedCrash(BaseException):
+    """Raised by the fault injector; BaseException so the code under test cannot swallow it."""
+
+
+class CrashingFile:
+    """File wrapper that lets `budget` bytes through in total, then writes a partial chunk and dies."""
+
+    def __init__(self, real_file, injector: "FaultInjector"):
+        self._file = real_file
+        self._injector = injector
+
+    def write(self, data):
+        allowed = self._injector.consume(len(data))
+        if allowed < len(data):
+            self._file.write(data[:allowed])
+            self._file.flush()
+            raise SimulatedCrash()
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+        return False
+
+
+class FaultInjector:
+    """Replaces `open` inside features.save_manager so writes die after `budget` bytes."""
+
+    def __init__(self, budget: int):
+        self.budget = budget
+
+    def consume(self, size: int) -> int:
+        allowed = max(0, min(size, self.budget))
+        self.budget -= size
+        return allowed
+
+    def open(self, path, mode="r", *args, **kwargs):
+        real_file = open(path, mode, *args, **kwargs)
+        if any(flag in mode for flag in "wa"):
+            return CrashingFile(real_file, self)
+        return real_file
+
+
+class TestShardedSaves:
+    """Tests for the per-user sharded save store."""
+
+    def test_save_and_load_round_trip(self, save_manager: SaveManager):
+        """Test that a saved state can be loaded back."""
+
+        assert save_manager.save_game('jessica29', _state(500))
+        loaded = save_manager.load_game('jessica29')
+
+        assert loaded['user']['currency'] == 500
+        assert 'last_saved' in loaded
+        assert save_manager.list_saves() == ['jessica29']
+
+    def test_save_touches_only_own_shard(self, save_manager: SaveManager, monkeypatch):
+        """Test that saving one user does not rewrite other users' shards."""
+
+        monkeypatch.setattr(SaveManager, "JOURNAL_CHECKPOINT_EVERY", 1)
+        save_manager.save_game('jessica29', _state(1))
+        save_manager.save_game('mrBean29', _state(2))
+        other_shard = save_manager._shard_path('mrBean29')
+        before = other_shard.stat().st_mtime_ns
+
+        save_manager.save_game('jessica29', _state(3))
+
+        assert other_shard.stat().st_mtime_ns == before
+        assert save_manager.load_game('mrBean29')['user']['currency'] == 2
+        assert save_manager.load_game('jessica29')['user']['currency'] == 3
+
+    def test_delete_save(self, save_manager: SaveManager):
+        """Test that deleting a save removes its shard and index entry."""
+
+        save_manager.save_game('jessica29', _state(1))
+        shard = save_manager._shard_path('jessica29')
+
+        assert save_manager.delete_save('jessica29')
+        assert not shard.exists()
+        assert save_manager.list_saves() == []
+        assert save_manager.load_game('jessica29') is None
+        assert not save_manager.delete_save('jessica29')
+
+    def test_migrates_legacy_single_file(self, tmp_path, monkeypatch):
+        """Test that an existing player_saves.json is split into shards on first run."""
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(SaveManager, "_instance", None)
+        monkeypatch.setattr(SaveManager, "_initialized", False)
+        (tmp_path / "saves").mkdir()
+        legacy = {"jessica29": _state(10), "mrBean29": _state(20)}
+        (tmp_path / "saves" / "player_saves.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        manager = SaveManager.get_instance()
+
+        assert sorted(manager.list_saves()) == ['jessica29', 'mrBean29']
+        assert manager.load_game('mrBean29')['user']['currency'] == 20
+        assert not (tmp_path / "saves" / "player_saves.json").exists()
+        assert (tmp_path / "saves" / "player_saves.json.migrated").exists()
+        assert manager._load_all_saves().keys() == legacy.keys()
+
+
+class TestSaveFormats:
+    """Tests for choosing and converting between the JSON and binary shard formats."""
+
+    def test_binary_round_trip(self, save_manager: SaveManager, monkeypatch):
+        """Test that the binary format is written and read back transparently."""
+
+        monkeypatch.setattr(SaveManager, "JOURNAL_CHECKPOINT_EVERY", 1)
+        save_manager.save_format = "binary"
+        save_manager.save_game('jessica29', _state(42, 'jessica29'))
+
+        assert save_manager._shard_path('jessica29').suffix == '.bin'
+        assert _restart().load_game('jessica29')['user']['currency'] == 42
+
+    def test_convert_saves(self, save_manager: SaveManager, monkeypatch):
+        """Test converting every shard to binary and back to JSON."""
+
+        monkeypatch.setattr(SaveManager, "JOURNAL_CHECKPOINT_EVERY", 1)
+        for i, username in enumerate(['jessica29', 'mrBean29', 'johanLiebert12']):
+            save_manager.save_game(username, _state(i, username))
+        expected = save_manager._load_all_saves()
+
+        assert save_manager.convert_saves('binary') == 3
+        assert sorted(p.suffix for p in save_manager.users_directory.iterdir()) == ['.bin'] * 3
+        assert _restart()._load_all_saves() == expected
+
+        manager = SaveManager.get_instance()
+        assert manager.convert_saves('json') == 3
+        assert sorted(p.suffix for p in manager.users_directory.iterdir()) == ['.json'] * 3
+        assert _restart()._load_all_saves() == expected
+
+
+class TestCrashSafety:
+    """Fault-injection tests: kill writes at random byte offsets and check nothing is lost."""
+
+    USERS = ['jessica29', 'mrBean29', 'johanLiebert12']
+
+    def _run_workload(self, manager: SaveManager, committed: dict, attempt: dict, rng: random.Random) -> None:
+        """Perform random saves/deletes, recording the in-flight operation and every acknowledged one."""
+        for step in range(12):
+            username = rng.choice(self.USERS)
+            if rng.random() < 0.2:
+                attempt.update({username: None})
+                if manager.delete_save(username):
+                    committed[username] = None
+            else:
+                state = _state(step * 100 + rng.randrange(100), username)
+                attempt.update({username: state["user"]["currency"]})
+                if manager.save_game(username, state):
+                    committed[username] = state["user"]["currency"]
+            attempt.clear()
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_crash_at_random_offset(self, save_manager: SaveManager, monkeypatch, seed: int):
+        """Test that committed saves survive a crash at any byte and the store stays readable."""
+
+        monkeypatch.setattr(SaveManager, "JOURNAL_CHECKPOINT_EVERY", 3)
+        rng = random.Random(seed)
+        committed = {}
+        for username in self.USERS:
+            save_manager.save_game(username, _state(1, username))
+            committed[username] = 1
+
+        injector = FaultInjector(rng.randrange(0, 6000))
+        monkeypatch.setattr(save_manager_module, "open", injector.open, raising=False)
+        attempt = {}
+        try:
+            self._run_workload(save_manager, committed, attempt, rng)
+        except SimulatedCrash:
+            pass
+        monkeypatch.delattr(save_manager_module, "open")
+
+        # Acknowledged writes must survive exactly; the write cut off mid-way may land or not.
+        manager = _restart()
+        for username in self.USERS:
+            loaded = manager.load_game(username)
+            currency = loaded["user"]["currency"] if loaded is not None else None
+            allowed = {committed[username]}
+            if username in attempt:
+                allowed.add(attempt[username])
+            assert currency in allowed
+
+    def test_torn_journal_tail_is_ignored(self, save_manager: SaveManager):
+        """Test that a partially appended journal record does not break replay."""
+
+        save_manager.save_game('jessica29', _state(7, 'jessica29'))
+        with open(save_manager.journal_file, "ab") as f:
+            f.write(b'{"op": "save", "username": "mrBean29", "sta')
+
+        manager = _restart()
+
+        assert manager.load_game('jessica29')['user']['currency'] == 7
+        assert manager.load_game('mrBean29') is None
+        assert manager.journal_file.read_bytes() == b""
+
+    def test_corrupt_index_is_rebuilt(self, save_manager: SaveManager, monkeypatch):
+        """Test that a damaged index is rebuilt from the shards instead of wiping accounts."""
+
+        monkeypatch.setattr(SaveManager, "JOURNAL_CHECKPOINT_EVERY", 1)
+        save_manager.save_game('jessica29', _state(7, 'jessica29'))
+        save_manager.index_file.write_text('{"jessica29": ', encoding="utf-8")
+
+        manager = _restart()
+
+        assert manager.list_saves() == ['jessica29']
+        assert manager.load_game('jessica29')['user']['currency'] == 7
@@ -0,0 +1,18 @@
+import pytest
+from utils.stats import nearest_rank
+
+
+class TestNearestRank:
+    """Tests for the shared nearest-rank percentile helper."""
+
+    @pytest.mark.parametrize("point, expected", [(0, 1), (10, 1), (25, 1), (26, 2), (50, 2), (90, 4), (100, 4)])
+    def test_picks_nearest_rank(self, point: float, expected: int):
+        """Test the p-th percentile is the smallest sample covering p% of the samples."""
+
+        assert nearest_rank([1, 2, 3, 4], point) == expected
+
+    def test_empty_and_fractional(self):
+        """Test an empty sequence gives 0.0 and fractional points round the rank up."""
+
+        assert nearest_rank([], 50) == 0.0
+        assert nearest_rank(list(range(1, 1001)), 99.9) == 999
@@ -0,0 +1,101 @@
+import random
+from pathlib import Path
+import pytest
+from features.minigame.sudoku import Sudoku
+from features.minigame.sudokuBank import PuzzleBank, RECORD_SIZE, encode_puzzle, decode_puzzle
+from features.minigame.sudokuEngine import SudokuEngine, generate_puzzle
+
+
+@pytest.fixture
+def bank(tmp_path: Path):
+    bank = PuzzleBank(tmp_path / "bank", low_water=0, target=0)
+    yield bank
+    bank.stop()
+
+
+def _puzzles(count: int, cell_removed: int = 35):
+    rng = random.Random(count)
+    return [generate_puzzle(cell_removed, rng)[0] for _ in range(count)]
+
+
+class TestPuzzleBank:
+    """Tests for the on-disk Sudoku puzzle bank."""
+
+    def test_records_are_81_bytes(self, bank: PuzzleBank):
+        """Test puzzles are stored as fixed 81-byte records and round-trip."""
+
+        puzzles = _puzzles(3)
+        assert bank.add(35, puzzles) == 3
+        assert bank.path(35).stat().st_size == 3 * RECORD_SIZE
+        assert decode_puzzle(encode_puzzle(puzzles[0])) == puzzles[0]
+
+    def test_pop_is_lifo_and_empties(self, bank: PuzzleBank):
+        """Test pop returns the newest puzzle, shrinks the file and returns None when empty."""
+
+        puzzles = _puzzles(2)
+        bank.add(35, puzzles)
+        assert bank.pop(35) == puzzles[1]
+        assert bank.count(35) == 1
+        assert bank.pop(35) == puzzles[0]
+        assert bank.pop(35) is None
+        assert bank.pop(99) is None
+
+    def test_torn_and_corrupt_records_dropped(self, bank: PuzzleBank):
+        """Test a partial trailing record and an invalid record are skipped."""
+
+        good = _puzzles(1)[0]
+        bank.add(35, [good])
+        with open(bank.path(35), "ab") as f:
+            f.write(bytes([42] * RECORD_SIZE) + b"\x01\x02")
+
+        assert bank.count(35) == 2
+        assert bank.pop(35) == good
+        assert bank.count(35) == 0
+
+        with open(bank.path(35), "ab") as f:
+            f.write(b"\x05" * 10)
+        bank.add(35, [good])
+        assert bank.path(35).stat().st_size == RECORD_SIZE
+
+    def test_background_refill(self, tmp_path: Path):
+        """Test popping below the low-water mark refills the pool up to the target."""
+
+        bank = PuzzleBank(tmp_path / "bank", low_water=2, target=3)
+        try:
+            bank.add(35, _puzzles(2))
+            assert bank.pop(35) is not None
+            thread = bank.request_refill(35)
+            assert thread is not None
+            thread.join(timeout=30)
+            assert bank.count(35) == 3
+            assert bank.request_refill(35) is None
+        finally:
+            bank.stop()
+
+        for _ in range(3):
+            assert SudokuEngine(bank.pop(35, refill=False)).count_solutions(2) == 1
+
+    def test_parallel_fill(self, bank: PuzzleBank):
+        """Test bulk generation across worker processes appends unique puzzles."""
+
+        assert bank.fill(45, 6, workers=2, chunk=2) == 6
+        assert bank.count(45) == 6
+        puzzle = bank.pop(45)
+        assert puzzle.count(0) == 45
+        assert SudokuEngine(puzzle).count_solutions(2) == 1
+
+    def test_sudoku_pops_from_bank(self, bank: PuzzleBank, monkeypatch):
+        """Test Sudoku.generate_sudoku takes a banked puzzle and solves it for the session."""
+
+        monkeypatch.setattr(PuzzleBank, "_instance", bank)
+        puzzle = _puzzles(1, 55)[0]
+        bank.add(55, [puzzle])
+
+        game = Sudoku()
+        game.setup(None, None)
+        game.cell_removed = 55
+        game.generate_sudoku()
+
+        assert [v for row in game.grid for v in row] == puzzle
+        assert all(p in (0, s) for p, s in zip(puzzle, game.solution))
+        assert bank.count(55) == 0
@@ -0,0 +1,179 @@
+import random
+import pytest
+from features.minigame.sudoku import Sudoku
+from features.minigame.sudokuBank import PuzzleBank
+from features.minigame.sudokuEngine import SudokuEngine, generate_puzzle
+
+PUZZLE = (
+    "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+)
+SOLUTION = (
+    "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_puzzle_bank(tmp_path, monkeypatch):
+    """Point Sudoku at an empty, non-refilling puzzle bank so games generate on the spot."""
+    monkeypatch.setattr(PuzzleBank, "_instance", PuzzleBank(tmp_path / "bank", low_water=0))
+
+
+def _flat(text: str):
+    return [int(ch) for ch in text]
+
+
+def _is_complete(cells) -> bool:
+    groups = [cells[r * 9:r * 9 + 9] for r in range(9)]
+    groups += [cells[c::9] for c in range(9)]
+    groups += [[cells[(br + r) * 9 + bc + c] for r in range(3) for c in range(3)]
+               for br in (0, 3, 6) for bc in (0, 3, 6)]
+    return all(sorted(group) == list(range(1, 10)) for group in groups)
+
+
+class TestSudokuEngine:
+    """Tests for the bitmask Sudoku solver and generator."""
+
+    def test_solves_known_puzzle(self):
+        """Test the classic puzzle solves to its unique solution, leaving the input untouched."""
+
+        engine = SudokuEngine(_flat(PUZZLE))
+        assert engine.count_solutions(5) == 1
+        assert engine.solution == _flat(SOLUTION)
+        assert engine.cells == _flat(PUZZLE)
+
+    def test_accepts_nested_rows(self):
+        """Test a 9x9 list of rows is accepted as well as a flat list."""
+
+        rows = [_flat(PUZZLE)[r * 9:r * 9 + 9] for r in range(9)]
+        engine = SudokuEngine(rows)
+        assert engine.solve()
+        assert engine.solution == _flat(SOLUTION)
+
+    def test_solution_count_is_limited(self):
+        """Test counting stops at the limit on an underconstrained board."""
+
+        assert SudokuEngine([0] * 81).count_solutions(3) == 3
+        assert SudokuEngine([0] * 81).count_solutions(1) == 1
+
+    def test_unsolvable_and_invalid_boards(self):
+        """Test contradictions are reported by solve() and malformed boards by ValueError."""
+
+        stuck = _flat(PUZZLE)
+        stuck[2] = 1  # legal placement with no completion
+        assert not SudokuEngine(stuck).solve()
+
+        duplicate = _flat(PUZZLE)
+        duplicate[2] = 5
+        with pytest.raises(ValueError):
+            SudokuEngine(duplicate)
+        with pytest.raises(ValueError):
+            SudokuEngine([0] * 80)
+        with pytest.raises(ValueError):
+            SudokuEngine([10] + [0] * 80)
+
+    @pytest.mark.parametrize("cell_removed", [35, 45, 55, 65])
+    def test_generated_puzzles_are_unique(self, cell_removed: int):
+        """Test generated puzzles have one solution consistent with the clues."""
+
+        rng = random.Random(cell_removed)
+        for _ in range(5):
+            puzzle, solution = generate_puzzle(cell_removed, rng)
+            assert _is_complete(solution)
+            assert all(p in (0, s) for p, s in zip(puzzle, solution))
+            assert puzzle.count(0) <= cell_removed
+            assert SudokuEngine(puzzle).count_solutions(2) == 1
+
+        if cell_removed <= 45:
+            assert puzzle.count(0) == cell_removed
+
+    def test_sudoku_game_uses_engine(self):
+        """Test Sudoku.generate_sudoku fills grid and pre_filled, and solve_sudoku completes it."""
+
+        game = Sudoku()
+        game.setup(None, None)
+        game.cell_removed = 45
+        game.generate_sudoku()
+
+        assert sum(row.count(0) for row in game.grid) == 45
+        assert all(game.pre_filled[r][c] == (game.grid[r][c] != 0) for r in range(9) for c in range(9))
+        board = [row[:] for row in game.grid]
+        assert game.solve_sudoku(board)
+        assert _is_complete([v for row in board for v in row])
+
+
+class TestSudokuSession:
+    """Tests for the cached solution and incremental state of a Sudoku game."""
+
+    @staticmethod
+    def _game(cell_removed: int = 45) -> Sudoku:
+        game = Sudoku()
+        game.setup(None, None)
+        game.cell_removed = cell_removed
+        game.generate_sudoku()
+        return game
+
+    def test_solution_is_cached(self):
+        """Test the session keeps the solution consistent with the clues."""
+
+        game = self._game()
+        assert _is_complete(game.solution)
+        assert all(game.grid[r][c] in (0, game.solution[r * 9 + c]) for r in range(9) for c in range(9))
+        assert game.progress() == (36, 0, 45)
+
+    def test_hint_reveals_solution_without_solving(self, monkeypatch):
+        """Test hints read the cached solution and never run the solver."""
+
+        game = self._game()
+        monkeypatch.setattr(game, "solve_sudoku", lambda board: pytest.fail("hint re-solved the grid"))
+        for _ in range(10):
+            hint = game.get_hint()
+            value = int(hint.split()[2])
+            row, col = int(hint.split("col-")[1][0]) - 1, int(hint.split("row-")[1][0]) - 1
+            assert game.grid[row][col] == 0 and game.solution[row * 9 + col] == value
+        assert game.coins == 50 - 150
+
+    def test_divergence_and_progress_tracking(self):
+        """Test placements, overwrites and clears keep wrong/empty counts and masks in sync."""
+
+        game = self._game()
+        row, col = divmod(game._empty[0], 9)
+        answer = game.solution[row * 9 + col]
+        wrong = next((n for n in range(1, 10) if n != answer and game.can_place(row, col, n)), None)
+
+        game._handle_valid_move(row, col, answer)
+        assert not game.diverges(row, col)
+        assert game.progress() == (37, 0, 44)
+        assert not game.can_place(row, (col + 1) % 9, answer)
+
+        if wrong is not None:
+            game._handle_move_action((row, col, wrong))
+            assert game.diverges(row, col)
+            assert game.progress() == (36, 1, 44)
+            assert "is wrong" in game.get_hint()
+
+        game._handle_clear_action((row, col))
+        assert game.progress() == (36, 0, 45)
+        assert row * 9 + col in game._empty
+
+    def test_clash_costs_a_try(self):
+        """Test a move clashing with a clue is rejected and costs a try."""
+
+        game = self._game()
+        pos = game._empty[0]
+        row, col = divmod(pos, 9)
+        clue = next(game.grid[row][c] for c in range(9) if game.grid[row][c])
+
+        should_continue, won = game._handle_move_action((row, col, clue))
+        assert (should_continue, won, game.tries) == (True, False, 2)
+        assert game.grid[row][col] == 0
+
+    def test_filling_solution_wins(self):
+        """Test entering the solution for every empty cell ends the game as a win."""
+
+        game = self._game(35)
+        outcome = None
+        for pos in list(game._empty):
+            row, col = divmod(pos, 9)
+            outcome = game._handle_move_action((row, col, game.solution[pos]))
+        assert outcome == (False, True)
+        assert game.progress() == (81, 0, 0)
@@ -0,0 +1,115 @@
+import random
+import pytest
+from features.minigame.tetris import Tetris
+from features.minigame.tetrisBoard import Bitboard, piece_state
+
+
+def _zip_rotate(shape):
+    return [list(row) for row in zip(*shape[::-1])]
+
+
+def _list_collides(board, shape, off_y, off_x):
+    """Reference collision check: the original nested-list loop."""
+    for y, row in enumerate(shape):
+        for x, cell in enumerate(row):
+            by, bx = y + off_y, x + off_x
+            if cell and (bx < 0 or bx >= Tetris.WIDTH or by >= Tetris.HEIGHT or (by >= 0 and board[by][bx])):
+                return True
+    return False
+
+
+def _list_merge_and_clear(board, shape, off_y, off_x):
+    for y, row in enumerate(shape):
+        for x, cell in enumerate(row):
+            if cell and 0 <= y + off_y < Tetris.HEIGHT and 0 <= x + off_x < Tetris.WIDTH:
+                board[y + off_y][x + off_x] = 1
+    kept = [row for row in board if not all(row)]
+    cleared = Tetris.HEIGHT - len(kept)
+    return [[0] * Tetris.WIDTH for _ in range(cleared)] + kept, cleared
+
+
+class TestTetrisBitboard:
+    """Tests for the bitboard Tetris engine."""
+
+    @pytest.mark.parametrize("shape_index, ring_size", [(0, 2), (1, 1), (2, 4), (3, 2), (4, 2), (5, 4), (6, 4)])
+    def test_rotation_rings(self, shape_index: int, ring_size: int):
+        """Test every shape's precomputed rotations match zip-based rotation and cycle."""
+
+        shape = Tetris.SHAPES[shape_index]
+        state = piece_state(shape)
+        expected = shape
+        seen = []
+        for _ in range(4):
+            assert state.cells == expected
+            seen.append(state)
+            state, expected = state.next, _zip_rotate(expected)
+        assert state is seen[0]
+        assert len({id(s) for s in seen}) == ring_size
+        assert Tetris.rotate(shape) == _zip_rotate(shape)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_list_engine(self, seed: int):
+        """Test collisions, merges and line clears against the nested-list implementation."""
+
+        rng = random.Random(seed)
+        grid = Bitboard(Tetris.WIDTH, Tetris.HEIGHT)
+        board = [[0] * Tetris.WIDTH for _ in range(Tetris.HEIGHT)]
+        for _ in range(400):
+            shape = rng.choice(Tetris.SHAPES)
+            for _ in range(rng.randrange(4)):
+                shape = _zip_rotate(shape)
+            state = piece_state(shape)
+            for _ in range(10):
+                off_y, off_x = rng.randrange(-3, Tetris.HEIGHT + 1), rng.randrange(-3, Tetris.WIDTH + 1)
+                assert grid.collides(state, off_y, off_x) == _list_collides(board, shape, off_y, off_x)
+
+            off_x = rng.randrange(0, Tetris.WIDTH - len(shape[0]) + 1)
+            off_y = 0
+            while not _list_collides(board, shape, off_y + 1, off_x):
+                off_y += 1
+            if _list_collides(board, shape, off_y, off_x):
+                grid = Bitboard(Tetris.WIDTH, Tetris.HEIGHT)
+                board = [[0] * Tetris.WIDTH for _ in range(Tetris.HEIGHT)]
+                continue
+
+            grid.merge(state, off_y, off_x)
+            board, cleared = _list_merge_and_clear(board, shape, off_y, off_x)
+            assert grid.clear_full_lines() == cleared
+            assert grid.view() == board
+
+    def test_board_view_is_live(self):
+        """Test board[y][x] reads and writes go straight to the bitboard."""
+
+        game = Tetris()
+        game.setup(None, None)
+        game.board[19][3] = 1
+        assert game.grid.rows[19] == 1 << 3
+        assert game.board[19][3] == 1 and game.board[-1][-1] == 0
+        assert len(game.board) == Tetris.HEIGHT and len(game.board[0]) == Tetris.WIDTH
+
+        game.board = [[1] * Tetris.WIDTH for _ in range(Tetris.HEIGHT)]
+        assert game.remove_full_lines() == Tetris.HEIGHT
+        assert game.board == [[0] * Tetris.WIDTH for _ in range(Tetris.HEIGHT)]
+
+    def test_game_moves_use_rotation_ring(self):
+        """Test rotating, moving and dropping through the Tetris API."""
+
+        game = Tetris()
+        game.setup(None, None)
+        game.current_piece = Tetris.SHAPES[2]
+        game.piece_offset = [5, 4]
+        game._try_rotate()
+        assert game.current_piece == _zip_rotate(Tetris.SHAPES[2])
+
+        game._try_move(0, -10)
+        assert game.piece_offset == [5, 4]
+        assert not game.check_collision(game.current_piece, game.piece_offset)
+
+        game.current_piece = Tetris.SHAPES[0]
+        game.next_piece = Tetris.SHAPES[1]
+        game.piece_offset = [19, 0]
+        for x in range(4, Tetris.WIDTH):
+            game.board[19][x] = 1
+        game._handle_drop()
+        assert game.lines_cleared == 1 and game.score == 100
+        assert game.current_piece == Tetris.SHAPES[1]
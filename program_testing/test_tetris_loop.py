@@ -0,0 +1,146 @@
+import asyncio
+import curses
+import threading
+import pytest
+from features.minigame.tetris import Tetris
+from features.minigame.tetrisRender import TetrisRenderer
+
+
+class FakeClock:
+    """Monotonic clock that only advances while the game waits in getch (or a test stalls it)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeScreen:
+    """curses window double: getch waits up to the timeout on the fake clock for scripted keys."""
+
+    def __init__(self, clock: FakeClock, keys, stall: float = 0.0):
+        self.clock = clock
+        self.keys = sorted(keys, key=lambda item: item[0])
+        self.stall = stall
+        self.delay_ms = -1
+        self.polls = 0
+        self.waits = []
+
+    def timeout(self, delay_ms):
+        self.delay_ms = delay_ms
+
+    def getch(self):
+        self.polls += 1
+        if self.delay_ms > 0:
+            self.waits.append(self.delay_ms)
+        deadline = self.clock.now + max(self.delay_ms, 0) / 1000 + self.stall
+        self.stall = 0.0
+        if self.keys and self.keys[0][0] <= deadline:
+            self.clock.now = max(self.clock.now, self.keys[0][0])
+            return self.keys.pop(0)[1]
+        self.clock.now = deadline
+        return -1
+
+    def getmaxyx(self):
+        return (30, 80)
+
+    def addstr(self, *args):
+        pass
+
+    def erase(self):
+        pass
+
+    clear = refresh = noutrefresh = erase
+
+
+@pytest.fixture
+def game(monkeypatch):
+    monkeypatch.setattr(curses, "curs_set", lambda visibility: None)
+    game = Tetris()
+    game.setup(None, None, seed=0)
+    game.renderer = TetrisRenderer(doupdate=lambda: None)
+    game.clock = FakeClock()
+    game.current_piece = Tetris.SHAPES[1]
+    game.piece_offset = [0, 4]
+    return game
+
+
+class TestTetrisLoop:
+    """Tests for the fixed-timestep Tetris game loop."""
+
+    def test_gravity_follows_the_accumulator(self, game: Tetris):
+        """Test gravity drops one row per `speed` seconds of simulated time."""
+
+        game.speed = 0.5
+        game.game_loop(FakeScreen(game.clock, [(2.25, ord('q'))]))
+        assert game.piece_offset[0] == 4
+        assert game.stalls == 0
+
+    def test_idle_loop_wakes_only_for_gravity(self, game: Tetris):
+        """Test without input the loop sleeps in getch until each gravity deadline."""
+
+        game.speed = 0.5
+        screen = FakeScreen(game.clock, [(2.25, ord('q'))])
+        game.game_loop(screen)
+        assert screen.waits == [500] * 5
+        assert screen.polls == 5
+        assert game.renderer.frames_drawn == 5
+
+    def test_key_shortens_the_wait_to_the_deadline(self, game: Tetris):
+        """Test after a key the next wait is only what is left of the gravity period."""
+
+        game.speed = 0.5
+        screen = FakeScreen(game.clock, [(0.2, curses.KEY_LEFT), (0.6, ord('q'))])
+        game.game_loop(screen)
+        assert screen.waits[:3] == [500, 300, 500]
+        assert game.piece_offset == [1, 3]
+
+    def test_all_pending_keys_drain_in_one_frame(self, game: Tetris):
+        """Test keys queued together are handled in the same wake-up."""
+
+        keys = [(0.1, curses.KEY_LEFT), (0.1, curses.KEY_LEFT), (0.1, curses.KEY_LEFT), (0.2, ord('q'))]
+        game.game_loop(FakeScreen(game.clock, keys))
+        assert game.piece_offset[1] == 1
+        assert game.input_latency()["count"] == 1
+
+    def test_soft_drop_counts_cleared_lines(self, game: Tetris):
+        """Test the soft-drop key and gravity share one drop path that counts lines."""
+
+        for x in range(Tetris.WIDTH):
+            if x not in (4, 5):
+                game.board[19][x] = game.board[18][x] = 1
+        game.piece_offset = [17, 4]
+        game.game_loop(FakeScreen(game.clock, [(0.0, curses.KEY_DOWN), (0.0, curses.KEY_DOWN), (0.0, ord('q'))]))
+        assert (game.lines_cleared, game.score) == (2, 200)
+
+    def test_stall_is_bounded(self, game: Tetris):
+        """Test a long stall applies at most MAX_GRAVITY_STEPS drops and then drops the backlog."""
+
+        game.speed = 0.1
+        game.game_loop(FakeScreen(game.clock, [(10.15, ord('q'))], stall=10.0))
+        assert game.piece_offset[0] == Tetris.MAX_GRAVITY_STEPS
+        assert game.stalls == 1
+
+    def test_input_latency_counts_handled_keys(self, game: Tetris):
+        """Test latency is sampled once per wake-up that handled a key."""
+
+        game.game_loop(FakeScreen(game.clock, [(0.05, curses.KEY_RIGHT), (0.3, curses.KEY_UP), (0.5, ord('q'))]))
+        latency = game.input_latency()
+        assert latency["count"] == 2
+        assert latency["max_ms"] == pytest.approx(0.0)
+
+    def test_curses_runs_on_the_main_thread(self, game: Tetris, monkeypatch):
+        """Test build_game runs curses.wrapper on the main thread, where Ctrl-C reaches its endwin()."""
+
+        threads = []
+
+        def wrapper(loop):
+            threads.append(threading.current_thread())
+            return 0
+
+        monkeypatch.setattr(curses, "wrapper", wrapper)
+        monkeypatch.setattr(game, "pause", lambda seconds: asyncio.sleep(0))
+        summary = asyncio.run(game.build_game())
+        assert threads == [threading.main_thread()]
+        assert summary["score"] == 0
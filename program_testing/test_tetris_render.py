@@ -0,0 +1,105 @@
+import random
+from features.minigame.tetris import Tetris
+from features.minigame.tetrisRender import TetrisRenderer
+
+
+class FakeWindow:
+    """Minimal curses window double: a character buffer plus call counters."""
+
+    def __init__(self, height: int = 30, width: int = 80):
+        self.size = (height, width)
+        self.cells = {}
+        self.refreshes = 0
+
+    def getmaxyx(self):
+        return self.size
+
+    def erase(self):
+        self.cells.clear()
+
+    def addstr(self, y, x, text):
+        for i, ch in enumerate(text):
+            self.cells[(y, x + i)] = ch
+
+    def noutrefresh(self):
+        self.refreshes += 1
+
+    def screen(self):
+        return {pos: ch for pos, ch in self.cells.items() if ch != " "}
+
+
+def _game(seed: int = 0) -> Tetris:
+    random.seed(seed)
+    game = Tetris()
+    game.setup(None, None)
+    game.renderer = TetrisRenderer(doupdate=lambda: None)
+    return game
+
+
+def _fresh_screen(game: Tetris, size=(30, 80)):
+    win = FakeWindow(*size)
+    TetrisRenderer(doupdate=lambda: None).render(win, game)
+    return win.screen()
+
+
+class TestTetrisRenderer:
+    """Tests for the dirty-region Tetris renderer."""
+
+    def test_incremental_frames_match_full_redraw(self):
+        """Test the screen after many incremental frames equals a from-scratch render."""
+
+        game = _game(1)
+        win = FakeWindow()
+        rng = random.Random(1)
+        for _ in range(600):
+            if game.game_over:
+                break
+            move = rng.choice(("left", "right", "rotate", "drop", "drop"))
+            if move == "left":
+                game._try_move(0, -1)
+            elif move == "right":
+                game._try_move(0, 1)
+            elif move == "rotate":
+                game._try_rotate()
+            else:
+                game._handle_drop()
+            game.draw_board(win)
+            assert win.screen() == _fresh_screen(game)
+
+    def test_unchanged_state_skips_frame(self):
+        """Test a frame with no state change writes nothing and does not refresh."""
+
+        game = _game()
+        win = FakeWindow()
+        assert game.draw_board(win)
+        written, refreshes = game.renderer.bytes_written, win.refreshes
+
+        assert not game.draw_board(win)
+        assert game.renderer.bytes_written == written
+        assert win.refreshes == refreshes
+        stats = game.renderer.stats()
+        assert (stats["frames_drawn"], stats["frames_skipped"], stats["full_redraws"]) == (1, 1, 1)
+        assert stats["avg_frame_ms"] >= 0
+
+    def test_move_repaints_only_changed_cells(self):
+        """Test moving a piece one column writes a handful of cells, not the whole board."""
+
+        game = _game()
+        win = FakeWindow()
+        game.draw_board(win)
+        before = game.renderer.bytes_written
+
+        game._try_move(0, 1)
+        assert game.draw_board(win)
+        assert 0 < game.renderer.bytes_written - before <= 8 * 2
+
+    def test_resize_forces_full_redraw(self):
+        """Test a terminal size change re-centres the board with a full redraw."""
+
+        game = _game()
+        win = FakeWindow()
+        game.draw_board(win)
+        win.size = (40, 100)
+        assert game.draw_board(win)
+        assert game.renderer.full_redraws == 2
+        assert win.screen() == _fresh_screen(game, (40, 100))
@@ -0,0 +1,57 @@
+import pytest
+from features.minigame.ticTacToe import TicTacToe
+from features.minigame.ticTacToeArena import (
+    heuristic_agent, perfect_agent, percentiles, play_game, random_agent, run_matchup,
+)
+
+
+class TestTicTacToeArena:
+    """Tests for headless Tic-Tac-Toe self-play."""
+
+    def test_perfect_play_draws(self):
+        """Test the exact 3x3 solver draws against itself from either side."""
+
+        assert play_game(3, perfect_agent, perfect_agent, seed=0) is None
+        assert play_game(3, perfect_agent, perfect_agent, seed=0, x_first=False) is None
+
+    def test_perfect_never_loses_to_heuristic(self):
+        """Test the rule-based pet cannot beat the 3x3 solver."""
+
+        for seed in range(4):
+            assert play_game(3, heuristic_agent, perfect_agent, seed, x_first=seed % 2 == 0) != "X"
+
+    @pytest.mark.parametrize("size", [3, 4, 5])
+    def test_seed_replays_games(self, size: int):
+        """Test the same seed replays the same random games."""
+
+        first = [play_game(size, random_agent, random_agent, seed) for seed in range(10)]
+        second = [play_game(size, random_agent, random_agent, seed) for seed in range(10)]
+        assert first == second
+
+    def test_heuristic_agent_plays_either_side(self):
+        """Test the heuristic agent leaves the game's marks as it found them."""
+
+        game = TicTacToe()
+        game.setup(None, None, seed=0)
+        game.make_move(0, 0, "O")
+        game.make_move(0, 1, "O")
+        assert heuristic_agent(game, "X") == (0, 2)  # blocks as X
+        assert (game.player_mark, game.pet_mark) == ("X", "O")
+
+    def test_matchup_report(self):
+        """Test a matchup reports rates, throughput and latency percentiles."""
+
+        result = run_matchup(3, "heuristic", "random", games=20, seed=0)
+        assert result["games"] == 20
+        assert sum(result["rates"].values()) == pytest.approx(1.0)
+        assert result["rates"]["loss"] == 0.0
+        assert result["games_per_s"] > 0
+        assert set(result["latency_ms"]) == {"first", "second"}
+        assert set(result["latency_ms"]["first"]) == {"p50", "p90", "p99"}
+
+    def test_percentiles_nearest_rank(self):
+        """Test nearest-rank percentiles in milliseconds."""
+
+        samples = [i / 1000 for i in range(1, 101)]
+        assert percentiles(samples) == pytest.approx({"p50": 50.0, "p90": 90.0, "p99": 99.0})
+        assert percentiles([]) == {"p50": 0.0, "p90": 0.0, "p99": 0.0}
@@ -0,0 +1,106 @@
+import random
+import pytest
+from features.minigame.ticTacToe import TicTacToe
+from features.minigame.ticTacToeBoard import LineBoard, EMPTY
+
+
+def _brute_force_wins(cells, size, win_length):
+    """Reference count of completed windows per mark, scanning every direction."""
+    counts = {}
+    for row in range(size):
+        for col in range(size):
+            for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_row, end_col = row + d_row * (win_length - 1), col + d_col * (win_length - 1)
+                if not (0 <= end_row < size and 0 <= end_col < size):
+                    continue
+                window = {cells[(row + d_row * k) * size + col + d_col * k] for k in range(win_length)}
+                if len(window) == 1 and EMPTY not in window:
+                    mark = window.pop()
+                    counts[mark] = counts.get(mark, 0) + 1
+    return counts
+
+
+def _game(size: int) -> TicTacToe:
+    game = TicTacToe()
+    game.setup(None, None)
+    game.resize(size)
+    return game
+
+
+class TestLineBoard:
+    """Tests for incremental Tic-Tac-Toe line counts."""
+
+    @pytest.mark.parametrize("size, win_length", [(3, 3), (4, 4), (5, 5), (5, 3), (4, 2)])
+    def test_matches_brute_force(self, size: int, win_length: int):
+        """Test wins and completions after random places and undos against a full rescan."""
+
+        rng = random.Random(size * 10 + win_length)
+        board = LineBoard(size, win_length)
+        for _ in range(500):
+            empties = board.empties()
+            if empties and (rng.random() < 0.7 or len(empties) == size * size):
+                pos = rng.choice(empties)
+                mark = rng.choice("XO")
+                before = board.wins.get(mark, 0)
+                completes = board.completes(pos, mark)
+                board.place(pos, mark)
+                assert board.wins[mark] - before == completes
+            else:
+                board.undo(rng.choice([p for p in range(size * size) if board.cells[p] != EMPTY]))
+            assert board.check_winner() == _brute_force_wins(board.cells, size, win_length)
+            assert board.empty_count == board.cells.count(EMPTY)
+
+    def test_completes_counts_open_lines(self):
+        """Test completes() counts every line a move would finish."""
+
+        board = LineBoard(3)
+        for pos in (0, 2, 6, 8):
+            board.place(pos, "X")
+        assert board.completes(4, "X") == 2  # both diagonals
+        assert board.completes(1, "X") == 1
+        assert board.completes(4, "O") == 0
+
+
+class TestTicTacToeHelpers:
+    """Tests for the TicTacToe AI helpers on top of LineBoard."""
+
+    def test_moves_keep_board_and_lines_in_sync(self):
+        """Test make_move updates the display board and the line model together."""
+
+        game = _game(3)
+        assert game.make_move(0, 0, "X") and not game.make_move(0, 0, "O")
+        assert game.board[0][0] == "X" and game.lines.cells[0] == "X"
+        assert (0, 0) not in game.available_moves() and len(game.available_moves()) == 8
+
+    def test_win_block_and_fork(self):
+        """Test the pet wins, then blocks, then forks when it can."""
+
+        game = _game(3)
+        game.make_move(0, 0, "O")
+        game.make_move(0, 1, "O")
+        game.make_move(1, 0, "X")
+        game.make_move(1, 1, "X")
+        assert game.winning_move("O") == (0, 2)
+        assert game.pet_move() == (0, 2)
+
+        game = _game(3)
+        game.make_move(1, 0, "X")
+        game.make_move(1, 1, "X")
+        assert game.pet_move() == (1, 2)
+
+        game = _game(3)
+        game.make_move(0, 0, "O")
+        game.make_move(2, 2, "O")
+        game.make_move(1, 1, "X")
+        game.make_move(0, 1, "X")
+        assert game.fork_move("O") == (2, 0)
+
+    def test_check_winner_counts_completed_lines(self):
+        """Test majority-style counting on a full 4x4 board."""
+
+        game = _game(4)
+        for row in range(4):
+            for col in range(4):
+                game.make_move(row, col, "X" if row < 2 else "O")
+        assert game.check_winner() == {"X": 2, "O": 2}
+        assert game._check_game_over() and game.winner is None
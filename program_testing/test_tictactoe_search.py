@@ -0,0 +1,101 @@
+import time
+import pytest
+from features.minigame.ticTacToe import TicTacToe
+from features.minigame.ticTacToeBoard import LineBoard
+from features.minigame.ticTacToeSearch import TicTacToeSearch, symmetries
+
+
+class _Pet:
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def get_age_summary(self) -> str:
+        return self.stage
+
+
+def _board(size: int, moves) -> LineBoard:
+    board = LineBoard(size)
+    for pos, mark in moves:
+        board.place(pos, mark)
+    return board
+
+
+class TestTicTacToeSearch:
+    """Tests for the alpha-beta Tic-Tac-Toe search."""
+
+    def test_symmetries_are_permutations(self):
+        """Test the eight symmetries are distinct permutations of the cells."""
+
+        perms = symmetries(4)
+        assert len(set(perms)) == 8
+        assert all(sorted(perm) == list(range(16)) for perm in perms)
+
+    def test_root_moves_reduced_by_symmetry(self):
+        """Test an empty 3x3 board has three distinct first moves: corner, edge and center."""
+
+        search = TicTacToeSearch(3)
+        board = LineBoard(3)
+        search._hashes = search._hash_board(board, "X")
+        assert len(search._distinct_moves(board, board.empties(), "X")) == 3
+
+    def test_takes_immediate_win(self):
+        """Test the search completes its own line instead of blocking."""
+
+        board = _board(3, [(0, "O"), (1, "O"), (3, "X"), (4, "X")])
+        assert TicTacToeSearch(3).best_move(board, "O") == 2
+
+    def test_blocks_threat(self):
+        """Test the search blocks the opponent's open line."""
+
+        board = _board(3, [(0, "X"), (1, "X"), (4, "O")])
+        assert TicTacToeSearch(3).best_move(board, "O") == 2
+
+    def test_perfect_self_play_draws(self):
+        """Test two full-depth searches on 3x3 end in a draw."""
+
+        search = TicTacToeSearch(3)
+        board = LineBoard(3)
+        mark, other = "X", "O"
+        while board.empty_count and not board.check_winner():
+            board.place(search.best_move(board, mark), mark)
+            mark, other = other, mark
+        assert board.check_winner() == {}
+
+    def test_time_budget_bounds_search(self):
+        """Test iterative deepening returns a legal move within the budget on an empty 5x5."""
+
+        board = LineBoard(5)
+        search = TicTacToeSearch(5)
+        started = time.perf_counter()
+        move = search.best_move(board, "X", time_budget=0.05)
+        assert time.perf_counter() - started < 0.5
+        assert move in board.empties()
+        assert search.depth_reached >= 1
+
+    def test_full_board_returns_none(self):
+        """Test a full board has no move."""
+
+        board = _board(3, [(pos, "XO"[pos % 2]) for pos in range(9)])
+        assert TicTacToeSearch(3).best_move(board, "X") is None
+
+
+class TestPetSearchLevels:
+    """Tests for mapping the pet's life stage to search limits."""
+
+    @pytest.mark.parametrize("stage, searches", [("Baby", False), ("Teen", True), ("Elder", True)])
+    def test_stage_selects_search(self, stage: str, searches: bool):
+        """Test only grown pets use the search."""
+
+        game = TicTacToe()
+        game.setup(None, _Pet(stage))
+        assert bool(game.search_limits()) == searches
+
+    def test_searching_pet_blocks(self):
+        """Test a searching pet answers a row threat through pet_move."""
+
+        game = TicTacToe()
+        game.setup(None, _Pet("Adult"))
+        game.make_move(1, 0, "X")
+        game.make_move(0, 0, "O")
+        game.make_move(1, 1, "X")
+        assert game.pet_move() == (1, 2)
@@ -0,0 +1,102 @@
+import io
+from collections import Counter
+from contextlib import redirect_stdout
+import pytest
+from constants.configs import UnoConstants as UC
+from features.minigame.uno import Uno
+from features.minigame.unoCards import (
+    DECK, DRAW_FOUR, NAMES, WILD, card, card_code, card_name, chosen, is_wild, new_deck, valid_moves,
+)
+
+
+def _reference_can_play(card_text: str, top_text: str) -> bool:
+    """The string-based rule the integer table replaces."""
+    card_parts = card_text.split()
+    top_parts = top_text.split()
+    card_color, card_value = card_parts[0], " ".join(card_parts[1:])
+    top_color = top_parts[0]
+    top_value = " ".join(top_parts[1:]) if len(top_parts) > 1 else None
+    if "Wild" in card_color:
+        return True
+    if top_parts[0] == "Wild" and len(top_parts) > 1:
+        return card_parts[0] == top_parts[1]
+    return card_color == top_color or card_value == top_value
+
+
+class _Pet:
+    name = "Mochi"
+    emoji = "🐱"
+
+
+def _game(top: int) -> Uno:
+    game = Uno()
+    game._reset_table([{'name': 'You', 'hand': [], 'emoji': '👤'}, {'name': 'Mochi', 'hand': [], 'emoji': '🐱'}], seed=0)
+    game.pet = _Pet()
+    game.deck = new_deck()
+    game.discard = bytearray((top,))
+    game.top_card = top
+    return game
+
+
+class TestUnoCards:
+    """Tests for the integer UNO card model."""
+
+    def test_deck_composition(self):
+        """Test the deck has the standard 108 cards."""
+
+        names = Counter(card_name(code) for code in DECK)
+        assert len(DECK) == 108
+        assert names["RED 0"] == 1 and names["BLUE 7"] == 2 and names["GREEN DrawTwo"] == 2
+        assert names["Wild ColourChanger"] == 4 and names["Wild DrawFour"] == 4
+        assert sorted(new_deck()) == sorted(DECK)
+
+    def test_names_round_trip(self):
+        """Test every named code parses back to itself."""
+
+        for code, name in enumerate(NAMES):
+            if name is not None:
+                assert card_code(name) == code
+        assert card_name(chosen(UC.COLORS.index("GREEN"))) == "Wild GREEN"
+        with pytest.raises(ValueError):
+            card_code("PURPLE 3")
+
+    def test_playability_matches_string_rules(self):
+        """Test the precomputed table against the old string comparison for every pair."""
+
+        cards = sorted(set(DECK))
+        tops = [code for code in cards if not is_wild(code)] + [chosen(c) for c in range(WILD)]
+        for top in tops:
+            expected = [code for code in cards if _reference_can_play(card_name(code), card_name(top))]
+            assert valid_moves(cards, top) == expected
+            assert [code for code in cards if Uno.can_play(code, top)] == expected
+
+    def test_wild_keeps_physical_card(self):
+        """Test a played wild puts the real card on the discard pile and a chosen colour on top."""
+
+        top = card(0, 5)
+        game = _game(top)
+        wild = card(WILD, DRAW_FOUR)
+        game.players[1]['hand'] = [wild, card(1, 3)]
+        game.current_player_index = 1
+        with redirect_stdout(io.StringIO()):
+            played = game._play_card(game.players[1], wild)
+        assert card_name(played).startswith("Wild ") and not is_wild(played)
+        assert game.discard[-1] == wild
+        assert len(game.players[0]['hand']) == 4 and game.skip
+
+    def test_reshuffle_returns_real_cards(self):
+        """Test an empty deck is refilled from the discard pile, keeping the top card."""
+
+        game = _game(card(2, 9))
+        game.deck = bytearray()
+        game.discard = bytearray((card(WILD, DRAW_FOUR), card(1, 1), card(2, 9)))
+        drawn = game.draw_card()
+        assert drawn in (card(WILD, DRAW_FOUR), card(1, 1))
+        assert game.discard == bytearray((card(2, 9),))
+
+    def test_red_zero_is_a_card(self):
+        """Test code 0 (RED 0) is treated as a real card, not as 'no card'."""
+
+        game = _game(card(0, 5))
+        game.players[0]['hand'] = [card(0, 0)]
+        assert game.get_valid_moves(game.players[0]['hand']) == [0]
@@ -0,0 +1,115 @@
+import io
+from contextlib import redirect_stdout
+import pytest
+from features.minigame.baseClass import Pacer
+from features.minigame.unoCards import DRAW_FOUR, WILD, card, is_wild
+from features.minigame.unoSim import (
+    ColourHoardingPolicy, DeckExhausted, HeadlessUno, RandomPolicy, WildLastPolicy, play_game, tournament,
+)
+
+
+class TestUnoSim:
+    """Tests for headless UNO games and tournaments."""
+
+    @pytest.mark.parametrize("seats", [2, 3, 5])
+    def test_seed_replays_game(self, seats: int):
+        """Test the same seed replays the same game."""
+
+        policies = [RandomPolicy() for _ in range(seats)]
+        first = play_game(policies, seed=7)
+        second = play_game(policies, seed=7)
+        assert first == second
+        assert first["stalled"] or first["cards_left"][first["winner_seat"]] == 0
+
+    def test_cards_are_conserved(self):
+        """Test hands, deck and discard pile always hold exactly the 108 cards."""
+
+        game = HeadlessUno([RandomPolicy(), WildLastPolicy(), ColourHoardingPolicy(), RandomPolicy()], seed=3)
+        with redirect_stdout(io.StringIO()):
+            game.deal(10)
+            for _ in range(300):
+                current = game.players[game.current_player_index]
+                if game._finish_turn(current, game._bot_turn(current)):
+                    break
+                held = sum(len(player['hand']) for player in game.players)
+                assert held + len(game.deck) + len(game.discard) == 108
+
+    def test_never_pauses(self):
+        """Test headless games do not go through the interactive, paced turn."""
+
+        pacer = Pacer.get_instance()
+        requested = pacer.requested
+        play_game([RandomPolicy(), RandomPolicy()], seed=1)
+        assert pacer.requested == requested
+
+    def test_wild_last_holds_wilds(self):
+        """Test WildLastPolicy plays any non-wild before a wild, preferring action cards."""
+
+        wild = card(WILD, DRAW_FOUR)
+        policy = WildLastPolicy()
+        assert policy.choose_card(None, [], [wild, card(0, 3), card(0, 10)]) == card(0, 10)
+        assert policy.choose_card(None, [], [wild]) == wild
+
+    def test_hoarding_keeps_majority_colour(self):
+        """Test ColourHoardingPolicy dumps its rarest colour and names its commonest on wilds."""
+
+        hand = [card(1, 2), card(1, 5), card(1, 7), card(2, 4)]
+        policy = ColourHoardingPolicy()
+        assert policy.choose_card(None, hand, [card(1, 2), card(2, 4)]) == card(2, 4)
+        assert policy.choose_colour(None, hand) == "YELLOW"
+        assert not is_wild(policy.choose_card(None, hand, [card(WILD, DRAW_FOUR), card(1, 5)]))
+
+    def test_tournament_stats(self):
+        """Test tournament rates add up and stats are reported."""
+
+        stats = tournament(["random", "hoard", "wild-last"], games=60, seed=0)
+        assert sum(stats["win_rate"].values()) + stats["stalled"] == pytest.approx(1.0)
+        assert stats["games_per_s"] > 0
+        assert stats["turns"]["p50"] <= stats["turns"]["p90"] <= stats["turns"]["max"]
+        assert stats["coins"]["p10"] <= stats["coins"]["p50"] <= stats["coins"]["p90"]
+
+    def test_empty_deck_and_discard_stall(self):
+        """Test drawing with nothing left to reshuffle raises DeckExhausted, which play_game counts as a stall."""
+
+        game = HeadlessUno([RandomPolicy(), RandomPolicy()], seed=0)
+        game.deal(7)
+        game.deck.clear()
+        del game.discard[:-1]
+        reshuffles = game.reshuffles
+        with pytest.raises(DeckExhausted):
+            game.draw_card()
+        assert game.reshuffles == reshuffles
+
+    def test_other_index_errors_propagate(self, monkeypatch):
+        """Test an IndexError from a bug is raised, not recorded as a stalled game."""
+
+        def broken(self, player, valid_moves):
+            return valid_moves[len(valid_moves)]
+
+        monkeypatch.setattr(HeadlessUno, "choose_card", broken)
+        with pytest.raises(IndexError):
+            play_game([RandomPolicy(), RandomPolicy()], seed=0)
+
+    @pytest.mark.parametrize("cards_left", [0, 4, 9, 40])
+    def test_losing_seat_payout_counts_its_cards(self, cards_left: int):
+        """Test seat 0's payout is priced from the cards really left in its hand."""
+
+        game = HeadlessUno([RandomPolicy(), RandomPolicy(), RandomPolicy()], seed=0)
+        game.players[0]['hand'] = [card(0, 1)] * cards_left
+        game.players[1]['hand'] = []
+        game.players[2]['hand'] = [card(1, 2)] * 3
+
+        game.winner = "Pet"
+        summary = game.summary()
+        assert (summary["player_cards_left"], summary["pet_cards_left"]) == (cards_left, 0)
+        assert game.reward(game.evaluate(summary))["currency"] == max(5, 15 - cards_left)
+
+        game.winner = "Bot3"
+        assert game.reward(game.evaluate(game.summary()))["currency"] == max(5, 35 - cards_left)
+
+    def test_play_game_reward_uses_seat_zero_hand(self):
+        """Test a finished headless game's reward matches seat 0's cards left."""
+
+        result = play_game([RandomPolicy(), RandomPolicy()], seed=7)
+        assert result["player_cards_left"] == result["cards_left"][0]
+        assert result["pet_cards_left"] == result["cards_left"][1]
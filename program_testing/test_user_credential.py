@@ -0,0 +1,93 @@
+import bcrypt
+import pytest
+import features.credential as credential_module
+from features.credential import Credential
+from features.user import User
+
+pytestmark = pytest.mark.usefixtures("clean_user_registry")
+
+
+def _hash(password: str, rounds: int = 4, prefix: str = '$2b$') -> str:
+    hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+    return prefix + hashed[4:]
+
+
+class TestCredential:
+    """Tests for the bcrypt Credential type."""
+
+    @pytest.mark.parametrize("prefix", ['$2a$', '$2b$', '$2x$', '$2y$'])
+    def test_recognises_all_variants(self, prefix: str):
+        """Test that every bcrypt variant is parsed and verifies without re-hashing."""
+
+        hashed = _hash('29.September.2006', prefix=prefix)
+        credential = Credential.from_stored(hashed)
+
+        assert Credential.is_bcrypt_hash(hashed)
+        assert credential.hash == hashed
+        assert credential.variant == prefix[2]
+        assert credential.cost == 4
+        assert credential.verify('29.September.2006')
+        assert not credential.verify('WrongTest')
+
+    @pytest.mark.parametrize("stored", ['', 'not-a-hash', '$2b$12$short'])
+    def test_damaged_hash_is_unusable(self, stored: str):
+        """Test that malformed stored values never verify and are not treated as plaintext."""
+
+        credential = Credential.from_stored(stored)
+
+        assert not credential.usable
+        assert credential.cost is None
+        assert not credential.verify(stored)
+
+    def test_needs_rehash(self, monkeypatch):
+        """Test that needs_rehash follows the configured cost and prefers $2b$."""
+
+        monkeypatch.setattr(credential_module, "BCRYPT_ROUNDS", 4)
+
+        assert not Credential.from_stored(_hash('x', 4)).needs_rehash()
+        assert Credential.from_stored(_hash('x', 5)).needs_rehash()
+        assert Credential.from_stored(_hash('x', 4, '$2y$')).needs_rehash()
+
+
+class TestUserCredential:
+    """Tests for how User restores and upgrades credentials."""
+
+    def test_restore_never_hashes(self, monkeypatch):
+        """Test that restoring saved users (even damaged ones) performs no bcrypt hashing."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("bcrypt.hashpw must not run during restore")
+
+        stored = _hash('29.September.2006', prefix='$2y$')
+        monkeypatch.setattr(credential_module.bcrypt, "hashpw", fail)
+
+        user = User('jessica29', stored)
+        damaged = User('mrBean29', '', hashed=True)
+        damaged.restore_from_memento({"username": "mrBean29", "password": ""})
+
+        assert user.password == stored
+        assert damaged.password == ''
+        assert not damaged.credential.usable
+
+    def test_login_rehashes_to_configured_cost(self, monkeypatch):
+        """Test that a successful login upgrades an outdated hash and keeps it valid."""
+
+        monkeypatch.setattr(credential_module, "BCRYPT_ROUNDS", 5)
+        User.users['jessica29'] = User('jessica29', _hash('29.September.2006', 4, '$2a$'))
+
+        assert User.login('jessica29', '29.September.2006') == 1
+
+        credential = User.users['jessica29'].credential
+        assert credential.variant == 'b'
+        assert credential.cost == 5
+        assert credential.verify('29.September.2006')
+
+    def test_failed_login_keeps_hash(self, monkeypatch):
+        """Test that a wrong password does not touch the stored hash."""
+
+        monkeypatch.setattr(credential_module, "BCRYPT_ROUNDS", 5)
+        stored = _hash('29.September.2006', 4)
+        User.users['jessica29'] = User('jessica29', stored)
+
+        assert User.login('jessica29', 'WrongTest') is None
+        assert User.users['jessica29'].password == stored
@@ -0,0 +1,82 @@
+import pytest
+from features.user import User, UserRegistry
+
+pytestmark = pytest.mark.usefixtures("clean_user_registry")
+
+
+class TestUserRegistry:
+    """Tests for the lazy, on-demand user registry."""
+
+    def _registry(self, usernames, built):
+        """Build a registry whose loader records every username it hydrates."""
+        registry = UserRegistry()
+
+        def loader(username):
+            built.append(username)
+            return User(username, '$2b$04$' + 'a' * 53)
+
+        registry.attach_loader(usernames, loader)
+        return registry
+
+    def test_stubs_do_not_hydrate(self):
+        """Test that membership, len() and key iteration never build users."""
+
+        built = []
+        registry = self._registry(['Jess2Jes', 'SelenaGoals22'], built)
+
+        assert 'jess2jes' in registry
+        assert 'nobody' not in registry
+        assert len(registry) == 2
+        assert sorted(registry) == ['jess2jes', 'selenagoals22']
+        assert built == []
+
+    def test_lookup_hydrates_once(self):
+        """Test that the first lookup builds the user and later lookups reuse it."""
+
+        built = []
+        registry = self._registry(['Jess2Jes'], built)
+
+        first = registry['jess2jes']
+        second = registry['jess2jes']
+
+        assert first is second
+        assert first.username == 'Jess2Jes'
+        assert built == ['Jess2Jes']
+        assert registry.loaded() == [first]
+
+    def test_registered_user_shadows_stub(self):
+        """Test that a live user assigned under a stub's key replaces the stub."""
+
+        built = []
+        registry = self._registry(['Jess2Jes'], built)
+        live = User('Jess2Jes', '$2b$04$' + 'a' * 53)
+
+        registry['jess2jes'] = live
+
+        assert registry['jess2jes'] is live
+        assert len(registry) == 1
+        assert built == []
+
+    def test_find_random_only_builds_until_match(self):
+        """Test that opponent selection stops hydrating at the first matching user."""
+
+        built = []
+        registry = self._registry([f'player{i}' for i in range(50)], built)
+
+        found = registry.find_random(lambda user: user.username == 'player7')
+
+        assert found.username == 'player7'
+        assert built[-1] == 'player7'
+        assert registry.find_random(lambda user: False) is None
+
+    def test_clear(self):
+        """Test that clear() drops loaded users and stubs."""
+
+        built = []
+        registry = self._registry(['Jess2Jes'], built)
+        registry['mrbean29'] = User('mrBean29', '$2b$04$' + 'a' * 53)
+
+        registry.clear()
+
+        assert len(registry) == 0
+        assert built == []
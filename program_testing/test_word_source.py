@@ -0,0 +1,123 @@
+import asyncio
+import os
+import random
+import time
+from pathlib import Path
+from features.minigame.wordSource import WordSource, COMMON, RARE, OTHER, MAX_BUCKET_LENGTH, word_class
+
+
+def _write_words(path: Path, text: str) -> Path:
+    path.write_text(text)
+    return path
+
+
+class TestWordSource:
+    """Tests for the memory-mapped MemoryMatch word list."""
+
+    def test_matches_split_list(self, tmp_path: Path):
+        """Test indexed access returns exactly what str.split() would, whitespace included."""
+
+        words = _write_words(tmp_path / "words.txt", "apple\nbanana\r\n  cherry\tdate\n\nelderberry")
+        source = WordSource(words)
+
+        assert len(source) == 5
+        assert sorted(source) == sorted(words.read_text().split())
+        assert source[-1] == "elderberry"
+        assert random.choice(source) in words.read_text().split()
+
+    def test_sidecar_reused_and_invalidated(self, tmp_path: Path):
+        """Test the sidecar is written once, reused, and rebuilt when the word list changes."""
+
+        words = _write_words(tmp_path / "words.txt", "one\ntwo\n")
+        assert len(WordSource(words)) == 2
+        index = tmp_path / "words.txt.idx"
+        assert index.exists()
+
+        built = index.stat().st_mtime_ns
+        assert sorted(WordSource(words)) == ["one", "two"]
+        assert index.stat().st_mtime_ns == built
+
+        _write_words(words, "one\ntwo\nthree\n")
+        os.utime(words, ns=(built + 10**9, built + 10**9))
+        assert sorted(WordSource(words)) == ["one", "three", "two"]
+
+    def test_corrupt_sidecar_rebuilt(self, tmp_path: Path):
+        """Test a truncated sidecar is ignored and replaced."""
+
+        words = _write_words(tmp_path / "words.txt", "alpha beta gamma\n")
+        WordSource(words).__len__()
+        index = tmp_path / "words.txt.idx"
+        index.write_bytes(index.read_bytes()[:-3])
+
+        assert sorted(WordSource(words)) == ["alpha", "beta", "gamma"]
+
+    def test_read_only_directory_falls_back_to_memory(self, tmp_path: Path, monkeypatch):
+        """Test the index stays in memory when the sidecar cannot be written."""
+
+        words = _write_words(tmp_path / "words.txt", "solo\nduet\n")
+        monkeypatch.setattr(WordSource, "_write_sidecar", lambda self, stat, table, offsets: False)
+
+        source = WordSource(words)
+        assert sorted(source) == ["duet", "solo"]
+        assert not (tmp_path / "words.txt.idx").exists()
+
+    def test_word_class(self):
+        """Test the character classes used for bucketing."""
+
+        assert word_class(b"cat") == COMMON
+        assert word_class(b"quiz") == RARE
+        assert word_class(b"R2D2") == OTHER
+        assert word_class("caf\u00e9".encode()) == OTHER
+
+    def test_bands_match_filtered_list(self, tmp_path: Path):
+        """Test every band equals a brute-force filter over the word list."""
+
+        text = "a at cat jazz quiz zebra R2D2 don't " + "x" * 30 + " kayak mississippi " + "long" * 7
+        source = WordSource(_write_words(tmp_path / "words.txt", text))
+        words = text.split()
+
+        def expected(low, high, classes):
+            return sorted(w for w in words
+                          if low <= min(len(w), MAX_BUCKET_LENGTH) <= high and word_class(w.encode()) in classes)
+
+        for low, high, classes in [(1, 3, (COMMON,)), (3, 5, (COMMON, RARE)), (1, 99, (OTHER,)),
+                                   (5, 99, (COMMON, RARE, OTHER)), (6, 4, (COMMON,)), (24, 24, (RARE,))]:
+            band = source.band(low, high, classes)
+            assert sorted(band) == expected(low, high, classes), (low, high, classes)
+            if len(band):
+                assert random.choice(band) in band
+
+        assert source.bucket_size(RARE, 4) == 2
+        assert source.band(3, 5) is source.band(3, 5)
+
+    def test_memory_match_draws_from_band(self):
+        """Test MemoryMatch medium rounds only use short, common words."""
+
+        from features.minigame.memoryMatch import MemoryMatch
+        game = MemoryMatch()
+        game.setup(None, None)
+        game.difficulty = 2
+        for _ in range(20):
+            game.sequence = []
+            asyncio.run(game.build_question())
+            assert all(3 <= len(w) <= 6 and word_class(w.encode()) == COMMON for w in game.sequence)
+
+    def test_warm_start_beats_list_loader(self):
+        """Benchmark: a warm WordSource setup is far cheaper than splitting the bundled list."""
+
+        path = Path("datas/words.txt")
+        WordSource(path).__len__()
+
+        start = time.perf_counter()
+        with open(path) as word_file:
+            legacy = list(word_file.read().split())
+        random.choice(legacy)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        source = WordSource(path)
+        random.choice(source)
+        warm_seconds = time.perf_counter() - start
+
+        assert len(source) == len(legacy)
+        assert warm_seconds < legacy_seconds
@@ -4,7 +4,7 @@ from features.game import Game
 from features.save_manager import SaveManager
 from features.user import User
 from utils.colorize import green, yellow
-from constants.configs import GAME_LIST
+from constants.configs import GAME_LIST, OFFLINE_MAX_TICKS, OFFLINE_TICK_HOURS
 
 class GameFacade:
     """
@@ -17,7 +17,7 @@ class GameFacade:
         self.game = None
         self.current_user = User.current_user
         self.save_manager = SaveManager.get_instance()
-        # Load saved users into in-memory registry so players can log in later
+        # Register saved usernames; each account is only built when it is first looked up
         self._load_all_users_from_saves()
 
     def _connect_to_game(self):
@@ -58,8 +58,10 @@ class GameFacade:
             return False
         if new_password == old_password:
             return False
+        old_hash = user.password
         user.password = new_password
-        if not User._check_password(new_password, user.password):
+        # The setter keeps the old hash when the new password is rejected
+        if user.password == old_hash:
             return False
         game_state = {
             "user": user.create_memento(),
@@ -96,6 +98,25 @@ class GameFacade:
         self.game.interact(pet)
         pet.time_past()
 
+    def advance_world(self, hours: int = 1) -> int:
+        """Advance the signed-in player's pets by `hours` ticks in one vectorised step."""
+        # Only the current user's pets are saved with this session, so other
+        # hydrated users (login checks, matchmaking) are left untouched
+        pets = list(self.current_user.pets) if self.current_user else []
+        if not pets:
+            return 0
+        try:
+            from features.world import PetWorld
+            world = PetWorld(pets)
+        except ImportError:
+            # NumPy is optional: fall back to the closed-form per-pet catch-up
+            for pet in pets:
+                pet.catch_up(hours)
+            return len(pets)
+        world.time_past(hours)
+        world.write_back()
+        return len(pets)
+
     def get_pet_age(self, pet) -> float:
         return pet.get_age() if hasattr(pet, "get_age") else 0
 
@@ -187,17 +208,23 @@ class GameFacade:
     # === Private Methods ===
     def _load_all_users_from_saves(self):
         try:
-            all_saves = self.save_manager._load_all_saves()
+            usernames = self.save_manager.list_saves()
+        except Exception:
+            usernames = []
+        User.users.attach_loader(usernames, self._build_user_from_save)
+
+    def _build_user_from_save(self, username):
+        try:
+            save_data = self.save_manager._get_state(username)
         except Exception:
-            all_saves = {}
-        for username, save_data in all_saves.items():
-            key = username.casefold()
-            if key not in User.users:
-                user_data = save_data.get("user", {})
-                password_hash = user_data.get("password", "")
-                user = User(username, password_hash)
-                user.restore_from_memento(user_data)
-                User.users[key] = user
+            save_data = None
+        if not save_data:
+            return None
+        user_data = save_data.get("user", {})
+        password_hash = user_data.get("password", "")
+        user = User(username, password_hash, hashed=True)
+        user.restore_from_memento(user_data)
+        return user
 
     def _load_game(self, username) -> bool:
         game_state = self.save_manager.load_game(username)
@@ -205,12 +232,33 @@ class GameFacade:
             return False
         user_data = game_state.get("user", {})
         self.current_user.restore_from_memento(user_data)
+        self._catch_up_offline(game_state.get("last_saved"))
         game_data = game_state.get("game", {})
         self.game.day = game_data.get("day", 0)
         self.game.spend = game_data.get("spend", 0)
         self.game.clock = game_data.get("clock", datetime.datetime.now().hour)
         return True
 
+    def _catch_up_offline(self, last_saved) -> int:
+        """Age the current user's pets for the real time elapsed since their last save.
+
+        At most OFFLINE_MAX_TICKS ticks are applied, and a pet that was alive at
+        save time keeps at least 1 health: pets never die while their owner is away.
+        """
+        if not OFFLINE_TICK_HOURS or not last_saved:
+            return 0
+        try:
+            elapsed = datetime.datetime.now() - datetime.datetime.fromisoformat(last_saved)
+        except ValueError:
+            return 0
+        ticks = min(int(elapsed.total_seconds() // (OFFLINE_TICK_HOURS * 3600)), OFFLINE_MAX_TICKS)
+        for pet in self.current_user.pets:
+            alive = pet.health > 0
+            pet.catch_up(ticks)
+            if alive:
+                pet.health = max(pet.health, 1)
+        return max(0, ticks)
+
     def _save_game(self) -> bool:
         if not self.current_user:
             return False
@@ -1,7 +1,6 @@
 """
 This module contains utility functions for displaying loading indicators.
 """
-import asyncio
 from rich.progress import (
     Progress,
     TextColumn,
@@ -9,6 +8,7 @@ from rich.progress import (
     TaskProgressColumn,
     TimeRemainingColumn
 )
+from features.minigame.baseClass import Pacer
 
 async def loading_bar(total: int = 30, delay: float = 0.065):
     """Async helper that displays a short progress bar (used by UI flows).
@@ -21,6 +21,5 @@ async def loading_bar(total: int = 30, delay: float = 0.065):
     )
     task = progress.add_task("Loading.. .", total=total)
     with progress:
-        for _ in range(total):
-            progress.update(task, advance=1)
-            await asyncio.sleep(delay)
\ No newline at end of file
+        async for _ in Pacer.get_instance().animate(range(total), delay):
+            progress.update(task, advance=1)
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+This module provides small statistics helpers shared by the benchmarks and service metrics.
+"""
+import math
+from typing import Sequence
+
+def nearest_rank(ordered: Sequence[float], point: float) -> float:
+    """
+    Return the nearest-rank percentile of an already sorted sequence.
+
+    The p-th percentile is the smallest sample with at least p% of the samples at or below it.
+
+    Args:
+        ordered: samples sorted in ascending order.
+        point: the percentile to pick, 0..100.
+
+    Example usage:
+        nearest_rank([1, 2, 3, 4], 50)  # -> 2
+    """
+    if not ordered:
+        return 0.0
+    rank = math.ceil(point * len(ordered) / 100)
+    return ordered[min(len(ordered), max(1, rank)) - 1]